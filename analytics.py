@@ -0,0 +1,329 @@
+﻿import argparse
+import json
+import math
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import score_store
+import telemetry
+
+
+TELEMETRY_EXTENSION = '.bpt'
+SCORE_LOG_EXTENSION = '.log'
+
+if np is not None:
+    # telemetry.RECORD ile aynı düzen
+    EVENT_DTYPE = np.dtype([('game_time', '<f4'), ('kind', 'u1'), ('type_id', 'u1'), ('pad', 'V2'),
+                            ('count', '<u4'), ('x', '<f4'), ('y', '<f4'), ('size', '<f4'), ('value', '<f4')])
+    assert EVENT_DTYPE.itemsize == telemetry.RECORD.size
+
+
+def day_of(timestamp):
+    return time.strftime('%Y-%m-%d', time.localtime(timestamp))
+
+def histogram_quantile(histogram, q):
+    """{değer: adet} histogramının q (0-1) yüzdelik değeri"""
+    total = sum(histogram.values())
+    if not total:
+        return None
+    target = q * (total - 1)
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen > target:
+            return value
+    return max(histogram)
+
+class Report(ABC):
+    """Dosya başına kısmi sonuç üreten, sonra merge() ile birleştirilen analiz.
+
+    Her dosya ayrı bir süreçte yeni bir rapor nesnesine okunur; sonuçlar sadece sayaçlar
+    ve histogramlar olduğu için bellek kullanımı dosya boyutundan bağımsızdır.
+    """
+    name = ''
+    uses_telemetry = False
+    uses_scores = False
+
+    def __init__(self, options):
+        self.options = options
+
+    def start_file(self, path):
+        pass
+
+    def add_events(self, wall_time, events):
+        pass
+
+    def add_result(self, result):
+        pass
+
+    def finish_file(self):
+        pass
+
+    @abstractmethod
+    def merge(self, other):
+        """Başka bir dosyanın kısmi raporunu bu rapora ekle"""
+
+    @abstractmethod
+    def table(self):
+        """(sütun adları, satırlar)"""
+
+class SurvivalReport(Report):
+    """Güne göre oyun süresi dağılımı - skor günlüklerinden ya da telemetrideki oyun sonlarından.
+
+    Bir kabinin oyunu genelde iki kaynakta da bulunur; sayılar iki katına çıkmasın diye her kabin
+    (origin) ve gün için tek kaynak kullanılır: o gün skor günlüğünde oyun varsa skor günlüğü
+    (kesin zaman damgası), yoksa telemetri. Kabinler sonra toplanır. Kabin dosyanın klasörüdür;
+    skor günlüğü için skor deposu klasörünün üst klasörü - telemetri de oraya yazılmalıdır.
+    Kullanılan kaynaklar source sütununda yazar.
+    """
+    name = 'survival'
+    uses_telemetry = True
+    uses_scores = True
+
+    def __init__(self, options):
+        super().__init__(options)
+        # kabin -> kaynak -> gün -> {saniye: oyun sayısı}
+        self.origins = {}
+        self.sources = None
+
+    def start_file(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        if os.path.basename(path) == score_store.LOG_NAME:
+            directory = os.path.dirname(directory)
+        self.sources = self.origins.setdefault(directory, {'scores': {}, 'telemetry': {}})
+
+    def _add(self, source, timestamp, game_time):
+        self.sources[source].setdefault(day_of(timestamp), Counter())[int(game_time)] += 1
+
+    def add_events(self, wall_time, events):
+        for game_time in events['game_time'][events['kind'] == telemetry.GAME_OVER]:
+            self._add('telemetry', wall_time, game_time)
+
+    def add_result(self, result):
+        self._add('scores', result.timestamp, result.game_time)
+
+    def merge(self, other):
+        for origin, sources in other.origins.items():
+            merged = self.origins.setdefault(origin, {'scores': {}, 'telemetry': {}})
+            for source, days in sources.items():
+                for day, histogram in days.items():
+                    merged[source].setdefault(day, Counter()).update(histogram)
+
+    def table(self):
+        # gün -> (histogram, kullanılan kaynaklar); her kabinden o gün için tek kaynak
+        days = {}
+        for sources in self.origins.values():
+            scores, events = sources['scores'], sources['telemetry']
+            for day in set(scores) | set(events):
+                source = 'scores' if day in scores else 'telemetry'
+                histogram, used = days.setdefault(day, (Counter(), set()))
+                histogram.update(sources[source][day])
+                used.add(source)
+        rows = []
+        for day in sorted(days):
+            histogram, used = days[day]
+            source = '+'.join(sorted(used))
+            games = sum(histogram.values())
+            mean = sum(seconds * count for seconds, count in histogram.items()) / games
+            rows.append((day, source, games, histogram_quantile(histogram, 0.5), histogram_quantile(histogram, 0.9),
+                         round(mean, 1)))
+        return ('day', 'source', 'games', 'median_s', 'p90_s', 'mean_s'), rows
+
+class DamageReport(Report):
+    """Oyun süresi dilimlerine göre dakika başına can kaybı (kaçan balon ve ıska ayrı)"""
+    name = 'damage'
+    uses_telemetry = True
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.bucket = options.bucket
+        self.boundary = Counter()
+        self.miss = Counter()
+        # Dilim başına oyunların o dilimde geçirdiği toplam süre (s)
+        self.exposure = Counter()
+        self.games = 0
+        self.in_game = False
+        self.game_end = 0.0
+
+    def _finish_game(self, duration):
+        self.games += 1
+        bucket = self.bucket
+        for index in range(int(math.ceil(duration / bucket))):
+            self.exposure[index] += min(bucket, duration - index * bucket)
+        self.in_game = False
+
+    def add_events(self, wall_time, events):
+        kinds = events['kind']
+        buckets = (events['game_time'] // self.bucket).astype(int)
+        for kind, totals in ((telemetry.BOUNDARY_HIT, self.boundary), (telemetry.MISS, self.miss)):
+            mask = kinds == kind
+            if mask.any():
+                sums = np.bincount(buckets[mask], weights=events['value'][mask])
+                for index in np.flatnonzero(sums):
+                    totals[int(index)] += float(sums[index])
+
+        # Oyun sınırları: her oyun GAME_START ile başlar, GAME_OVER ile (ya da yarıda) biter
+        game_times = events['game_time']
+        start = 0
+        for marker in np.flatnonzero((kinds == telemetry.GAME_START) | (kinds == telemetry.GAME_OVER)):
+            if marker > start:
+                self.game_end = max(self.game_end, float(game_times[start:marker].max()))
+            if kinds[marker] == telemetry.GAME_OVER:
+                self._finish_game(float(game_times[marker]))
+            else:
+                if self.in_game:
+                    self._finish_game(self.game_end)
+                self.in_game = True
+                self.game_end = 0.0
+            start = marker + 1
+        if start < len(events):
+            self.game_end = max(self.game_end, float(game_times[start:].max()))
+
+    def finish_file(self):
+        if self.in_game:
+            self._finish_game(self.game_end)
+
+    def merge(self, other):
+        self.boundary.update(other.boundary)
+        self.miss.update(other.miss)
+        self.exposure.update(other.exposure)
+        self.games += other.games
+
+    def table(self):
+        rows = []
+        for index in sorted(set(self.exposure) | set(self.boundary) | set(self.miss)):
+            minutes = self.exposure[index] / 60.0
+            boundary = self.boundary[index] / minutes if minutes else 0.0
+            miss = self.miss[index] / minutes if minutes else 0.0
+            rows.append((f'{index * self.bucket}-{(index + 1) * self.bucket}s', round(minutes, 1),
+                         round(boundary, 2), round(miss, 2), round(boundary + miss, 2)))
+        return ('game_time', 'player_min', 'boundary_dpm', 'miss_dpm', 'total_dpm'), rows
+
+class MultiPopReport(Report):
+    """Multi Pop açıkken dokunuş başına patlayan balon sayısının dağılımı"""
+    name = 'multipop'
+    uses_telemetry = True
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.threshold = options.min_bubbles
+        self.histogram = Counter()
+
+    def add_events(self, wall_time, events):
+        touches = events['count'][(events['kind'] == telemetry.TOUCH) & (events['type_id'] == 1)]
+        if len(touches):
+            counts = np.bincount(touches)
+            for bubbles in np.flatnonzero(counts):
+                self.histogram[int(bubbles)] += int(counts[bubbles])
+
+    def merge(self, other):
+        self.histogram.update(other.histogram)
+
+    def table(self):
+        total = sum(self.histogram.values())
+        rows = [(bubbles, count, round(count * 100.0 / total, 2)) for bubbles, count in sorted(self.histogram.items())]
+        over = sum(count for bubbles, count in self.histogram.items() if bubbles > self.threshold)
+        rows.append((f'>{self.threshold}', over, round(over * 100.0 / total, 2) if total else 0.0))
+        return ('bubbles', 'touches', 'percent'), rows
+
+REPORTS = {report.name: report for report in (SurvivalReport, DamageReport, MultiPopReport)}
+
+def file_kind(path):
+    """'telemetry', 'scores' ya da None - dosya başlığındaki sihirli sayıya göre"""
+    try:
+        with open(path, 'rb') as f:
+            magic = f.read(4)
+    except OSError:
+        return None
+    if magic == telemetry.MAGIC:
+        return 'telemetry'
+    if magic == score_store.MAGIC:
+        return 'scores'
+    return None
+
+def find_files(paths):
+    """Verilen dosyalar ve klasörlerdeki (alt klasörler dahil) telemetri ve skor günlükleri"""
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.endswith((TELEMETRY_EXTENSION, SCORE_LOG_EXTENSION)):
+                        yield os.path.join(directory, name)
+        else:
+            yield path
+
+def analyze_file(path, report_name, options):
+    """Tek dosyayı okuyup kısmi raporu döndür (işçi süreçte çalışır)"""
+    report = REPORTS[report_name](options)
+    kind = file_kind(path)
+    report.start_file(path)
+    if kind == 'telemetry' and report.uses_telemetry and np is not None:
+        for wall_time, _, data in telemetry.iter_batches(path):
+            report.add_events(wall_time, np.frombuffer(data, dtype=EVENT_DTYPE))
+    elif kind == 'scores' and report.uses_scores:
+        for result in score_store.iter_results(path):
+            report.add_result(result)
+    report.finish_file()
+    return report
+
+def run(report_name, paths, options, workers=None):
+    """Dosyaları işçi süreçlere dağıt ve kısmi raporları birleştir"""
+    report = REPORTS[report_name](options)
+    paths = list(paths)
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
+            report.merge(analyze_file(path, report_name, options))
+        return report
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in executor.map(analyze_file, paths, [report_name] * len(paths), [options] * len(paths)):
+            report.merge(partial)
+    return report
+
+def format_table(columns, rows):
+    cells = [tuple(str(value) for value in row) for row in rows]
+    widths = [max([len(column)] + [len(row[i]) for row in cells]) for i, column in enumerate(columns)]
+    lines = ['  '.join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines.append('  '.join('-' * width for width in widths))
+    lines.extend('  '.join(value.rjust(width) for value, width in zip(row, widths)) for row in cells)
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Telemetri ve skor günlüklerinden toplu tablolar üret")
+    parser.add_argument('report', choices=sorted(REPORTS),
+                        help="survival: güne göre oyun süresi, damage: dakika başına can kaybı, "
+                             "multipop: Multi Pop dokunuşu başına balon")
+    parser.add_argument('paths', nargs='+', help=".bpt / scores.log dosyaları ya da bunları içeren klasörler")
+    parser.add_argument('--workers', type=int, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--bucket', type=float, default=30, help="damage: oyun süresi dilimi (s)")
+    parser.add_argument('--min-bubbles', type=int, default=5, help="multipop: bundan fazla balon patlatan dokunuşlar")
+    parser.add_argument('--json', action='store_true', help="tablo yerine JSON yazdır")
+    args = parser.parse_args(argv)
+
+    report_class = REPORTS[args.report]
+    if report_class.uses_telemetry and not report_class.uses_scores and np is None:
+        print("❌ Telemetri analizi için numpy gerekli")
+        return 1
+
+    options = argparse.Namespace(bucket=args.bucket, min_bubbles=args.min_bubbles)
+    paths = [path for path in find_files(args.paths) if file_kind(path) is not None]
+    started = time.perf_counter()
+    report = run(args.report, paths, options, args.workers)
+    columns, rows = report.table()
+    if args.json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2))
+    else:
+        print(format_table(columns, rows))
+        print(f"\n{len(paths)} dosya, {time.perf_counter() - started:.2f} s", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+﻿import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+
+
+def sound_source(path, audio_cache=None):
+    """Yüklenecek dosya (iş parçacığında çalışır); path yoksa None.
+
+    audio_cache (audio_cache.AudioCache) verilirse ses önbellekteki WAV haline çözülür.
+    """
+    if not os.path.exists(path):
+        print(f"❌ {path} dosyası bulunamadı")
+        return None
+    return audio_cache.path_for(path) if audio_cache is not None else path
+
+def load_sound_copies(path, source, copies=1):
+    """source'u copies kez yükle (ana iş parçacığında); yüklenemezse boş liste"""
+    if source is None:
+        return []
+    from kivy.core.audio import SoundLoader
+    sounds = [sound for sound in (SoundLoader.load(source) for _ in range(copies)) if sound]
+    if sounds:
+        print(f"✅ {path} yüklendi - {len(sounds)} kopya")
+    else:
+        print(f"❌ {path} yüklenemedi")
+    return sounds
+
+class AssetManager:
+    """Uygulama boyunca paylaşılan varlık önbelleği.
+
+    Her varlık bir anahtar altında bir kez, arka plandaki bir iş parçacığında yüklenir;
+    load() aynı anahtar için hep aynı Future'ı döndürür. Oyun oturumları sonucu paylaşır,
+    yeniden yüklemez. Kivy'nin ses arka ucu iş parçacığı güvenli olmadığından sesler iki
+    adımda yüklenir: dosya iş parçacığında hazırlanır (audio_cache verilirse WAV'a çözülür),
+    Sound nesneleri schedule (varsayılan Clock.schedule_once) ile ana iş parçacığında kurulur.
+    Ses Future'larının done callback'leri bu yüzden ana iş parçacığında çalışır.
+    """
+    def __init__(self, workers=1, audio_cache=None, schedule=None):
+        self.audio_cache = audio_cache
+        if schedule is None:
+            from kivy.clock import Clock
+            schedule = Clock.schedule_once
+        self.schedule = schedule
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='assets')
+        self.futures = {}
+        # key -> (başlangıç, bitiş) perf_counter zamanları; başlangıç profili için
+        self.timings = {}
+        self.lock = threading.Lock()
+
+    def load(self, key, loader, *args, finish=None):
+        """key yüklenmediyse loader(*args) işini sıraya koy; key'in Future'ını döndür.
+
+        finish verilirse Future'ın sonucu ana iş parçacığında finish(loader sonucu) olur.
+        """
+        with self.lock:
+            future = self.futures.get(key)
+            if future is None:
+                prepared = self.executor.submit(self._timed, key, loader, *args)
+                if finish is None:
+                    future = prepared
+                else:
+                    future = Future()
+                    prepared.add_done_callback(
+                        lambda prepared: self.schedule(lambda dt: self._finish(key, future, prepared, finish)))
+                self.futures[key] = future
+            return future
+
+    def _timed(self, key, loader, *args):
+        start = perf_counter()
+        try:
+            return loader(*args)
+        finally:
+            self.timings[key] = (start, perf_counter())
+
+    def _finish(self, key, future, prepared, finish):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(finish(prepared.result()))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            start, _ = self.timings.get(key, (perf_counter(), None))
+            self.timings[key] = (start, perf_counter())
+
+    def sound(self, path, copies=1):
+        """Aynı sesin copies adet ayrı kopyası (çok sesli çalma için) - liste Future'ı"""
+        return self.load(('sound', path, copies), sound_source, path, self.audio_cache,
+                         finish=lambda source: load_sound_copies(path, source, copies))
+
+    def get(self, key, default=None):
+        """Yüklenmiş varlık; henüz hazır değilse ya da hata verdiyse default"""
+        future = self.futures.get(key)
+        if future is None or not future.done() or future.exception() is not None:
+            return default
+        return future.result()
+
+    def progress(self):
+        """(biten, toplam) istek sayısı"""
+        futures = list(self.futures.values())
+        return sum(1 for future in futures if future.done()), len(futures)
+
+    def ready(self):
+        done, total = self.progress()
+        return done == total
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        # Ana iş parçacığı adımını bekleyenler de iptal edilir
+        for future in list(self.futures.values()):
+            future.cancel()
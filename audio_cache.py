@@ -0,0 +1,138 @@
+﻿import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import wave
+
+try:
+    import miniaudio
+except ImportError:
+    miniaudio = None
+
+
+def file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def decode_with_miniaudio(source, target):
+    decoded = miniaudio.decode_file(source, output_format=miniaudio.SampleFormat.SIGNED16)
+    with wave.open(target, 'wb') as f:
+        f.setnchannels(decoded.nchannels)
+        f.setsampwidth(2)
+        f.setframerate(decoded.sample_rate)
+        f.writeframes(decoded.samples.tobytes())
+
+def decode_with_ffmpeg(source, target):
+    subprocess.run([shutil.which('ffmpeg'), '-v', 'error', '-y', '-i', source, '-f', 'wav',
+                    '-acodec', 'pcm_s16le', target], check=True, capture_output=True)
+
+def available_decoders():
+    """Kurulu olan MP3 çözücüleri - miniaudio (pip) ya da PATH'teki ffmpeg"""
+    decoders = []
+    if miniaudio is not None:
+        decoders.append(decode_with_miniaudio)
+    if shutil.which('ffmpeg'):
+        decoders.append(decode_with_ffmpeg)
+    return decoders
+
+class AudioCache:
+    """Sıkıştırılmış sesleri bir kez PCM WAV'a çevirip diskte saklar.
+
+    WAV dosyasının adı kaynağın SHA-1 özetini içerir, böylece kaynak değişince eski dosya
+    kullanılmaz. Özet index.json'da kaynağın mtime ve boyutuyla birlikte tutulur; bunlar
+    değişmedikçe kaynak yeniden okunmaz. Çözücü yoksa ya da çevirme başarısız olursa
+    path_for kaynağın kendisini döndürür.
+    """
+    INDEX_NAME = 'index.json'
+
+    def __init__(self, directory, decoders=None):
+        self.directory = directory
+        self.decoders = available_decoders() if decoders is None else list(decoders)
+        self.lock = threading.Lock()
+        self.index = self._read_index()
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+    def _read_index(self):
+        try:
+            with open(os.path.join(self.directory, self.INDEX_NAME), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        path = os.path.join(self.directory, self.INDEX_NAME)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def path_for(self, source):
+        """source için yüklenecek dosya: önbellekteki WAV ya da (olmazsa) source"""
+        if not self.decoders or not os.path.exists(source) or source.lower().endswith('.wav'):
+            return source
+
+        with self.lock:
+            key = os.path.abspath(source)
+            stat = os.stat(source)
+            entry = self.index.get(key)
+            if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                digest = entry['sha1']
+            else:
+                digest = file_sha1(source)
+
+            name = f"{os.path.splitext(os.path.basename(source))[0]}-{digest[:16]}.wav"
+            target = os.path.join(self.directory, name)
+            if os.path.exists(target):
+                self.hits += 1
+            else:
+                self.misses += 1
+                if not self._transcode(source, target):
+                    self.failures += 1
+                    return source
+
+            # Kaynak değiştiyse eski WAV'ı sil
+            if entry is not None and entry['file'] != name:
+                try:
+                    os.remove(os.path.join(self.directory, entry['file']))
+                except OSError:
+                    pass
+            new_entry = {'file': name, 'sha1': digest, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            if entry != new_entry:
+                self.index[key] = new_entry
+                try:
+                    self._write_index()
+                except OSError as e:
+                    # WAV hazır; özet bir sonraki açılışta yeniden hesaplanır
+                    print(f"❌ Ses önbelleği dizini yazılamadı: {e}")
+            return target
+
+    def _transcode(self, source, target):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            print(f"❌ Ses önbelleği klasörü açılamadı: {e}")
+            return False
+        partial = target + '.tmp'
+        for decoder in self.decoders:
+            try:
+                decoder(source, partial)
+                os.replace(partial, target)
+                print(f"✅ {source} WAV önbelleğine çevrildi")
+                return True
+            except Exception as e:
+                print(f"❌ {source} çevrilemedi ({decoder.__name__}): {e}")
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        return False
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'failures': self.failures,
+                'entries': len(self.index)}
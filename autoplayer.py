@@ -0,0 +1,179 @@
+﻿import heapq
+import math
+import random
+from collections import namedtuple
+
+
+# reaction_time: hedef seçimiyle dokunuş arası gecikme (s), aim_error: nişan sapması (px, standart sapma),
+# touch_interval: iki hedef seçimi arası en kısa süre (s), lead: hareketi ne kadar önceden tahmin ettiği (0-1),
+# power_ups: power-up toplar mı
+BotProfile = namedtuple('BotProfile', ('name', 'reaction_time', 'aim_error', 'touch_interval', 'lead', 'power_ups'))
+
+BOT_PROFILES = (
+    BotProfile('novice', 0.45, 18.0, 0.5, 0.0, False),
+    BotProfile('casual', 0.3, 10.0, 0.3, 0.5, True),
+    BotProfile('expert', 0.18, 5.0, 0.15, 0.9, True),
+    # Gecikmesiz ve hatasız - geç oyundaki hız ve doğma aralığına ulaşmak için
+    BotProfile('machine', 0.0, 0.0, 0.0, 1.0, True),
+)
+BOT_PROFILE_NAMES = tuple(profile.name for profile in BOT_PROFILES)
+
+# GameWidget.on_touch_down'a verilen dokunuş - handle_touch_down sadece x ve y kullanır
+BotTouch = namedtuple('BotTouch', 'x y')
+
+# Dokunuş verildikten sonra hedefin tekrar seçilebilmesi için beklenen süre (s) - dokunuş bir
+# sonraki sabit adımda işlenir, bu arada balon hâlâ listede görünür
+RETRY_DELAY = 0.25
+
+
+def parse_profile(text):
+    """'expert' ya da 'expert:reaction_time=0.1,aim_error=2' biçimindeki profili çözümle"""
+    name, _, overrides = text.partition(':')
+    if name not in BOT_PROFILE_NAMES:
+        raise ValueError(f"bilinmeyen bot profili: {name} (seçenekler: {', '.join(BOT_PROFILE_NAMES)})")
+    profile = BOT_PROFILES[BOT_PROFILE_NAMES.index(name)]
+    values = {}
+    for item in filter(None, overrides.split(',')):
+        field, _, value = item.partition('=')
+        if field not in BotProfile._fields or field == 'name':
+            raise ValueError(f"bilinmeyen bot profili alanı: {field}")
+        if field == 'power_ups':
+            values[field] = value.lower() in ('1', 'true', 'yes', 'on')
+        else:
+            values[field] = float(value)
+    return profile._replace(**values)
+
+class AutoPlayer:
+    """Canlı oyun durumunu okuyup dokunuş üreten bot oyuncu (Kivy'siz).
+
+    update(dt, sim) her karede çağrılır ve zamanı gelen dokunuşları (x, y) listesi olarak
+    döndürür. Bot hedefi seçtiği anda görür, dokunuş reaction_time sonra yapılır; hedefin o
+    andaki konumu lead oranında tahmin edilir ve nişana aim_error kadar sapma eklenir.
+    Öncelik kaçmak üzere olan (ve kaçtığında çok can götüren) balonlardadır; Multi Pop açıkken
+    kalabalık kümeler, can azken can balonları, profil izin veriyorsa açık olmayan power-up'lar
+    seçilir. Rastgelelik kendi seed'li üretecinden gelir.
+    """
+    def __init__(self, profile, seed=None):
+        self.profile = profile
+        self.rng = random.Random(seed)
+        self.clock = 0.0
+        # (zamanı, sıra, hedef uid, x, y)
+        self.pending = []
+        # hedef -> bu zamana kadar tekrar seçilmez (dokunuşu bekleyenler için sonsuz)
+        self.targeted = {}
+        self.ready = 0.0
+        # Son karenin süresi - dokunuş en erken bir sonraki karede verilir
+        self.frame_time = 0.0
+        self.order = 0
+        self.touches = 0
+
+    def update(self, dt, sim):
+        self.clock += dt
+        self.frame_time = dt
+        touches = []
+        while self.pending and self.pending[0][0] <= self.clock:
+            _, _, target, x, y = heapq.heappop(self.pending)
+            self.targeted[target] = self.clock + RETRY_DELAY
+            touches.append((x, y))
+        if len(self.targeted) > 256:
+            self.targeted = {target: until for target, until in self.targeted.items() if until > self.clock}
+        self.touches += len(touches)
+
+        if not sim.game_running or sim.game_paused:
+            self.ready = 0.0
+            return touches
+
+        interval = self.profile.touch_interval
+        self.ready += dt
+        while self.ready >= interval:
+            if not self.plan_touch(sim):
+                self.ready = min(self.ready, interval)
+                break
+            self.ready -= interval
+        return touches
+
+    def plan_touch(self, sim):
+        """Bir hedef seçip dokunuşunu zamanla; hedef yoksa False"""
+        profile = self.profile
+        delay = profile.reaction_time * self.rng.uniform(0.8, 1.2)
+        # Hedefin konumu dokunuşun işleneceği ana göre tahmin edilir
+        arrival = delay + self.frame_time
+        target = self.choose_power_up(sim, arrival) if profile.power_ups else None
+        if target is None:
+            target = self.choose_bubble(sim, arrival)
+        if target is None:
+            return False
+
+        uid, x, y = target
+        if profile.aim_error:
+            x += self.rng.gauss(0, profile.aim_error)
+            y += self.rng.gauss(0, profile.aim_error)
+        self.targeted[uid] = math.inf
+        self.order += 1
+        heapq.heappush(self.pending, (self.clock + delay, self.order, uid, x, y))
+        return True
+
+    def choose_power_up(self, sim, delay):
+        for power_up in sim.power_ups:
+            key = ('power_up', power_up.uid)
+            if self.targeted.get(key, 0) > self.clock or sim.active_powers[power_up.power_type]['active']:
+                continue
+            # Power-up'lar sabit hızla yükselir
+            rise = 0 if sim.time_frozen else 30 * delay * self.profile.lead
+            return key, power_up.x, power_up.y + rise
+        return None
+
+    def choose_bubble(self, sim, delay):
+        frozen = sim.time_frozen
+        bottom = sim.play_area_y
+        top = bottom + sim.play_area_height
+        multi = sim.active_powers['multi']['active']
+        wants_health = sim.health < 50
+        lead = self.profile.lead
+
+        best = None
+        best_urgency = math.inf
+        for bubble in sim.bubbles:
+            uid = bubble.uid
+            if self.targeted.get(uid, 0) > self.clock:
+                continue
+            y = bubble.y
+            vy = 0.0 if frozen else bubble.vy
+            radius = bubble.radius
+            if vy > 0:
+                escape_time = (top - y - radius) / vy
+            elif vy < 0:
+                escape_time = (y - radius - bottom) / -vy
+            else:
+                escape_time = math.inf
+            # Dokunuş yetişmeyecekse bu balon için uğraşma
+            if escape_time < delay:
+                continue
+
+            # Kaçınca daha çok can götüren büyük balonlar daha acil
+            urgency = min(escape_time, 30.0) / radius
+            if multi:
+                urgency /= len(sim.grid.query_radius(bubble.x, y, 80))
+            if wants_health and bubble.kind.special_effect == 'heal':
+                urgency *= 0.25
+            if urgency < best_urgency:
+                best = bubble
+                best_urgency = urgency
+        if best is None:
+            return None
+
+        x, y = best.x, best.y
+        if lead and not frozen:
+            # Dikey hareket ve salınım - çizim enterpolasyonu ve nefes alma göz ardı edilir
+            life_time = best.life_time + delay
+            future_x = best.original_x + math.sin(life_time * best.sway_frequency) * best.sway_amplitude
+            x += (future_x - x) * lead
+            y += best.vy * delay * lead
+        return best.uid, float(x), float(y)
+
+    def stats(self):
+        return {
+            'profile': self.profile.name,
+            'touches': self.touches,
+            'pending': len(self.pending),
+        }
@@ -0,0 +1,159 @@
+﻿import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from analytics import format_table
+from autoplayer import BOT_PROFILES, BOT_PROFILE_NAMES, AutoPlayer, parse_profile
+from benchmark import percentile
+from game_simulation import GameSimulation
+from type_registry import DIFFICULTY, SCORING
+
+
+SIMULATION_RATE = 120
+# Bot oyundaki gibi her çizim karesinde bir kez karar verir
+FRAME_RATE = 30
+# Kivy'nin varsayılan pencere boyutu
+PLAY_WIDTH = 800
+PLAY_HEIGHT = 600
+# Tamsayı olması gereken parametreler (balon sayısı); diğerleri kesirli denenebilir
+INTEGER_PARAMS = frozenset(('crowd_limit',))
+
+
+def parse_param(text):
+    """'speed_ramp=45,60,90' -> ('speed_ramp', [45.0, 60.0, 90.0]); INTEGER_PARAMS dışındakiler float olur"""
+    name, _, values = text.partition('=')
+    if name not in DIFFICULTY._fields and name not in SCORING._fields:
+        raise ValueError(f"bilinmeyen parametre: {name} (type_registry.Difficulty ya da Scoring alanı olmalı)")
+    parsed = [float(value) for value in values.split(',') if value]
+    if name in INTEGER_PARAMS:
+        if any(not value.is_integer() for value in parsed):
+            raise ValueError(f"{name} tamsayı olmalı")
+        parsed = [int(value) for value in parsed]
+    if not parsed:
+        raise ValueError(f"{name} için değer verilmedi")
+    return name, parsed
+
+def profile_label(profile):
+    """Profil adı ve yerleşik profilden farklı alanları, örn. 'expert:aim_error=2.0'"""
+    base = BOT_PROFILES[BOT_PROFILE_NAMES.index(profile.name)]
+    changed = [f'{field}={value}' for field, value, default in zip(profile._fields, profile, base) if value != default]
+    return profile.name + (':' + ','.join(changed) if changed else '')
+
+def make_rules(params):
+    """(ad, değer) çiftlerinden (Difficulty, Scoring)"""
+    difficulty = {name: value for name, value in params if name in DIFFICULTY._fields}
+    scoring = {name: value for name, value in params if name in SCORING._fields}
+    return DIFFICULTY._replace(**difficulty), SCORING._replace(**scoring)
+
+def play_game(sim, profile, seed, max_time):
+    """Bir oyunu bot ile sonuna (ya da max_time'a) kadar oyna; (süre, skor, max_time'a ulaştı mı)"""
+    sim.reset(seed)
+    bot = AutoPlayer(profile, seed)
+    step_dt = 1.0 / SIMULATION_RATE
+    steps_per_frame = SIMULATION_RATE // FRAME_RATE
+    frame_dt = steps_per_frame * step_dt
+    touches = ()
+    while sim.game_running and sim.game_time < max_time:
+        if sim.tick % steps_per_frame == 0:
+            touches = bot.update(frame_dt, sim)
+        sim.step(step_dt, touches)
+        touches = ()
+    return sim.game_time, sim.score, sim.game_running
+
+def run_batch(cell, seeds, max_time):
+    """Bir ızgara hücresinin (oyuncu, parametreler) oyunlarından bir dilim (işçi süreçte çalışır)"""
+    profile, params = cell
+    difficulty, scoring = make_rules(params)
+    sim = GameSimulation(PLAY_WIDTH, PLAY_HEIGHT, seed=0, scoring=scoring, difficulty=difficulty)
+    # Parçacıklar oynanışı etkilemez, sadece zaman alır
+    sim.effects = False
+    return [play_game(sim, profile, seed, max_time) for seed in seeds]
+
+def summarize(results):
+    times = sorted(game_time for game_time, _, _ in results)
+    scores = sorted(score for _, score, _ in results)
+    count = len(results)
+    return {
+        'games': count,
+        'capped': sum(1 for _, _, capped in results if capped),
+        'survival_p10': round(percentile(times, 0.1), 1),
+        'survival_median': round(percentile(times, 0.5), 1),
+        'survival_p90': round(percentile(times, 0.9), 1),
+        'survival_mean': round(sum(times) / count, 1) if count else 0.0,
+        'score_median': percentile(scores, 0.5),
+        'score_p90': percentile(scores, 0.9),
+        'score_mean': round(sum(scores) / count, 1) if count else 0.0,
+    }
+
+def run(profiles, grid, games, seed=1, max_time=600.0, workers=None, chunk=None):
+    """Her oyuncu ve parametre birleşimi için games oyun oyna; [(hücre, özet)] döndür.
+
+    Tüm hücreler aynı seed'leri kullanır (ortak rastgele sayılar) - hücreler arasındaki fark
+    şanstan değil parametreden gelir. Oyunlar chunk'lık dilimler halinde süreçlere dağıtılır.
+    """
+    names = [name for name, _ in grid]
+    cells = [(profile, tuple(zip(names, values)))
+             for profile in profiles for values in itertools.product(*(values for _, values in grid))]
+    seeds = list(range(seed, seed + games))
+    if chunk is None:
+        # Her işçiye hücre başına birkaç dilim düşsün - uzun ve kısa oyunlar dengelensin
+        chunk = max(1, games // (4 * (workers or os.cpu_count() or 1)))
+    jobs = [(index, seeds[start:start + chunk]) for index in range(len(cells)) for start in range(0, games, chunk)]
+
+    results = [[] for _ in cells]
+    if workers == 1:
+        for index, batch in jobs:
+            results[index].extend(run_batch(cells[index], batch, max_time))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = executor.map(run_batch, [cells[index] for index, _ in jobs], [batch for _, batch in jobs],
+                                   [max_time] * len(jobs))
+            for (index, _), batch_results in zip(jobs, batches):
+                results[index].extend(batch_results)
+    return [(cell, summarize(cell_results)) for cell, cell_results in zip(cells, results)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Zorluk parametreleri ve bot oyuncular ızgarasında toplu oyun simülasyonu")
+    parser.add_argument('--param', dest='params', action='append', default=[], metavar='NAME=V1,V2,...',
+                        help="denenecek değerler, örn. speed_ramp=45,60,90 ya da crowd_limit=12,15 "
+                             "(type_registry.Difficulty/Scoring alanları; tekrarlanabilir)")
+    parser.add_argument('--player', dest='players', action='append', metavar='PROFILE',
+                        help="bot profili, örn. casual ya da expert:reaction_time=0.1 (varsayılan: casual ve expert)")
+    parser.add_argument('--games', type=int, default=100, help="hücre başına oyun sayısı")
+    parser.add_argument('--seed', type=int, default=1, help="ilk oyunun seed'i; sonrakiler birer artar")
+    parser.add_argument('--max-time', type=float, default=600.0,
+                        help="oyun bu süreye (s) ulaşınca kesilir ve 'capped' sayılır")
+    parser.add_argument('--workers', type=int, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--json', action='store_true', help="tablo yerine JSON yazdır")
+    args = parser.parse_args(argv)
+
+    try:
+        grid = [parse_param(text) for text in args.params]
+        profiles = [parse_profile(text) for text in args.players or ('casual', 'expert')]
+    except ValueError as e:
+        parser.error(str(e))
+
+    started = time.perf_counter()
+    rows = run(profiles, grid, args.games, args.seed, args.max_time, args.workers)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps([dict(player=profile_label(profile), params=dict(params), **summary)
+                          for (profile, params), summary in rows], indent=2))
+    else:
+        names = [name for name, _ in grid]
+        summary_columns = list(rows[0][1]) if rows else []
+        table = [(profile_label(profile), *(value for _, value in params), *summary.values())
+                 for (profile, params), summary in rows]
+        print(format_table(['player'] + names + summary_columns, table))
+        total = len(rows) * args.games
+        print(f"\n{total} oyun, {elapsed:.1f} s", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
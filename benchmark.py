@@ -0,0 +1,302 @@
+﻿import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from autoplayer import BotTouch
+from game_simulation import GameSimulation
+from fixed_step import FixedStepRunner
+from bubble_store import ArrayBubbleStore, numpy_available
+from profiler import FrameProfiler
+
+
+FRAME_DT = 1 / 30.0
+
+
+def percentile(sorted_values, fraction):
+    """Sıralı listede en yakın sıra yüzdeliği"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def summarize(samples):
+    values = sorted(samples)
+    return {
+        'mean_ms': sum(values) / len(values) * 1000 if values else 0.0,
+        'p95_ms': percentile(values, 0.95) * 1000,
+        'p99_ms': percentile(values, 0.99) * 1000,
+        'max_ms': values[-1] * 1000 if values else 0.0,
+    }
+
+def fill_bubbles(sim, count):
+    while len(sim.bubbles) < count:
+        sim.spawn_bubble()
+
+def random_bubble_touches(sim, rng, count):
+    """Rastgele balonlara count dokunuş - zaman dondurma balonlarına değenler atlanır, ölçüm donmasın"""
+    bubbles = sim.bubbles
+    freezers = [(bubble.x, bubble.y, bubble.radius) for bubble in bubbles
+                if bubble.kind.special_effect == 'freeze_time']
+    touches = []
+    for _ in range(count):
+        if len(bubbles) == 0:
+            break
+        bubble = bubbles[rng.randrange(len(bubbles))]
+        x, y = float(bubble.x), float(bubble.y)
+        if not any((x - fx) ** 2 + (y - fy) ** 2 <= fr * fr for fx, fy, fr in freezers):
+            touches.append((x, y))
+    return touches
+
+
+# Her senaryo: (kurulum, kare başına hazırlık) - hazırlık ölçülmez ve o karenin dokunuşlarını döndürür
+def setup_idle(sim, rng):
+    pass
+
+def frame_idle(sim, rng, frame):
+    return ()
+
+def make_bubble_scenario(count):
+    def setup(sim, rng):
+        fill_bubbles(sim, count)
+
+    def frame(sim, rng, frame):
+        fill_bubbles(sim, count)
+        return ()
+    return setup, frame
+
+def setup_particle_storm(sim, rng):
+    fill_bubbles(sim, 500)
+    sim.activate_power_up('multi')
+
+def frame_particle_storm(sim, rng, frame):
+    sim.active_powers['multi']['timer'] = 60.0
+    fill_bubbles(sim, 500)
+    # Her 15 karede bir toplu Multi Pop - parçacık havuzu sürekli dolu kalır
+    if frame % 15 == 0:
+        return random_bubble_touches(sim, rng, 10)
+    return ()
+
+def setup_touches(sim, rng):
+    fill_bubbles(sim, 500)
+
+def frame_touches(sim, rng, frame):
+    fill_bubbles(sim, 500)
+    return random_bubble_touches(sim, rng, 20)
+
+def setup_long_run(sim, rng):
+    # 10 dakikalık oyun - hız çarpanı ve doğma sıklığı en yüksek seviyede
+    sim.game_time = 600.0
+
+def frame_long_run(sim, rng, frame):
+    if frame % 10 == 0:
+        return random_bubble_touches(sim, rng, 1)
+    return ()
+
+SCENARIOS = {
+    'idle': (setup_idle, frame_idle),
+    'bubbles_50': make_bubble_scenario(50),
+    'bubbles_500': make_bubble_scenario(500),
+    'bubbles_5000': make_bubble_scenario(5000),
+    'particle_storm': (setup_particle_storm, frame_particle_storm),
+    'touches_20': (setup_touches, frame_touches),
+    'long_run': (setup_long_run, frame_long_run),
+}
+
+class Phases:
+    """Kare içindeki aşamaların sürelerini toplar"""
+    def __init__(self):
+        self.samples = {}
+
+    def time(self, name, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        self.samples.setdefault(name, []).append(time.perf_counter() - start)
+        return result
+
+def gc_collections():
+    return sum(stats['collections'] for stats in gc.get_stats())
+
+def run_scenario(name, frames, warmup, seed, use_array_store, widget=None, trace_alloc=False):
+    """Senaryoyu çalıştır. widget (GameWidget) verilirse çizim ve etiket aşamaları da ölçülür"""
+    setup, prepare = SCENARIOS[name]
+    rng = random.Random(seed)
+
+    if widget is not None:
+        sim = widget.simulation
+        runner = widget.runner
+    else:
+        sim = GameSimulation(1280, 720, ArrayBubbleStore() if use_array_store else None, seed=seed)
+        runner = FixedStepRunner(sim)
+    setup(sim, rng)
+    # Simülasyon içi aşamalar (spawn, bubbles, effects...) simulation.<aşama> olarak raporlanır
+    sim_profiler = FrameProfiler(history=frames)
+    sim.profiler = sim_profiler
+
+    phases = Phases()
+    frame_times = []
+    block_deltas = []
+    peak_bytes = []
+    collections_before = 0
+    for frame in range(-warmup, frames):
+        # Ölçüm boyunca oyun bitmesin ve donmasın (Multi Pop dondurma balonunu da patlatabilir)
+        sim.health = 1e9
+        sim.time_frozen = False
+        sim.freeze_timer = 0
+        touches = prepare(sim, rng, frame)
+        if frame == 0:
+            phases = Phases()
+            sim_profiler.reset()
+            collections_before = gc_collections()
+        if trace_alloc:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        blocks_before = sys.getallocatedblocks()
+        sim_profiler.begin_frame()
+        start = time.perf_counter()
+
+        if touches:
+            if widget is not None:
+                # Oyundaki yol: on_touch_down dokunuşu bir sonraki sabit adıma sıraya koyar
+                phases.time('touch', lambda: [widget.on_touch_down(BotTouch(x, y)) for x, y in touches])
+            else:
+                phases.time('touch', lambda: [sim.handle_touch(x, y) for x, y in touches])
+        phases.time('simulation', runner.advance, FRAME_DT)
+        if widget is not None:
+            widget.draw_counter += 1
+            phases.time('draw_game', widget.draw_game)
+            phases.time('update_labels', widget.update_labels)
+
+        sim_profiler.end_frame()
+
+        if not sim.game_running:
+            raise RuntimeError(f"{name}: oyun ölçüm sırasında bitti")
+        if frame >= 0:
+            frame_times.append(time.perf_counter() - start)
+            block_deltas.append(sys.getallocatedblocks() - blocks_before)
+            if trace_alloc:
+                peak_bytes.append(tracemalloc.get_traced_memory()[1] - traced_before)
+
+    result = {
+        'store': 'array' if hasattr(sim.bubbles, 'type_id') else 'list',
+        'frames': frames,
+        'frame': summarize(frame_times),
+        'phases': {phase: summarize(samples) for phase, samples in phases.samples.items()},
+        'simulation_phases': {phase: summarize(samples) for phase, samples in sim_profiler.phase_times.items()},
+        'allocations': {
+            'blocks_per_frame_mean': sum(block_deltas) / len(block_deltas) if block_deltas else 0.0,
+            'blocks_per_frame_max': max(block_deltas) if block_deltas else 0,
+            'gc_collections': gc_collections() - collections_before,
+        },
+        'final_state': {
+            'bubbles': len(sim.bubbles),
+            'particles': len(sim.particles),
+            'score': sim.score,
+            'game_time': sim.game_time,
+        },
+        'pools': sim.pool_stats(),
+    }
+    if trace_alloc:
+        result['allocations']['peak_bytes_per_frame_mean'] = sum(peak_bytes) / len(peak_bytes) if peak_bytes else 0.0
+        result['allocations']['peak_bytes_per_frame_max'] = max(peak_bytes) if peak_bytes else 0
+    return result
+
+def run_headless(args):
+    return {name: run_scenario(name, args.frames, args.warmup, args.seed, args.store == 'array',
+                               trace_alloc=args.trace_alloc)
+            for name in args.scenarios}
+
+def run_kivy(args):
+    """Senaryoları ekran dışı bir Kivy penceresinde gerçek GameWidget ile çalıştır"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+    import bubble_game
+    from game_widget import GameWidget
+    from kivy.clock import Clock
+    from kivy.uix.floatlayout import FloatLayout
+
+    results = {}
+    # Skor deposu ve ses önbelleği geçici klasörde - benchmark oyunları skor tablosuna yazılmaz
+    data_root = tempfile.TemporaryDirectory(prefix='bubble-benchmark-')
+
+    class BenchmarkApp(bubble_game.BubblePopApp):
+        def data_dir(self, name):
+            return os.path.join(data_root.name, name)
+
+        def load_music(self):
+            self.game_music = None
+
+        def game_over(self, *args):
+            pass
+
+        def build(self):
+            self.sound_enabled = False
+            root = FloatLayout()
+            Clock.schedule_once(lambda dt: self.run_all(root), 0.2)
+            return root
+
+        def run_all(self, root):
+            try:
+                for name in args.scenarios:
+                    widget = GameWidget(self)
+                    root.add_widget(widget)
+                    widget.size = root.size
+                    Clock.unschedule(widget.update)
+                    results[name] = run_scenario(name, args.frames, args.warmup, args.seed,
+                                                 args.store == 'array', widget=widget,
+                                                 trace_alloc=args.trace_alloc)
+                    root.remove_widget(widget)
+            finally:
+                self.stop()
+
+    with data_root:
+        BenchmarkApp(seed=args.seed).run()
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bubble Pop kare döngüsü benchmark'ı (JSON çıktı)")
+    parser.add_argument('--scenario', dest='scenarios', action='append', choices=sorted(SCENARIOS),
+                        help="çalıştırılacak senaryo (tekrarlanabilir, varsayılan: hepsi)")
+    parser.add_argument('--frames', type=int, default=300, help="ölçülen kare sayısı")
+    parser.add_argument('--warmup', type=int, default=60, help="ölçülmeyen ısınma karesi sayısı")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--store', choices=('array', 'list'), default='array' if numpy_available() else 'list',
+                        help="balon deposu (--kivy ile GameWidget kendisi seçer)")
+    parser.add_argument('--kivy', action='store_true',
+                        help="GameWidget ile çalıştır, draw_game ve update_labels de ölçülür")
+    parser.add_argument('--trace-alloc', action='store_true', help="tracemalloc ile kare başına bayt ölç")
+    parser.add_argument('--output', metavar='PATH', help="JSON'u dosyaya yaz (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+    if not args.scenarios:
+        args.scenarios = list(SCENARIOS)
+    if args.store == 'array' and not numpy_available():
+        parser.error("--store array için numpy gerekli")
+
+    if args.trace_alloc:
+        tracemalloc.start()
+    results = run_kivy(args) if args.kivy else run_headless(args)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': numpy_available(),
+        'mode': 'kivy' if args.kivy else 'headless',
+        'frame_dt': FRAME_DT,
+        'seed': args.seed,
+        'scenarios': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+        print(f"✅ Benchmark sonuçları yazıldı: {args.output}")
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+﻿import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from game_simulation import SpecialBubble
+from type_registry import BUBBLE_KINDS, BUBBLE_KIND_IDS
+
+
+# Dizilerde tutulan skaler balon alanları
+FIELDS = (
+    'x', 'y', 'original_x', 'radius', 'original_radius', 'vy', 'speed', 'life_time',
+    'sway_amplitude', 'sway_frequency', 'breathe_amplitude', 'breathe_frequency',
+    'rotation_speed', 'shimmer_phase', 'alpha', 'prev_x', 'prev_y'
+)
+
+# Tamsayı alanlar - kimlik ve ızgara hücresi
+INT_FIELDS = ('uid', 'cell_x', 'cell_y')
+
+ALL_FIELDS = FIELDS + INT_FIELDS + ('color', 'type_id')
+
+# type_id dizisi doğrudan type_registry'deki balon türü id'sini tutar
+BUBBLE_TYPES = tuple(kind.key for kind in BUBBLE_KINDS)
+BUBBLE_TYPE_IDS = BUBBLE_KIND_IDS
+
+
+def numpy_available():
+    return np is not None
+
+class _DetachedRow:
+    """Depodan çıkarılmış bir balonun son değerleri - görünüm okumaya devam edebilsin diye"""
+    def __init__(self, store, index):
+        for name in FIELDS:
+            setattr(self, name, (float(getattr(store, name)[index]),))
+        self.color = (tuple(store.color[index]),)
+        self.type_id = (int(store.type_id[index]),)
+        self.uid = (int(store.uid[index]),)
+
+class BubbleView:
+    """Dizi deposundaki tek bir balona Bubble uyumlu ince görünüm"""
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    x = property(lambda self: self._store.x[self._index])
+    y = property(lambda self: self._store.y[self._index])
+    original_x = property(lambda self: self._store.original_x[self._index])
+    radius = property(lambda self: self._store.radius[self._index])
+    original_radius = property(lambda self: self._store.original_radius[self._index])
+    vy = property(lambda self: self._store.vy[self._index])
+    speed = property(lambda self: self._store.speed[self._index])
+    life_time = property(lambda self: self._store.life_time[self._index])
+    sway_amplitude = property(lambda self: self._store.sway_amplitude[self._index])
+    sway_frequency = property(lambda self: self._store.sway_frequency[self._index])
+    breathe_amplitude = property(lambda self: self._store.breathe_amplitude[self._index])
+    breathe_frequency = property(lambda self: self._store.breathe_frequency[self._index])
+    rotation_speed = property(lambda self: self._store.rotation_speed[self._index])
+    shimmer_phase = property(lambda self: self._store.shimmer_phase[self._index])
+    alpha = property(lambda self: self._store.alpha[self._index])
+    prev_x = property(lambda self: self._store.prev_x[self._index])
+    prev_y = property(lambda self: self._store.prev_y[self._index])
+    uid = property(lambda self: int(self._store.uid[self._index]))
+    vx = 0
+
+    @property
+    def color(self):
+        return tuple(self._store.color[self._index])
+
+    original_color = color
+
+    kind_id = property(lambda self: int(self._store.type_id[self._index]))
+
+    @property
+    def kind(self):
+        return BUBBLE_KINDS[self.kind_id]
+
+    @property
+    def bubble_type(self):
+        return BUBBLE_TYPES[self.kind_id]
+
+    get_special_properties = SpecialBubble.get_special_properties
+
+    def contains_point(self, x, y):
+        distance = math.sqrt((x - self.x)**2 + (y - self.y)**2)
+        return distance <= self.radius
+
+    def _detach(self):
+        self._store = _DetachedRow(self._store, self._index)
+        self._index = 0
+
+class ArrayBubbleStore:
+    """NumPy struct-of-arrays balon deposu.
+
+    Her alan ayrı bir bitişik dizide tutulur; hareket, sınır kontrolü ve silinenlerin
+    sıkıştırılması tek seferde tüm dizi üzerinde yapılır. Dışarıya BubbleView listesi gibi görünür.
+    """
+    def __init__(self, capacity=64):
+        if np is None:
+            raise RuntimeError("ArrayBubbleStore için numpy gerekli")
+        self.count = 0
+        self.capacity = capacity
+        for name in FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        self.color = np.zeros((capacity, 4))
+        self.type_id = np.zeros(capacity, dtype=np.int8)
+        for name in INT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int64))
+        self._views = []
+
+    def _grow(self):
+        self.capacity *= 2
+        for name in ALL_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros((self.capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self._views)
+
+    def __getitem__(self, index):
+        return self._views[index]
+
+    def __contains__(self, bubble):
+        return getattr(bubble, '_store', None) is self
+
+    def append(self, bubble):
+        """Bir Bubble/SpecialBubble nesnesinin durumunu dizilere kopyala"""
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        for name in FIELDS:
+            getattr(self, name)[i] = getattr(bubble, name)
+        self.color[i] = bubble.color
+        self.type_id[i] = bubble.kind_id
+        self.uid[i] = bubble.uid
+        # Henüz ızgaraya yerleşmedi - ilk cell_changes çağrısında taşınır
+        self.cell_x[i] = self.cell_y[i] = np.iinfo(np.int64).min
+        self.count += 1
+
+        view = BubbleView(self, i)
+        self._views.append(view)
+        return view
+
+    add = append
+
+    def remove(self, bubble):
+        if bubble not in self:
+            raise ValueError("bubble not in store")
+        i = bubble._index
+        n = self.count
+        bubble._detach()
+        for name in ALL_FIELDS:
+            array = getattr(self, name)
+            array[i:n - 1] = array[i + 1:n]
+        self.count -= 1
+        del self._views[i]
+        for index in range(i, self.count):
+            self._views[index]._index = index
+
+    def remove_many(self, bubbles):
+        """Birden çok balonu tek sıkıştırma ile çıkar"""
+        keep = np.ones(self.count, dtype=bool)
+        for bubble in bubbles:
+            if bubble in self:
+                keep[bubble._index] = False
+        if not keep.all():
+            self._compact(keep)
+
+    def cell_changes(self, cell_size):
+        """Izgara hücresi değişen balonlar için (görünüm, (cx, cy)) çiftleri"""
+        n = self.count
+        if n == 0:
+            return []
+        cell_x = np.floor(self.x[:n] / cell_size).astype(np.int64)
+        cell_y = np.floor(self.y[:n] / cell_size).astype(np.int64)
+        changed = np.flatnonzero((cell_x != self.cell_x[:n]) | (cell_y != self.cell_y[:n]))
+        if len(changed) == 0:
+            return []
+        self.cell_x[:n] = cell_x
+        self.cell_y[:n] = cell_y
+        views = self._views
+        return [(views[i], (int(cell_x[i]), int(cell_y[i]))) for i in changed]
+
+    def save_positions(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def clear(self):
+        for view in self._views:
+            view._detach()
+        self._views = []
+        self.count = 0
+
+    def _compact(self, keep):
+        n = self.count
+        for index in np.flatnonzero(~keep):
+            self._views[index]._detach()
+        for name in ALL_FIELDS:
+            array = getattr(self, name)
+            kept = array[:n][keep]
+            array[:len(kept)] = kept
+        self._views = [view for view, alive in zip(self._views, keep) if alive]
+        self.count = len(self._views)
+        for index, view in enumerate(self._views):
+            view._index = index
+
+    def update(self, dt, play_area_bounds):
+        """Bubble.update'in vektörel karşılığı; sınıra çarpan balonları çıkarıp döndürür"""
+        n = self.count
+        if n == 0:
+            return []
+
+        play_x, play_y, play_width, play_height = play_area_bounds
+        life_time = self.life_time[:n]
+        y = self.y[:n]
+        vy = self.vy[:n]
+        original_x = self.original_x[:n]
+
+        life_time += dt
+        y += vy * dt
+
+        young = life_time < 100
+        sway = original_x + np.sin(life_time * self.sway_frequency[:n]) * self.sway_amplitude[:n]
+        np.copyto(self.x[:n], sway, where=young)
+        breathe = self.original_radius[:n] * (1 + np.sin(life_time * self.breathe_frequency[:n]) * self.breathe_amplitude[:n])
+        np.copyto(self.radius[:n], breathe, where=young)
+
+        radius = self.radius[:n]
+        hit = ((vy > 0) & (y + radius >= play_y + play_height)) | ((vy < 0) & (y - radius <= play_y))
+
+        too_left = ~hit & (original_x - radius < play_x)
+        too_right = ~hit & ~too_left & (original_x + radius > play_x + play_width)
+        np.copyto(original_x, play_x + radius, where=too_left)
+        np.copyto(original_x, play_x + play_width - radius, where=too_right)
+
+        if not hit.any():
+            return []
+
+        escaped = [self._views[index] for index in np.flatnonzero(hit)]
+        self._compact(~hit)
+        return escaped
@@ -0,0 +1,45 @@
+﻿class EntityPool:
+    """Serbest listeli nesne havuzu.
+
+    acquire(*args) boşta bir nesne varsa onu reset(*args) ile yeniden kurar, yoksa
+    cls(*args) ile yenisini oluşturur. release edilen nesne bir daha kullanılmamalı.
+    Havuzda en fazla max_free nesne bekletilir; fazlası çöp toplayıcıya bırakılır.
+    """
+    def __init__(self, cls, max_free=256):
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.discarded = 0
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args):
+        if self.free:
+            self.hits += 1
+            entity = self.free.pop()
+            entity.reset(*args)
+            return entity
+        self.misses += 1
+        return self.cls(*args)
+
+    def release(self, entity):
+        if len(self.free) < self.max_free:
+            self.free.append(entity)
+            self.released += 1
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            'free': len(self.free),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'released': self.released,
+            'discarded': self.discarded,
+        }
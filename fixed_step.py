@@ -0,0 +1,81 @@
+﻿class FixedStepRunner:
+    """Simülasyonu çizim hızından bağımsız, sabit adımlarla ilerletir.
+
+    Her karede gelen dt bir birikece eklenir ve simülasyon step_dt'lik tam adımlarla
+    ilerletilir; artan kesir (blend) çizimde önceki ve güncel konum arasında enterpolasyon
+    için kullanılır. Bir takılmadan sonra en fazla max_steps adım yetişilir, fazlası atılır
+    (oyun o kadar yavaşlar ama adım boyu hiç büyümez). Dokunuşlar kuyruğa alınır ve bir
+    sonraki adımın başında işlenir. Oyun duraklatılmışken adım atılmaz.
+
+    recorder (replay.ReplayRecorder) verilirse işlenen dokunuşlar tick'leriyle kaydedilir;
+    playback (replay.ReplayPlayer) verilirse canlı dokunuşlar yerine kayıttakiler kullanılır.
+    """
+    def __init__(self, simulation, rate=120, max_steps=12, max_frame_time=0.25,
+                 recorder=None, playback=None):
+        self.simulation = simulation
+        self.recorder = recorder
+        self.playback = playback
+        self.rate = rate
+        self.step_dt = 1.0 / rate
+        self.max_steps = max_steps
+        self.max_frame_time = max_frame_time
+
+        self.accumulator = 0.0
+        self.blend = 1.0
+        self.pending_touches = []
+
+        # İstatistikler
+        self.ticks = 0
+        self.frames = 0
+        self.capped_frames = 0
+        self.dropped_time = 0.0
+
+    def queue_touch(self, x, y):
+        self.pending_touches.append((x, y))
+
+    def advance(self, frame_dt):
+        """Bir çizim karesinin süresi kadar ilerle; çalıştırılan adım sayısını döndür"""
+        self.frames += 1
+        simulation = self.simulation
+        if simulation.game_paused or not simulation.game_running:
+            # Duraklatmada tick ilerlemez; bekleyen dokunuşlar zaten reddedilirdi
+            self.pending_touches = []
+            self.accumulator = 0.0
+            self.blend = 1.0
+            return 0
+
+        if frame_dt > self.max_frame_time:
+            # Uzun takılma (pencere sürükleme vb.) - bu süre hiç simüle edilmez
+            self.dropped_time += frame_dt - self.max_frame_time
+            frame_dt = self.max_frame_time
+
+        self.accumulator += frame_dt
+        step_dt = self.step_dt
+        steps = int(self.accumulator / step_dt)
+        if steps > self.max_steps:
+            skipped = steps - self.max_steps
+            self.accumulator -= skipped * step_dt
+            self.dropped_time += skipped * step_dt
+            self.capped_frames += 1
+            steps = self.max_steps
+
+        for i in range(steps):
+            touches = ()
+            if self.playback is not None:
+                touches = self.playback.apply(simulation)
+            elif i == 0 and self.pending_touches:
+                touches = self.pending_touches
+                self.pending_touches = []
+                if self.recorder is not None:
+                    touches = self.recorder.record_touches(simulation.tick, touches)
+            if i == steps - 1:
+                # Enterpolasyon sadece son adımın başındaki konumlara ihtiyaç duyar
+                simulation.save_positions()
+            running = simulation.step(step_dt, touches)
+            self.accumulator -= step_dt
+            self.ticks += 1
+            if not running:
+                break
+
+        self.blend = min(1.0, max(0.0, self.accumulator / step_dt))
+        return steps
@@ -0,0 +1,709 @@
+﻿import random
+import math
+
+from particles import ParticlePool
+from spatial_grid import UniformGrid
+from profiler import NULL_PROFILER
+from telemetry import NULL_TELEMETRY, GAME_START, POP, TOUCH, MISS, BOUNDARY_HIT, POWER_UP, GAME_OVER
+from entity_pool import EntityPool
+from type_registry import (BUBBLE_KINDS, BUBBLE_KIND_IDS, POWER_UP_KINDS, PARTICLE_RECIPES, REGISTRY, SCORING,
+                           DIFFICULTY)
+
+
+def speed_multiplier(game_time, difficulty=DIFFICULTY):
+    # Daha yavaş hız artışı - yarıya indirildi
+    return 1 + (game_time / difficulty.speed_ramp) * (1 + game_time / difficulty.speed_curve)  # Çok daha yavaş
+
+class PowerUp:
+    __slots__ = ('uid', 'x', 'y', 'prev_x', 'prev_y', 'kind_id', 'radius', 'life_time', 'duration', 'collected')
+
+    def __init__(self, x, y, kind_id):
+        self.uid = 0
+        self.reset(x, y, kind_id)
+
+    def reset(self, x, y, kind_id):
+        """Havuzdan yeniden kullanılırken __init__ ile aynı durumu kur"""
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.kind_id = kind_id
+        self.radius = 25
+        self.life_time = 0
+        self.duration = 10.0
+        self.collected = False
+
+    @property
+    def kind(self):
+        return POWER_UP_KINDS[self.kind_id]
+
+    @property
+    def power_type(self):
+        return POWER_UP_KINDS[self.kind_id].key
+
+    def update(self, dt):
+        self.life_time += dt
+        self.y += 30 * dt
+
+        if self.life_time > self.duration:
+            return False
+        return True
+
+    def contains_point(self, x, y):
+        distance = math.sqrt((x - self.x)**2 + (y - self.y)**2)
+        return distance <= self.radius
+
+class ComboSystem:
+    def __init__(self):
+        self.combo_count = 0
+        self.combo_timer = 0
+        self.combo_timeout = 2.0
+        self.max_combo_time = 2.0
+
+    def add_pop(self):
+        self.combo_count += 1
+        self.combo_timer = self.combo_timeout
+        return self.combo_count
+
+    def update(self, dt):
+        if self.combo_timer > 0:
+            self.combo_timer -= dt
+            if self.combo_timer <= 0:
+                self.combo_count = 0
+
+    def get_combo_multiplier(self):
+        if self.combo_count < 3:
+            return 1
+        elif self.combo_count < 6:
+            return 1.5
+        elif self.combo_count < 10:
+            return 2.0
+        else:
+            return 3.0
+
+class Bubble:
+    __slots__ = (
+        'uid', 'kind_id', 'x', 'y', 'original_x', 'prev_x', 'prev_y', 'radius', 'original_radius',
+        'color', 'original_color', 'life_time', 'sway_amplitude', 'sway_frequency',
+        'breathe_amplitude', 'breathe_frequency', 'rotation_speed', 'shimmer_phase',
+        'speed', 'vx', 'vy', 'alpha', 'hit_boundary'
+    )
+
+    def __init__(self, x, y, radius, color, speed_factor, direction, rng=random):
+        self.uid = 0
+        self.reset(x, y, radius, color, speed_factor, direction, rng)
+
+    def reset(self, x, y, radius, color, speed_factor, direction, rng=random):
+        """Havuzdan yeniden kullanılırken __init__ ile aynı durumu kur"""
+        # type_registry.BUBBLE_KINDS içindeki tür; 0 = normal balon
+        self.kind_id = 0
+        self.x = x
+        self.y = y
+        self.original_x = x
+        # Çizim enterpolasyonu için bir önceki sabit adımdaki konum
+        self.prev_x = x
+        self.prev_y = y
+        self.radius = radius
+        self.original_radius = radius
+        self.color = color
+        self.original_color = color
+
+        self.life_time = 0
+        self.sway_amplitude = rng.uniform(15, 30)
+        self.sway_frequency = rng.uniform(1.5, 3.0)
+        self.breathe_amplitude = rng.uniform(0.1, 0.3)
+        self.breathe_frequency = rng.uniform(2.0, 4.0)
+        self.rotation_speed = rng.uniform(0.5, 2.0)
+        self.shimmer_phase = rng.uniform(0, 2 * math.pi)
+
+        base_speed = rng.uniform(50, 90)
+        # speed_factor: doğduğu andaki speed_multiplier
+        self.speed = base_speed * speed_factor
+
+        self.vx = 0
+        if direction == 'up':
+            self.vy = self.speed
+        else:
+            self.vy = -self.speed
+
+        self.alpha = 1.0
+        self.hit_boundary = False
+
+    def update(self, dt, play_area_bounds):
+        self.life_time += dt
+
+        self.y += self.vy * dt
+
+        if self.life_time < 100:
+            sway_offset = math.sin(self.life_time * self.sway_frequency) * self.sway_amplitude
+            self.x = self.original_x + sway_offset
+
+            breathe_factor = 1 + math.sin(self.life_time * self.breathe_frequency) * self.breathe_amplitude
+            self.radius = self.original_radius * breathe_factor
+
+        play_x, play_y, play_width, play_height = play_area_bounds
+
+        if (self.vy > 0 and self.y + self.radius >= play_y + play_height) or \
+           (self.vy < 0 and self.y - self.radius <= play_y):
+            if not self.hit_boundary:
+                self.hit_boundary = True
+                return 'boundary_hit'
+
+        if self.original_x - self.radius < play_x:
+            self.original_x = play_x + self.radius
+        elif self.original_x + self.radius > play_x + play_width:
+            self.original_x = play_x + play_width - self.radius
+
+        return True
+
+    @property
+    def kind(self):
+        return BUBBLE_KINDS[self.kind_id]
+
+    @property
+    def bubble_type(self):
+        return BUBBLE_KINDS[self.kind_id].key
+
+    def contains_point(self, x, y):
+        distance = math.sqrt((x - self.x)**2 + (y - self.y)**2)
+        return distance <= self.radius
+
+class SpecialBubble(Bubble):
+    __slots__ = ()
+
+    def __init__(self, x, y, radius, color, speed_factor, direction, bubble_type='normal', rng=random):
+        self.uid = 0
+        self.reset(x, y, radius, color, speed_factor, direction, bubble_type, rng)
+
+    def reset(self, x, y, radius, color, speed_factor, direction, bubble_type='normal', rng=random):
+        super().reset(x, y, radius, color, speed_factor, direction, rng)
+        self.kind_id = BUBBLE_KIND_IDS[bubble_type]
+
+    def get_special_properties(self):
+        return BUBBLE_KINDS[self.kind_id]
+
+    def update(self, dt, play_area_bounds):
+        return super().update(dt, play_area_bounds)
+
+class BubbleList(list):
+    """Varsayılan balon deposu - Bubble nesnelerinin düz listesi"""
+    def update(self, dt, play_area_bounds):
+        """Tüm balonları ilerlet; sınıra çarpanları listeden çıkarıp döndür"""
+        escaped = []
+        kept = []
+        for bubble in self:
+            result = bubble.update(dt, play_area_bounds)
+            if result == 'boundary_hit':
+                escaped.append(bubble)
+            elif result:
+                kept.append(bubble)
+        self[:] = kept
+        return escaped
+
+    def add(self, bubble):
+        self.append(bubble)
+        return bubble
+
+    def remove_many(self, bubbles):
+        """Birden çok balonu tek geçişte çıkar"""
+        doomed = set(bubbles)
+        self[:] = [bubble for bubble in self if bubble not in doomed]
+
+    def save_positions(self):
+        """Enterpolasyon için güncel konumları önceki konum olarak sakla"""
+        for bubble in self:
+            bubble.prev_x = bubble.x
+            bubble.prev_y = bubble.y
+
+class GameSimulation:
+    """Kivy'siz oyun çekirdeği - tüm oyun kuralları burada, GameWidget sadece çizer.
+
+    Pencere ya da Clock gerektirmez; step(dt, touches) ile istenen hızda ilerletilebilir.
+    Olaylar ('bubble_touched' patlayan balon sayısıyla, 'game_over') event_listeners
+    listesindeki fonksiyonlara iletilir.
+    bubble_store verilirse (örn. bubble_store.ArrayBubbleStore) balonlar onun içinde tutulur.
+    Tüm rastgelelik seed ile başlatılan kendi üreteçlerinden gelir; aynı seed ve aynı
+    tick'lerdeki aynı dokunuşlar aynı oyunu verir.
+    scoring ve difficulty (type_registry.Scoring / Difficulty) verilmezse game_types.json'dakiler
+    kullanılır - denge denemeleri (balance.py) bunları değiştirir.
+    """
+    def __init__(self, width=800, height=600, bubble_store=None, seed=None, scoring=None, difficulty=None):
+        self.scoring = scoring if scoring is not None else SCORING
+        self.difficulty = difficulty if difficulty is not None else DIFFICULTY
+        self.bubbles = bubble_store if bubble_store is not None else BubbleList()
+        self.particles = ParticlePool()
+        self.power_ups = []
+
+        # Dokunuş ve Multi Pop sorguları için balon merkezleri ızgarası
+        self.grid = UniformGrid(cell_size=80)
+
+        # Patlayan, kaçan ve süresi dolan varlıklar bu havuzlardan yeniden kullanılır
+        self.bubble_pools = {Bubble: EntityPool(Bubble), SpecialBubble: EntityPool(SpecialBubble)}
+        self.power_up_pool = EntityPool(PowerUp, max_free=16)
+
+        self.event_listeners = []
+        # Aşama ölçümü - profiler.FrameProfiler atanana kadar kapalı
+        self.profiler = NULL_PROFILER
+        # Oyun olayları kaydı - telemetry.TelemetryWriter atanana kadar kapalı
+        self.telemetry = NULL_TELEMETRY
+        # Görsel efektler (parçacıklar) - kapatmak oynanışı değiştirmez, efektlerin kendi rastgele akışı var
+        self.effects = True
+        self.reset(seed)
+        self.resize(width, height)
+
+    def reset(self, seed=None):
+        """Yeni oyun başlat - depolar, havuzlar, dinleyiciler ve oyun alanı korunur.
+
+        Önceki oyunda kalan balon ve power-up'lar havuzlara geri verilir.
+        """
+        if seed is None:
+            seed = random.randrange(1 << 32)
+        self.seed = seed
+        # Oynanış ve görsel efektler ayrı akışlar - efekt miktarı değişse de oyun aynı kalır
+        self.rng = random.Random(seed)
+        self.effects_rng = random.Random(f'effects-{seed}')
+        self.tick = 0
+
+        for bubble in self.bubbles:
+            self.release_bubble(bubble)
+        self.bubbles.clear()
+        for power_up in self.power_ups:
+            self.power_up_pool.release(power_up)
+        self.power_ups.clear()
+        self.particles.clear()
+        self.grid.clear()
+
+        self.score = 0
+        self.health = 100
+        self.max_health = 100
+        self.game_time = 0
+        self.spawn_timer = 0
+        self.spawn_interval = self.difficulty.spawn_interval
+        self.game_running = True
+        self.game_paused = False
+        self.bubbles_popped = 0
+        self.bubbles_missed = 0
+
+        self.combo_system = ComboSystem()
+        self.power_up_timer = 0
+        self.power_up_interval = 15.0
+
+        self.active_powers = {kind.key: {'active': False, 'timer': 0} for kind in POWER_UP_KINDS}
+
+        self.time_frozen = False
+        self.freeze_timer = 0
+
+        self.next_bubble_uid = 1
+        self.next_power_up_uid = 1
+        self.max_bubble_radius = 0
+        self.telemetry.record(GAME_START, 0)
+
+    def resize(self, width, height):
+        margin_x = 80
+        margin_y = 140
+
+        self.play_area_width = width - (2 * margin_x)
+        self.play_area_height = height - (2 * margin_y)
+        self.play_area_x = margin_x
+        self.play_area_y = margin_y
+
+    def emit(self, event, *args):
+        for listener in self.event_listeners:
+            listener(event, *args)
+
+    def in_play_area(self, x, y):
+        return (self.play_area_x <= x <= self.play_area_x + self.play_area_width and
+                self.play_area_y <= y <= self.play_area_y + self.play_area_height)
+
+    def accepts_touch(self, x, y):
+        """handle_touch bu noktadaki dokunuşu kullanır mı"""
+        return self.game_running and not self.game_paused and self.in_play_area(x, y)
+
+    def save_positions(self):
+        """Balon, parçacık ve power-up konumlarını enterpolasyon için sakla"""
+        self.bubbles.save_positions()
+        self.particles.save_positions()
+        for power_up in self.power_ups:
+            power_up.prev_x = power_up.x
+            power_up.prev_y = power_up.y
+
+    def step(self, dt, touches=()):
+        """Önce dokunuşları işle, sonra oyunu dt saniye ilerlet"""
+        if touches:
+            with self.profiler.phase('touch'):
+                for x, y in touches:
+                    self.handle_touch(x, y)
+        self.update(dt)
+        self.tick += 1
+        return self.game_running
+
+    def spawn_bubble(self):
+        if not self.game_running or self.game_paused:
+            return
+
+        spawn_side = self.rng.choice(['bottom', 'top'])
+
+        safe_margin = 80
+        x = self.rng.uniform(
+            self.play_area_x + safe_margin,
+            self.play_area_x + self.play_area_width - safe_margin
+        )
+
+        difficulty = self.difficulty
+        time_factor = self.game_time / difficulty.radius_ramp
+        min_radius = max(difficulty.min_radius_floor, difficulty.min_radius - time_factor * difficulty.min_radius_shrink)
+        max_radius = max(difficulty.max_radius_floor, difficulty.max_radius - time_factor * difficulty.max_radius_shrink)
+        radius = self.rng.uniform(min_radius, max_radius)
+
+        radius_margin = radius + 10
+
+        if spawn_side == 'bottom':
+            y = self.play_area_y + radius_margin
+            direction = 'up'
+        else:
+            y = self.play_area_y + self.play_area_height - radius_margin
+            direction = 'down'
+
+        color = self.rng.choice(REGISTRY.palette)
+        kind = REGISTRY.pick_special(self.rng.random())
+        speed_factor = speed_multiplier(self.game_time, difficulty)
+
+        if kind is not None:
+            bubble = self.bubble_pools[SpecialBubble].acquire(
+                x, y, radius, kind.color, speed_factor, direction, kind.key, self.rng)
+        else:
+            bubble = self.bubble_pools[Bubble].acquire(x, y, radius, color, speed_factor, direction, self.rng)
+
+        stored = self.add_bubble(bubble)
+        if stored is not bubble:
+            # Dizi deposu durumu kopyaladı - nesneye artık gerek yok
+            self.release_bubble(bubble)
+
+    def add_bubble(self, bubble):
+        """Balonu depoya ve ızgaraya ekle; depodaki karşılığını döndür"""
+        bubble.uid = self.next_bubble_uid
+        self.next_bubble_uid += 1
+        # Nefes alma ile ulaşılabilecek en büyük yarıçap - nokta sorgusunun menzili
+        reach = bubble.original_radius * (1 + bubble.breathe_amplitude)
+        if reach > self.max_bubble_radius:
+            self.max_bubble_radius = reach
+
+        stored = self.bubbles.add(bubble)
+        self.grid.insert(stored, stored.x, stored.y)
+        return stored
+
+    def release_bubble(self, bubble):
+        """Depodan çıkmış balonu havuzuna geri ver (dizi deposu görünümleri yok sayılır)"""
+        pool = self.bubble_pools.get(type(bubble))
+        if pool is not None:
+            pool.release(bubble)
+
+    def pool_stats(self):
+        return {
+            'bubble': self.bubble_pools[Bubble].stats(),
+            'special_bubble': self.bubble_pools[SpecialBubble].stats(),
+            'power_up': self.power_up_pool.stats(),
+        }
+
+    def bubble_at(self, x, y):
+        """(x, y) noktasını içeren en eski balon (liste sırasındaki ilk balon)"""
+        hit = None
+        for bubble in self.grid.query(x, y, self.max_bubble_radius):
+            if bubble.contains_point(x, y) and (hit is None or bubble.uid < hit.uid):
+                hit = bubble
+        return hit
+
+    def spawn_power_up(self):
+        if not self.game_running or self.game_paused:
+            return
+
+        kind = self.rng.choice(POWER_UP_KINDS)
+
+        margin = 100
+        x = self.rng.uniform(
+            self.play_area_x + margin,
+            self.play_area_x + self.play_area_width - margin
+        )
+        y = self.play_area_y + self.play_area_height * 0.4
+
+        power_up = self.power_up_pool.acquire(x, y, kind.id)
+        power_up.uid = self.next_power_up_uid
+        self.next_power_up_uid += 1
+        self.power_ups.append(power_up)
+
+    def activate_power_up(self, power_type):
+        if power_type in self.active_powers:
+            kind = REGISTRY.power_up(power_type)
+            self.active_powers[power_type]['active'] = True
+            self.active_powers[power_type]['timer'] = kind.effect_duration
+            self.telemetry.record(POWER_UP, self.game_time, kind.id, value=kind.effect_duration)
+
+    def update(self, dt):
+        if not self.game_running or self.game_paused:
+            return
+
+        if self.time_frozen:
+            self.freeze_timer -= dt
+            if self.freeze_timer <= 0:
+                self.time_frozen = False
+            else:
+                return
+
+        profiler = self.profiler
+        self.game_time += dt
+        self.combo_system.update(dt)
+
+        with profiler.phase('power_ups'):
+            self.power_up_timer += dt
+            if self.power_up_timer >= self.power_up_interval:
+                self.spawn_power_up()
+                self.power_up_timer = 0
+                self.power_up_interval = self.rng.uniform(12.0, 18.0)
+
+            for power_type, power_data in self.active_powers.items():
+                if power_data['active']:
+                    power_data['timer'] -= dt
+                    if power_data['timer'] <= 0:
+                        power_data['active'] = False
+
+        with profiler.phase('spawn'):
+            self.spawn_timer += dt
+
+            difficulty = self.difficulty
+            time_factor = self.game_time / difficulty.spawn_ramp
+            spawn_reduction = time_factor * (1 + time_factor * difficulty.spawn_curve)
+            current_spawn_interval = max(difficulty.min_spawn_interval, self.spawn_interval - spawn_reduction)
+
+            if self.active_powers['slow']['active']:
+                current_spawn_interval *= 2.0
+
+            if self.spawn_timer >= current_spawn_interval:
+                self.spawn_bubble()
+                self.spawn_timer = 0
+
+        with profiler.phase('bubbles'):
+            play_area_bounds = (self.play_area_x, self.play_area_y, self.play_area_width, self.play_area_height)
+            escaped = self.bubbles.update(dt, play_area_bounds)
+            self.grid.sync(self.bubbles)
+            for bubble in escaped:
+                self.grid.remove(bubble)
+                damage = 0
+                if not self.active_powers['shield']['active']:
+                    damage = self.calculate_damage(bubble.radius)
+                    self.health -= damage
+                    self.bubbles_missed += 1
+                self.telemetry.record(BOUNDARY_HIT, self.game_time, bubble.kind_id, 0,
+                                      bubble.x, bubble.y, bubble.radius, damage)
+
+                self.create_boundary_hit_effect(bubble.x, bubble.y, bubble.radius)
+                self.release_bubble(bubble)
+
+                if self.health <= 0:
+                    self.health = 0
+                    self.game_over()
+
+        with profiler.phase('power_ups'):
+            kept = []
+            for power_up in self.power_ups:
+                if power_up.update(dt):
+                    kept.append(power_up)
+                else:
+                    self.power_up_pool.release(power_up)
+            self.power_ups = kept
+
+        with profiler.phase('effects'):
+            self.particles.update(dt)
+
+        if len(self.bubbles) > self.difficulty.crowd_limit:
+            if not self.active_powers['shield']['active']:
+                self.health -= self.difficulty.crowd_damage * dt
+
+        if self.health <= 0:
+            self.health = 0
+            self.game_over()
+
+    def calculate_damage(self, radius):
+        base_damage = self.scoring.escape_damage
+        size_multiplier = (radius / self.scoring.reference_radius)
+        return base_damage * size_multiplier
+
+    def emit_particle(self, recipe, x, y, color=None, source_radius=0):
+        """Tarifteki aralıklardan bir parçacık üret; color verilmezse tarifin renkleri kullanılır"""
+        # Havuz doluysa üretme - hemen üzerine yazılacak parçacık için rastgele değer ve çalma maliyeti ödenmez
+        if not self.effects or self.particles.available() <= 0:
+            return
+        rng = self.effects_rng
+        low, high = recipe.radius
+        if recipe.radius_scale:
+            high = source_radius * recipe.radius_scale
+        p_radius = rng.uniform(low, high)
+        lifetime = rng.uniform(*recipe.lifetime)
+        if recipe.radial:
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(*recipe.speed)
+            vx = math.cos(angle) * speed
+            vy = math.sin(angle) * speed
+        else:
+            limit = recipe.speed[1]
+            vx = rng.uniform(-limit, limit)
+            vy = rng.uniform(-limit, limit)
+        if color is None:
+            colors = recipe.colors
+            color = colors[0] if len(colors) == 1 else rng.choice(colors)
+        jitter = recipe.jitter
+        self.particles.emit(
+            x + rng.uniform(-jitter, jitter),
+            y + rng.uniform(-jitter, jitter),
+            vx, vy, p_radius, lifetime, color
+        )
+
+    def create_touch_effect(self, x, y, recipe='touch'):
+        recipe = PARTICLE_RECIPES[recipe]
+        for _ in range(5):
+            self.emit_particle(recipe, x, y)
+
+    def create_boundary_hit_effect(self, x, y, radius):
+        recipe = PARTICLE_RECIPES['boundary_hit']
+        particle_count = min(int(radius / 4) + 2, 8)
+        for _ in range(particle_count * 5):
+            self.emit_particle(recipe, x, y)
+
+    def handle_touch(self, x, y):
+        """Oyun alanındaki bir dokunuşu işle; dokunuş oyun tarafından kullanıldıysa True döner"""
+        if not self.accepts_touch(x, y):
+            return False
+
+        self.create_touch_effect(x, y)
+
+        touched_bubble = self.bubble_at(x, y)
+
+        power_up_collected = False
+        for power_up in self.power_ups[:]:
+            if power_up.contains_point(x, y):
+                self.power_ups.remove(power_up)
+                self.activate_power_up(power_up.power_type)
+                self.create_power_up_collect_effect(power_up.x, power_up.y, power_up.kind)
+                self.power_up_pool.release(power_up)
+                power_up_collected = True
+                break
+
+        bubble_hit = False
+        bubbles_to_pop = []
+        points_gained = 0
+
+        if touched_bubble is not None:
+            bubbles_to_pop.append(touched_bubble)
+
+            if self.active_powers['multi']['active']:
+                neighbours = self.grid.query_radius(touched_bubble.x, touched_bubble.y, 80)
+                neighbours.sort(key=lambda bubble: bubble.uid)
+                for other_bubble in neighbours:
+                    if other_bubble is not touched_bubble:
+                        bubbles_to_pop.append(other_bubble)
+
+        if bubbles_to_pop:
+            # Ses için tek olay - Multi Pop'ta patlayan balon sayısıyla
+            self.emit('bubble_touched', len(bubbles_to_pop))
+            self.bubbles.remove_many(bubbles_to_pop)
+            for bubble_to_pop in bubbles_to_pop:
+                self.grid.remove(bubble_to_pop)
+
+        for bubble_to_pop in bubbles_to_pop:
+            self.bubbles_popped += 1
+            bubble_hit = True
+
+            combo_count = self.combo_system.add_pop()
+            combo_multiplier = self.combo_system.get_combo_multiplier()
+
+            scoring = self.scoring
+            base_points = scoring.base_points
+            size_bonus = int((bubble_to_pop.radius / scoring.reference_radius) * scoring.size_bonus)
+
+            kind = bubble_to_pop.kind
+            if kind.special_effect == 'freeze_time':
+                self.time_frozen = True
+                self.freeze_timer = kind.effect_value
+            elif kind.special_effect == 'heal':
+                self.health = min(100, self.health + kind.effect_value)
+
+            total_points = int((base_points + size_bonus) * combo_multiplier * kind.points_multiplier)
+
+            if self.active_powers['double']['active']:
+                total_points *= scoring.double_points_multiplier
+
+            self.score += total_points
+            points_gained += total_points
+            self.telemetry.record(POP, self.game_time, kind.id, combo_count,
+                                  bubble_to_pop.x, bubble_to_pop.y, bubble_to_pop.radius, total_points)
+
+            if kind.id:
+                self.create_special_pop_effect(bubble_to_pop.x, bubble_to_pop.y, bubble_to_pop.radius, kind)
+            else:
+                self.create_pop_effect(bubble_to_pop.x, bubble_to_pop.y, bubble_to_pop.radius)
+            self.release_bubble(bubble_to_pop)
+
+        if bubbles_to_pop:
+            self.telemetry.record(TOUCH, self.game_time, int(self.active_powers['multi']['active']),
+                                  len(bubbles_to_pop), x, y, 0, points_gained)
+
+        if not bubble_hit and not power_up_collected:
+            penalty = 0
+            if not self.active_powers['shield']['active']:
+                penalty = self.scoring.miss_penalty
+                self.health -= penalty
+            self.telemetry.record(MISS, self.game_time, 0, 0, x, y, 0, penalty)
+            self.create_touch_effect(x, y, 'miss')
+
+        return True
+
+    def create_pop_effect(self, x, y, radius):
+        recipe = PARTICLE_RECIPES['pop']
+        touch = PARTICLE_RECIPES['touch']
+        particle_count = min(int(radius / 4) + 4, 10)
+
+        for _ in range(particle_count):
+            if self.particles.available() <= 0:
+                break
+            particle_x = x + self.effects_rng.uniform(-radius*0.3, radius*0.3)
+            particle_y = y + self.effects_rng.uniform(-radius*0.3, radius*0.3)
+
+            for _ in range(3):
+                self.emit_particle(recipe, particle_x, particle_y, source_radius=radius)
+            for _ in range(2):
+                self.emit_particle(touch, particle_x, particle_y)
+
+    def create_power_up_collect_effect(self, x, y, kind):
+        recipe = PARTICLE_RECIPES['power_up_collect']
+        touch = PARTICLE_RECIPES['touch']
+        for _ in range(10):
+            for _ in range(2):
+                self.emit_particle(recipe, x, y, kind.color)
+            for _ in range(3):
+                self.emit_particle(touch, x, y)
+
+    def create_special_pop_effect(self, x, y, radius, kind):
+        """kind: type_registry.BubbleKind - parçacık sayısı ve renkleri türden gelir"""
+        recipe = PARTICLE_RECIPES['special_pop']
+        touch = PARTICLE_RECIPES['touch']
+        colors = kind.particle_colors
+        single = colors[0] if len(colors) == 1 else None
+
+        for _ in range(kind.pop_particles):
+            for _ in range(2):
+                color = single if single is not None else self.effects_rng.choice(colors)
+                self.emit_particle(recipe, x, y, color)
+            for _ in range(3):
+                self.emit_particle(touch, x, y)
+
+    def accuracy(self):
+        if self.bubbles_popped + self.bubbles_missed > 0:
+            return (self.bubbles_popped / (self.bubbles_popped + self.bubbles_missed)) * 100
+        return 0
+
+    def game_over(self):
+        if not self.game_running:
+            return
+        self.game_running = False
+        self.telemetry.record(GAME_OVER, self.game_time, 0, self.bubbles_popped, 0, 0,
+                              self.bubbles_missed, self.score)
+        self.emit('game_over')
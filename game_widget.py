@@ -0,0 +1,629 @@
+﻿from kivy.uix.widget import Widget
+from kivy.uix.label import Label
+from kivy.uix.button import Button
+from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.progressbar import ProgressBar
+from kivy.graphics import Color, Rectangle, Line
+from kivy.clock import Clock
+from kivy.core.window import Window, Keyboard
+from time import perf_counter
+from game_simulation import GameSimulation, speed_multiplier
+from bubble_store import ArrayBubbleStore, numpy_available
+from renderer import GameRenderer
+from fixed_step import FixedStepRunner
+from replay import ReplayPlayer, ReplayRecorder
+from autoplayer import AutoPlayer, BotTouch
+from profiler import FrameProfiler
+from profiler_overlay import ProfilerOverlay
+from hud import Hud
+from quality import QualityController, DEFAULT_TIER, tier_index
+from type_registry import REGISTRY
+from voice_pool import VoicePool
+
+
+class GameWidget(FloatLayout):
+    def __init__(self, app, **kwargs):
+        super().__init__(**kwargs)
+        self.app = app
+        # Simülasyon (depoları ve havuzlarıyla), widget ağacı ve canvas nesneleri bir kez kurulur;
+        # her yeni oyun reset() ile aynı nesneler üzerinde başlar
+        # NumPy varsa balonlar dizi deposunda tutulur (vektörel güncelleme)
+        bubble_store = ArrayBubbleStore() if numpy_available() else None
+        self.simulation = GameSimulation(bubble_store=bubble_store)
+        self.simulation.event_listeners.append(self.on_simulation_event)
+        if self.app.telemetry is not None:
+            self.simulation.telemetry = self.app.telemetry
+        self.replay_player = None
+        self.recorder = None
+        self.autoplayer = None
+        self.profiler_overlay = None
+        self.instruction_count = 0
+        self.special_bubble_info = ""
+        
+        self.draw_counter = 0
+        self.play_area_ratio = 0.8
+        self.pop_voices = VoicePool([])
+        self.sound_enabled = self.app.sound_enabled
+        
+        self.game_area = Widget()
+        self.add_widget(self.game_area)
+        # Parçacıklar ve balonlar birkaç Mesh'e toplu yazılır (numpy yoksa tek tek çizilir)
+        self.renderer = GameRenderer(self.game_area.canvas, batch_particles=True, batch_bubbles=True)
+        
+        self.setup_ui()
+        self.setup_hud()
+        self.bind(size=self.on_size_change)
+        self.reset()
+
+    def reset(self):
+        """Yeni oyun oturumu başlat; kayıt, profil, kalite ve ses havuzu oturuma özeldir"""
+        sim = self.simulation
+        simulation_rate = self.app.simulation_rate
+        self.replay_player = None
+        self.recorder = None
+        if self.app.replay_path:
+            # Kayıttaki seed, adım hızı ve dokunuşlar kullanılır
+            self.replay_player = ReplayPlayer(self.app.replay_path)
+            sim.reset(self.replay_player.seed)
+            simulation_rate = self.replay_player.rate
+        else:
+            sim.reset(self.app.seed)
+            if self.app.record_path:
+                self.recorder = ReplayRecorder(self.app.game_record_path(), sim.seed, simulation_rate)
+        # Simülasyon sabit adımla, çizim app.render_fps ile ilerler
+        self.runner = FixedStepRunner(sim, rate=simulation_rate,
+                                      max_steps=self.app.max_catch_up_steps,
+                                      recorder=self.recorder, playback=self.replay_player)
+        # Bot oyuncu (--autoplay): dokunuşları oyuncununkiyle aynı yoldan, on_touch_down ile verir
+        self.autoplayer = None
+        if self.app.autoplay is not None and self.replay_player is None:
+            self.autoplayer = AutoPlayer(self.app.autoplay, sim.seed)
+        # Aşama ölçümü: F3 ile profil katmanı, --trace ile Chrome trace kaydı
+        self.profiler = FrameProfiler(enabled=self.app.profile or bool(self.app.trace_path)
+                                      or self.profiler_overlay is not None,
+                                      tracing=bool(self.app.trace_path))
+        sim.profiler = self.profiler
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.profiler = self.profiler
+        self.instruction_count = 0
+        self.draw_counter = 0
+        
+        # Kare bütçesine göre çizim kalitesi - app.quality 'auto' değilse sabit kademe
+        quality = self.app.quality
+        self.quality = QualityController(target_fps=self.app.render_fps,
+                                         tier=DEFAULT_TIER if quality == 'auto' else tier_index(quality),
+                                         adaptive=quality == 'auto')
+        self.renderer.reset()
+        self.apply_quality()
+        
+        # Ses dosyalarını yükle (sadece efektler)
+        self.load_sounds()
+        self.sound_enabled = self.app.sound_enabled
+        self.sound_btn.text = 'SOUND ON' if self.sound_enabled else 'SOUND OFF'
+        self.sound_btn.background_color = (0.2, 0.5, 0.2, 0.9) if self.sound_enabled else (0.5, 0.2, 0.2, 0.9)
+        self.pause_btn.text = 'PAUSE'
+        self.pause_btn.background_color = (0.2, 0.2, 0.5, 0.9)
+        
+        self.update_play_area()
+        self.health_bar.value = sim.health
+        self.update_labels()
+        Window.bind(on_key_down=self.on_key_down)
+        if self.app.profile and self.profiler_overlay is None:
+            self.toggle_profiler()
+        Clock.schedule_interval(self.update, 1.0 / self.app.render_fps)
+
+    def load_sounds(self):
+        """Patlama sesi havuzu - sesler uygulamanın varlık önbelleğinden paylaşılır.
+
+        Sesler menüdeyken arka planda yüklenmeye başlar; oyun yükleme bitmeden açıldıysa
+        havuz yükleme bitince bağlanır, o zamana kadar patlamalar sessizdir.
+        """
+        self.pop_voices = VoicePool([])
+        future = self.app.pop_sounds()
+        if future.done():
+            self.attach_pop_voices(future)
+        else:
+            future.add_done_callback(
+                lambda future: Clock.schedule_once(lambda dt: self.attach_pop_voices(future)))
+
+    def attach_pop_voices(self, future):
+        if future.exception() is not None:
+            print(f"❌ Ses dosyası yükleme hatası: {future.exception()}")
+            return
+        sounds = future.result()
+        # Oyun yükleme sürerken bittiyse havuz hiç açılmaz
+        if sounds and self.simulation.game_running:
+            self.pop_voices = VoicePool(sounds, volume=0.8, schedule=Clock.schedule_once)
+
+    def start_background_music(self):
+        """Arkaplan müziğini başlat"""
+        if self.sound_enabled and self.game_music and not self.game_music.state == 'play':
+            self.game_music.play()
+            
+    def stop_background_music(self):
+        """Arkaplan müziğini durdur"""
+        if self.game_music and self.game_music.state == 'play':
+            self.game_music.stop()
+            
+    def pause_background_music(self):
+        """Arkaplan müziğini duraklat"""
+        if self.game_music and self.game_music.state == 'play':
+            self.game_music.stop()
+            
+    def resume_background_music(self):
+        """Arkaplan müziğini devam ettir"""
+        if self.sound_enabled and self.game_music and not self.game_music.state == 'play':
+            self.game_music.play()
+            
+    def play_bubble_pop_sound(self, count=1):
+        """Balon patlatma sesini sıraya al - kare sonunda tek çalmada birleştirilir"""
+        if self.sound_enabled:
+            self.pop_voices.trigger(count)
+        
+    def on_simulation_event(self, event, *args):
+        if event == 'bubble_touched':
+            self.play_bubble_pop_sound(*args)
+        elif event == 'game_over':
+            self.game_over()
+
+    def update_play_area(self):
+        sim = self.simulation
+        # Tekrar oynatmada oyun alanı boyutu kayıttan gelir
+        if self.replay_player is None:
+            width, height = self.width, self.height
+            if self.recorder is not None:
+                width, height = self.recorder.record_resize(sim.tick, width, height)
+            sim.resize(width, height)
+        self.renderer.resize(self.width, self.height, (sim.play_area_x, sim.play_area_y, sim.play_area_width, sim.play_area_height))
+
+    def on_size_change(self, *args):
+        self.update_play_area()
+        self.update_ui_positions()
+        
+    def setup_ui(self):
+        # Score Panel
+        self.score_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(160, 40),
+            font_size='18sp',
+            color=(1, 1, 1, 1),
+            markup=True,
+            bold=True
+        )
+        with self.score_label.canvas.before:
+            Color(0.1, 0.1, 0.3, 0.9)
+            self.score_bg_rect = Rectangle(pos=self.score_label.pos, size=self.score_label.size)
+            Color(0.3, 0.6, 1, 0.8)
+            self.score_border = Line(rectangle=(*self.score_label.pos, *self.score_label.size), width=2)
+        self.add_widget(self.score_label)
+        
+        # Time Panel
+        self.time_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(140, 40),
+            font_size='18sp',
+            color=(1, 1, 0.3, 1),
+            markup=True,
+            bold=True
+        )
+        with self.time_label.canvas.before:
+            Color(0.3, 0.2, 0.1, 0.9)
+            self.time_bg_rect = Rectangle(pos=self.time_label.pos, size=self.time_label.size)
+            Color(1, 0.8, 0.2, 0.8)
+            self.time_border = Line(rectangle=(*self.time_label.pos, *self.time_label.size), width=2)
+        self.add_widget(self.time_label)
+        
+        # Health Panel
+        self.health_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(150, 40),
+            font_size='18sp',
+            color=(1, 0.3, 0.3, 1),
+            markup=True,
+            bold=True
+        )
+        with self.health_label.canvas.before:
+            Color(0.3, 0.1, 0.1, 0.9)
+            self.health_bg_rect = Rectangle(pos=self.health_label.pos, size=self.health_label.size)
+            Color(1, 0.3, 0.3, 0.8)
+            self.health_border = Line(rectangle=(*self.health_label.pos, *self.health_label.size), width=2)
+        self.add_widget(self.health_label)
+        
+        # Health Progress Bar
+        self.health_bar = ProgressBar(
+            max=100,
+            value=self.simulation.health,
+            size_hint=(None, None),
+            size=(150, 8)
+        )
+        self.add_widget(self.health_bar)
+        
+        # Pause Button
+        self.pause_btn = Button(
+            text='PAUSE',
+            size_hint=(None, None),
+            size=(100, 35),
+            font_size='16sp',
+            background_color=(0.2, 0.2, 0.5, 0.9),
+            color=(1, 1, 1, 1),
+            bold=True
+        )
+        self.pause_btn.bind(on_press=self.toggle_pause)
+        self.add_widget(self.pause_btn)
+        
+        # Sound Button
+        self.sound_btn = Button(
+            text='SOUND ON',
+            size_hint=(None, None),
+            size=(90, 35),
+            font_size='14sp',
+            background_color=(0.2, 0.5, 0.2, 0.9),
+            color=(1, 1, 1, 1),
+            bold=True
+        )
+        self.sound_btn.bind(on_press=self.toggle_sound)
+        self.add_widget(self.sound_btn)
+        
+        # Combo Display
+        self.combo_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(180, 35),
+            font_size='16sp',
+            color=(1, 0.8, 0.2, 1),
+            markup=True,
+            bold=True
+        )
+        with self.combo_label.canvas.before:
+            Color(0.3, 0.2, 0.05, 0.9)
+            self.combo_bg_rect = Rectangle(pos=self.combo_label.pos, size=self.combo_label.size)
+            Color(1, 0.6, 0, 0.8)
+            self.combo_border = Line(rectangle=(*self.combo_label.pos, *self.combo_label.size), width=2)
+        self.add_widget(self.combo_label)
+        
+        # Power Status Panel
+        self.power_status_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(200, 70),
+            font_size='12sp',
+            color=(0.8, 1, 0.8, 1),
+            markup=True,
+            halign='left',
+            valign='top',
+            text_size=(200, None),
+            bold=True
+        )
+        with self.power_status_label.canvas.before:
+            Color(0.1, 0.3, 0.1, 0.9)
+            self.power_status_bg_rect = Rectangle(pos=self.power_status_label.pos, size=self.power_status_label.size)
+            Color(0.3, 1, 0.3, 0.8)
+            self.power_status_border = Line(rectangle=(*self.power_status_label.pos, *self.power_status_label.size), width=2)
+        self.add_widget(self.power_status_label)
+        
+        # Special Info Panel
+        self.special_info_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(220, 90),
+            font_size='11sp',
+            color=(1, 1, 0.7, 1),
+            markup=True,
+            halign='left',
+            valign='top',
+            text_size=(220, None),
+            bold=True
+        )
+        with self.special_info_label.canvas.before:
+            Color(0.2, 0.2, 0.05, 0.9)
+            self.special_info_bg_rect = Rectangle(pos=self.special_info_label.pos, size=self.special_info_label.size)
+            Color(1, 1, 0.3, 0.8)
+            self.special_info_border = Line(rectangle=(*self.special_info_label.pos, *self.special_info_label.size), width=2)
+        self.add_widget(self.special_info_label)
+        
+        # Speed Display
+        self.speed_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(120, 30),
+            font_size='14sp',
+            color=(0.5, 1, 0.5, 1),
+            markup=True,
+            bold=True
+        )
+        with self.speed_label.canvas.before:
+            Color(0.1, 0.2, 0.1, 0.9)
+            self.speed_bg_rect = Rectangle(pos=self.speed_label.pos, size=self.speed_label.size)
+            Color(0.3, 1, 0.3, 0.8)
+            self.speed_border = Line(rectangle=(*self.speed_label.pos, *self.speed_label.size), width=2)
+        self.add_widget(self.speed_label)
+        
+        # Statistics Panel
+        self.stats_label = Label(
+            text='',
+            size_hint=(None, None),
+            size=(220, 30),
+            font_size='12sp',
+            color=(0.8, 0.8, 1, 1),
+            markup=True,
+            bold=True
+        )
+        with self.stats_label.canvas.before:
+            Color(0.1, 0.1, 0.2, 0.9)
+            self.stats_bg_rect = Rectangle(pos=self.stats_label.pos, size=self.stats_label.size)
+            Color(0.5, 0.5, 1, 0.8)
+            self.stats_border = Line(rectangle=(*self.stats_label.pos, *self.stats_label.size), width=2)
+        self.add_widget(self.stats_label)
+        
+        self.update_play_area()
+        self.update_ui_positions()
+        
+    def setup_hud(self):
+        # Label'lar sadece panel olarak kalır; metinler glif atlasından çizilir ve
+        # sadece değer değişince yeniden dizilir
+        self.hud = Hud()
+        hud_fields = (
+            ('score', self.score_label, '18sp', (1, 1, 1, 1)),
+            ('time', self.time_label, '18sp', (1, 1, 0.3, 1)),
+            ('health', self.health_label, '18sp', (1, 0.3, 0.3, 1)),
+            ('combo', self.combo_label, '16sp', (1, 0.8, 0.2, 1)),
+            ('speed', self.speed_label, '14sp', (0.5, 1, 0.5, 1)),
+            ('stats', self.stats_label, '12sp', (0.8, 0.8, 1, 1)),
+        )
+        for name, label, font_size, color in hud_fields:
+            self.hud.add(name, label, font_size, color)
+        self.hud.add('power_status', self.power_status_label, '12sp', (0.8, 1, 0.8, 1), halign='left', valign='top')
+        self.hud.add('special_info', self.special_info_label, '11sp', (1, 1, 0.7, 1), halign='left', valign='top')
+        self.canvas.after.add(self.hud.group)
+        self.update_labels()
+        
+    def update_ui_positions(self):
+        margin = 15
+        
+        # Top section
+        self.score_label.pos = (margin, self.height - 50)
+        self.time_label.pos = (self.width/2 - 70, self.height - 50)
+        self.health_label.pos = (self.width - 280, self.height - 50)
+        self.health_bar.pos = (self.width - 280, self.height - 65)
+        self.pause_btn.pos = (self.width - 110, self.height - 50)
+        self.sound_btn.pos = (self.width - 110, self.height - 90)
+        self.combo_label.pos = (self.width/2 - 90, self.height - 90)
+        
+        # Bottom section
+        bottom_y = margin
+        self.power_status_label.pos = (margin, bottom_y + 30)
+        self.speed_label.pos = (margin, bottom_y)
+        self.stats_label.pos = (self.width/2 - 110, bottom_y)
+        self.special_info_label.pos = (self.width - 230, bottom_y)
+        
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.pos = (margin, self.height - 110 - self.profiler_overlay.height)
+        
+        # Update background rectangles and borders
+        self.update_ui_graphics()
+        
+    def update_ui_graphics(self):
+        ui_elements = [
+            (self.score_label, self.score_bg_rect, self.score_border, (0.1, 0.1, 0.3, 0.9), (0.3, 0.6, 1, 0.8)),
+            (self.time_label, self.time_bg_rect, self.time_border, (0.3, 0.2, 0.1, 0.9), (1, 0.8, 0.2, 0.8)),
+            (self.health_label, self.health_bg_rect, self.health_border, (0.3, 0.1, 0.1, 0.9), (1, 0.3, 0.3, 0.8)),
+            (self.combo_label, self.combo_bg_rect, self.combo_border, (0.3, 0.2, 0.05, 0.9), (1, 0.6, 0, 0.8)),
+            (self.power_status_label, self.power_status_bg_rect, self.power_status_border, (0.1, 0.3, 0.1, 0.9), (0.3, 1, 0.3, 0.8)),
+            (self.special_info_label, self.special_info_bg_rect, self.special_info_border, (0.2, 0.2, 0.05, 0.9), (1, 1, 0.3, 0.8)),
+            (self.speed_label, self.speed_bg_rect, self.speed_border, (0.1, 0.2, 0.1, 0.9), (0.3, 1, 0.3, 0.8)),
+            (self.stats_label, self.stats_bg_rect, self.stats_border, (0.1, 0.1, 0.2, 0.9), (0.5, 0.5, 1, 0.8))
+        ]
+        
+        for label, bg_rect, border, bg_color, border_color in ui_elements:
+            bg_rect.pos = label.pos
+            bg_rect.size = label.size
+            border.rectangle = (*label.pos, *label.size)
+        
+    def toggle_pause(self, instance=None):
+        if self.simulation.game_paused:
+            self.resume_game()
+        else:
+            self.pause_game()
+            
+    def pause_game(self):
+        if not self.simulation.game_running or self.simulation.game_paused:
+            return
+            
+        self.simulation.game_paused = True
+        self.pause_btn.text = 'RESUME'
+        self.pause_btn.background_color = (0.2, 0.8, 0.2, 0.9)
+        
+    def resume_game(self):
+        if not self.simulation.game_paused:
+            return
+            
+        self.simulation.game_paused = False
+        self.pause_btn.text = 'PAUSE'
+        self.pause_btn.background_color = (0.2, 0.2, 0.5, 0.9)
+        
+    def toggle_sound(self, instance=None):
+        """Ses açma/kapama - app seviyesinde yönet"""
+        self.app.toggle_music()
+        
+    def toggle_profiler(self):
+        if self.profiler_overlay is None:
+            self.profiler.enabled = True
+            self.profiler_overlay = ProfilerOverlay(self.profiler, target_fps=self.app.render_fps)
+            self.add_widget(self.profiler_overlay)
+            self.update_ui_positions()
+        else:
+            self.remove_widget(self.profiler_overlay)
+            self.profiler_overlay = None
+            self.profiler.enabled = self.profiler.tracing
+    
+    def on_key_down(self, window, key, *args):
+        if key == Keyboard.keycodes['f3']:
+            self.toggle_profiler()
+            return True
+        return False
+    
+    def apply_quality(self):
+        tier = self.quality.tier
+        self.renderer.quality = tier
+        particles = self.simulation.particles
+        particles.limit = max(1, int(particles.capacity * tier.particle_fraction))
+    
+    def draw_game(self):
+        self.renderer.draw(self.simulation, self.runner.blend)
+    
+    def update(self, dt):
+        frame_start = perf_counter()
+        sim = self.simulation
+        profiler = self.profiler
+        profiler.begin_frame()
+        if sim.game_running and not sim.game_paused:
+            self.draw_counter += 1
+        
+        if self.autoplayer is not None:
+            for x, y in self.autoplayer.update(dt, sim):
+                self.on_touch_down(BotTouch(x, y))
+        with profiler.phase('simulation'):
+            self.runner.advance(dt)
+        self.pop_voices.flush()
+        if self.replay_player is not None:
+            sim_area = (sim.play_area_x, sim.play_area_y, sim.play_area_width, sim.play_area_height)
+            if sim_area != self.renderer.play_area:
+                self.renderer.resize(self.width, self.height, sim_area)
+        
+        with profiler.phase('draw_game'):
+            self.draw_game()
+        with profiler.phase('update_labels'):
+            self.update_labels()
+        
+        if self.quality.record(dt, perf_counter() - frame_start):
+            self.apply_quality()
+        
+        if profiler.enabled:
+            # Talimat sayımı tüm canvas'ı dolaşır - seyrek yap
+            if self.profiler_overlay is not None and self.draw_counter % 15 == 0:
+                self.instruction_count = self.renderer.instruction_count()
+            counters = {'bubbles': len(sim.bubbles), 'particles': len(sim.particles),
+                        'power_ups': len(sim.power_ups), 'instructions': self.instruction_count,
+                        'quality_tier': self.quality.index, 'hud_updates': self.hud.total_updates(),
+                        'pool_misses': sum(stats['misses'] for stats in sim.pool_stats().values())}
+            profiler.end_frame(**counters)
+            if self.profiler_overlay is not None:
+                self.profiler_overlay.refresh(counters)
+    
+    def update_labels(self):
+        sim = self.simulation
+        hud = self.hud
+        hud.set('score', sim.score, 'SCORE: {}'.format)
+        hud.set('time', (int(sim.game_time), sim.game_paused), self.format_time)
+        
+        if hud.set('health', int(sim.health), 'HEALTH: {}%'.format):
+            self.health_bar.value = sim.health
+        
+        combo = sim.combo_system
+        combo_value = (combo.combo_count, combo.get_combo_multiplier()) if combo.combo_count >= 3 else None
+        hud.set('combo', combo_value, self.format_combo)
+        
+        active_powers = tuple((power_type, int(power_data['timer']))
+                              for power_type, power_data in sim.active_powers.items() if power_data['active'])
+        hud.set('power_status', active_powers, self.format_power_status)
+        
+        speed_mult = speed_multiplier(sim.game_time, sim.difficulty)
+        if sim.active_powers['slow']['active']:
+            speed_mult *= 0.5
+        hud.set('speed', round(speed_mult, 1), 'SPEED: x{:.1f}'.format)
+        
+        hud.set('stats', (sim.bubbles_popped, sim.bubbles_missed), self.format_stats)
+        
+        if self.draw_counter % 10 == 0:
+            hud.set('special_info', self.special_bubble_counts(), self.format_special_info)
+    
+    def format_time(self, value):
+        seconds, paused = value
+        if paused:
+            return f'PAUSED - {seconds}s'
+        return f'TIME: {seconds}s'
+    
+    def format_combo(self, value):
+        if value is None:
+            return ''
+        count, multiplier = value
+        return f'{count}x COMBO! (x{multiplier:.1f})'
+    
+    def format_power_status(self, active_powers):
+        return '\n'.join(f"{REGISTRY.power_up(power_type).name}: {time_left}s"
+                         for power_type, time_left in active_powers)
+    
+    def format_stats(self, value):
+        return 'POPPED: {} | MISSED: {}'.format(*value)
+    
+    def special_bubble_counts(self):
+        special_types = {}
+        for bubble in self.simulation.bubbles:
+            bubble_type = getattr(bubble, 'bubble_type', 'normal')
+            if bubble_type != 'normal':
+                special_types[bubble_type] = special_types.get(bubble_type, 0) + 1
+        return tuple(special_types.items())
+    
+    def format_special_info(self, special_types):
+        if not special_types:
+            return "SPECIAL BUBBLES:\nYellow: 2x Points\nGreen: +10 Health\nBlue: Time Freeze"
+        
+        descriptions = {
+            'double_points': 'Yellow: 2x Points',
+            'health': 'Green: +10 Health',
+            'time_freeze': 'Blue: Time Freeze'
+        }
+        
+        info_text = "ACTIVE SPECIALS:"
+        for bubble_type, count in special_types:
+            description = descriptions.get(bubble_type, bubble_type)
+            info_text += f"\n{description} ({count})"
+        return info_text
+        
+    def on_touch_down(self, touch):
+        with self.profiler.phase('on_touch_down'):
+            return self.handle_touch_down(touch)
+    
+    def handle_touch_down(self, touch):
+        if (self.pause_btn.x <= touch.x <= self.pause_btn.x + self.pause_btn.width and
+            self.pause_btn.y <= touch.y <= self.pause_btn.y + self.pause_btn.height):
+            self.toggle_pause()
+            return True
+            
+        if (self.sound_btn.x <= touch.x <= self.sound_btn.x + self.sound_btn.width and
+            self.sound_btn.y <= touch.y <= self.sound_btn.y + self.sound_btn.height):
+            self.toggle_sound()
+            return True
+            
+        if not self.simulation.accepts_touch(touch.x, touch.y):
+            return False
+        if self.replay_player is not None:
+            return True
+        # Dokunuş bir sonraki sabit adımın başında işlenir
+        self.runner.queue_touch(touch.x, touch.y)
+        return True
+    
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close(self.simulation.tick)
+            print(f"✅ Replay kaydedildi: {self.recorder.path} (seed {self.simulation.seed})")
+            self.recorder = None
+    
+    def export_trace(self):
+        if self.app.trace_path and self.profiler.tracing:
+            count = self.profiler.export_chrome_trace(self.app.trace_path)
+            print(f"✅ Chrome trace yazıldı: {self.app.trace_path} ({count} olay)")
+            self.profiler.tracing = False
+    
+    def game_over(self):
+        Clock.unschedule(self.update)
+        Window.unbind(on_key_down=self.on_key_down)
+        self.pop_voices.flush()
+        self.stop_recording()
+        self.export_trace()
+        
+        sim = self.simulation
+        self.app.game_over(sim.score, int(sim.game_time), sim.bubbles_popped, sim.bubbles_missed, sim.accuracy())
@@ -0,0 +1,163 @@
+﻿from kivy.core.text import Label as CoreLabel
+from kivy.graphics import Color, Rectangle, InstructionGroup
+from kivy.metrics import sp
+
+
+# Atlasa basılan karakterler - HUD metinleri sadece ASCII kullanıyor
+HUD_CHARSET = ''.join(chr(code) for code in range(32, 127))
+GLYPH_GAP = '   '
+
+_atlases = {}
+
+
+class GlyphAtlas:
+    """Bir yazı tipi boyutundaki tüm HUD karakterlerinin tek dokuda önceden basılmış hali.
+
+    Karakterler beyaz basılır, renk Color talimatıyla verilir; böylece aynı boyuttaki tüm
+    alanlar tek dokuyu paylaşır ve metin değişince doku yüklemesi olmaz.
+    """
+    def __init__(self, font_size, bold=True, charset=HUD_CHARSET):
+        # Karakterler arasında boşluk bırakılır ki taşan kısımlar komşu bölgeye girmesin
+        text = GLYPH_GAP.join(charset)
+        label = CoreLabel(text=text, font_size=font_size, bold=bold)
+        label.refresh()
+        self.texture = label.texture
+        self.height = self.texture.height
+
+        self.glyphs = {}
+        for i, char in enumerate(charset):
+            x = label.get_extents(text[:i * (len(GLYPH_GAP) + 1)])[0] if i else 0
+            width = label.get_extents(char)[0]
+            region = self.texture.get_region(x, 0, width, self.height) if char != ' ' else None
+            self.glyphs[char] = (region, width)
+        self.fallback = self.glyphs['?']
+
+    @classmethod
+    def get(cls, font_size, bold=True):
+        """font_size ('18sp' ya da piksel) için paylaşılan atlas"""
+        pixels = int(round(sp(font_size[:-2]) if isinstance(font_size, str) and font_size.endswith('sp') else font_size))
+        key = (pixels, bold)
+        atlas = _atlases.get(key)
+        if atlas is None:
+            atlas = _atlases[key] = cls(pixels, bold)
+        return atlas
+
+    def measure(self, line):
+        glyphs = self.glyphs
+        fallback = self.fallback
+        return sum(glyphs.get(char, fallback)[1] for char in line)
+
+class HudText:
+    """Atlas karakterlerinden dikdörtgenlerle çizilen metin; Rectangle'lar yeniden kullanılır"""
+    def __init__(self, atlas, color, halign='center', valign='middle'):
+        self.atlas = atlas
+        self.halign = halign
+        self.valign = valign
+        self.group = InstructionGroup()
+        self.color = Color(*color)
+        self.group.add(self.color)
+        self.rects = []
+        self.shown = 0
+        self.text = ''
+        self.box = (0, 0, 0, 0)
+
+    def set_box(self, x, y, width, height):
+        box = (x, y, width, height)
+        if box != self.box:
+            self.box = box
+            self.layout()
+
+    def set_text(self, text):
+        if text == self.text:
+            return False
+        self.text = text
+        self.layout()
+        return True
+
+    def _show(self, count):
+        while len(self.rects) < count:
+            self.rects.append(Rectangle())
+        while self.shown < count:
+            self.group.add(self.rects[self.shown])
+            self.shown += 1
+        while self.shown > count:
+            self.shown -= 1
+            self.group.remove(self.rects[self.shown])
+
+    def layout(self):
+        atlas = self.atlas
+        glyphs = atlas.glyphs
+        fallback = atlas.fallback
+        x, y, width, height = self.box
+        line_height = atlas.height
+        lines = self.text.split('\n') if self.text else []
+
+        if self.valign == 'top':
+            top = y + height
+        else:
+            top = y + (height + line_height * len(lines)) / 2
+
+        placed = []
+        for row, line in enumerate(lines):
+            if self.halign == 'left':
+                cursor = x
+            else:
+                cursor = x + (width - atlas.measure(line)) / 2
+            line_y = top - line_height * (row + 1)
+            for char in line:
+                region, advance = glyphs.get(char, fallback)
+                if region is not None:
+                    placed.append((region, cursor, line_y, advance))
+                cursor += advance
+
+        self._show(len(placed))
+        for rect, (region, glyph_x, glyph_y, advance) in zip(self.rects, placed):
+            rect.texture = region
+            rect.pos = (int(glyph_x), int(glyph_y))
+            rect.size = (advance, line_height)
+
+class HudField:
+    __slots__ = ('text', 'value', 'updates', 'skips')
+
+    def __init__(self, text):
+        self.text = text
+        self.value = object()
+        self.updates = 0
+        self.skips = 0
+
+class Hud:
+    """Kirli takipli HUD: bir alan sadece altındaki değer değişince yeniden dizilir.
+
+    Alanlar bir widget'ın kutusuna bağlanır (panel arka planı widget'ta kalır) ve metin
+    paylaşılan GlyphAtlas'lardan çizilir. update_counts() alan başına güncelleme sayısını verir.
+    """
+    def __init__(self):
+        self.group = InstructionGroup()
+        self.fields = {}
+
+    def add(self, name, widget, font_size, color, halign='center', valign='middle'):
+        text = HudText(GlyphAtlas.get(font_size), color, halign, valign)
+        self.group.add(text.group)
+        self.fields[name] = HudField(text)
+
+        def follow(*args):
+            text.set_box(widget.x, widget.y, widget.width, widget.height)
+        widget.bind(pos=follow, size=follow)
+        follow()
+
+    def set(self, name, value, format):
+        """Değer değiştiyse format(value) ile alanı yenile; yenilendiyse True döner"""
+        field = self.fields[name]
+        if value == field.value:
+            field.skips += 1
+            return False
+        field.value = value
+        field.updates += 1
+        field.text.set_text(format(value))
+        return True
+
+    def update_counts(self):
+        return {name: field.updates for name, field in self.fields.items()}
+
+    def total_updates(self):
+        return sum(field.updates for field in self.fields.values())
@@ -0,0 +1,441 @@
+﻿import argparse
+import asyncio
+import collections
+import json
+import math
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Protokol: her istek ve yanıt tek satırlık JSON nesnesi.
+#   {"op": "submit", "cabinet": "k1", "results": [[timestamp, score, game_time, popped, missed, accuracy], ...]}
+#   {"op": "top", "n": 10}
+#   {"op": "percentile", "score": 1200}   -> bu skorun geçtiği oyunların yüzdesi
+#   {"op": "quantile", "p": 90}           -> oyunların p%'inin altında kaldığı skor
+#   {"op": "stats"}
+# Yanıtlar {"ok": true, ...} ya da {"ok": false, "error": "..."}.
+DEFAULT_PORT = 8765
+MAX_LINE = 1 << 20
+# SQLite INTEGER aralığı (işaretli 64 bit)
+INTEGER_MIN = -(1 << 63)
+INTEGER_MAX = (1 << 63) - 1
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    cabinet TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    score INTEGER NOT NULL,
+    game_time INTEGER NOT NULL,
+    bubbles_popped INTEGER NOT NULL,
+    bubbles_missed INTEGER NOT NULL,
+    accuracy REAL NOT NULL,
+    UNIQUE (cabinet, timestamp)
+);
+CREATE INDEX IF NOT EXISTS results_score ON results (score DESC);
+'''
+
+
+class ScoreDatabase:
+    """SQLite skor tablosu - tüm çağrılar aynı iş parçacığından yapılmalı"""
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def insert(self, rows):
+        """rows'u tek işlemde ekle; (cabinet, timestamp) tekrarları (yeniden gönderimler) atlanır"""
+        with self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            return self.connection.total_changes - before
+
+    def top(self, n):
+        cursor = self.connection.execute(
+            'SELECT cabinet, timestamp, score, game_time, accuracy FROM results '
+            'ORDER BY score DESC, timestamp LIMIT ?', (n,))
+        return [dict(zip(('cabinet', 'timestamp', 'score', 'game_time', 'accuracy'), row)) for row in cursor]
+
+    def count(self):
+        return self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def percentile(self, score):
+        total = self.count()
+        if not total:
+            return 0.0
+        below = self.connection.execute('SELECT COUNT(*) FROM results WHERE score < ?', (score,)).fetchone()[0]
+        return below * 100.0 / total
+
+    def quantile(self, p):
+        total = self.count()
+        if not total:
+            return None
+        offset = min(total - 1, int(total * p / 100.0))
+        row = self.connection.execute('SELECT score FROM results ORDER BY score LIMIT 1 OFFSET ?', (offset,)).fetchone()
+        return row[0]
+
+    def close(self):
+        self.connection.close()
+
+def integer_field(value):
+    """İstekteki tamsayı - SQLite'a sığmıyorsa (ya da sonsuzsa) ValueError"""
+    try:
+        value = int(value)
+    except OverflowError:
+        raise ValueError(f"geçersiz tamsayı: {value}") from None
+    if not INTEGER_MIN <= value <= INTEGER_MAX:
+        raise ValueError(f"tamsayı aralık dışında: {value}")
+    return value
+
+def real_field(value):
+    """İstekteki kesirli sayı - NaN ya da sonsuzsa ValueError"""
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"geçersiz sayı: {value}")
+    return value
+
+class LeaderboardServer:
+    """Kabinlerden gelen skorları toplayan asyncio sunucusu.
+
+    Gönderimler bir kuyruğa alınır; yazıcı görev kuyruğu batch_delay kadar biriktirip tek
+    executemany işlemiyle SQLite'a yazar ve ancak o zaman gönderimleri onaylar. Veritabanı
+    çağrıları tek iş parçacıklı bir executor'da çalışır, olay döngüsü beklemez. Sorgu
+    yanıtları yeni yazım olana kadar, yazım sürüyorsa en fazla cache_ttl saniye önbellekten verilir;
+    önbellek en son kullanılan cache_size sorguyu tutar.
+    """
+    def __init__(self, db_path, host='127.0.0.1', port=DEFAULT_PORT, batch_size=500, batch_delay=0.05,
+                 cache_ttl=1.0, cache_size=256):
+        self.db_path = db_path
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='leaderboard-db')
+        self.db = None
+        self.queue = None
+        self.server = None
+        self.writer_task = None
+        # Bağlantı görevi -> yazıcı
+        self.clients = {}
+        # (op, argüman) -> (yazım sürümü, zaman, yanıt); en eski kullanılan başta
+        self.cache = collections.OrderedDict()
+        self.version = 0
+
+        self.received = 0
+        self.inserted = 0
+        self.batches = 0
+        self.cache_hits = 0
+
+    async def _db(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def start(self):
+        self.db = await self._db(ScoreDatabase, self.db_path)
+        self.queue = asyncio.Queue()
+        self.writer_task = asyncio.create_task(self._write_batches())
+        self.server = await asyncio.start_server(self._serve, self.host, self.port, limit=MAX_LINE)
+        # port=0 ile açıldıysa işletim sisteminin verdiği port
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        # Açık bağlantıları da kapat - görevler okuma hatasıyla kendiliğinden biter
+        if self.clients:
+            for writer in self.clients.values():
+                writer.close()
+            await asyncio.wait(list(self.clients), timeout=1.0)
+        if self.writer_task is not None:
+            self.writer_task.cancel()
+        if self.db is not None:
+            await self._db(self.db.close)
+        self.executor.shutdown()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"✅ Skor sunucusu dinliyor: {self.host}:{self.port} ({self.db_path})")
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def _serve(self, reader, writer):
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Satır MAX_LINE'ı aştı - satır sınırı kaybedildi, hatayı bildirip bağlantıyı kapat
+                    writer.write(json.dumps({'ok': False, 'error': f"istek {MAX_LINE} baytı aşıyor"}).encode() + b'\n')
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    response = await self.handle(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.clients.pop(task, None)
+            writer.close()
+
+    async def handle(self, request):
+        op = request['op']
+        if op == 'submit':
+            cabinet = str(request['cabinet'])
+            rows = [(cabinet, real_field(timestamp), integer_field(score), integer_field(game_time),
+                     integer_field(popped), integer_field(missed), real_field(accuracy))
+                    for timestamp, score, game_time, popped, missed, accuracy in request['results']]
+            done = asyncio.get_running_loop().create_future()
+            self.received += len(rows)
+            await self.queue.put((rows, done))
+            # Yanıt, satırlar veritabanına yazıldıktan sonra gider
+            await done
+            return {'ok': True, 'accepted': len(rows)}
+        if op == 'top':
+            return await self._cached(op, integer_field(request.get('n', 10)), self.db.top)
+        if op == 'percentile':
+            return await self._cached(op, real_field(request['score']), self.db.percentile)
+        if op == 'quantile':
+            return await self._cached(op, real_field(request['p']), self.db.quantile)
+        if op == 'stats':
+            return {'ok': True, 'received': self.received, 'inserted': self.inserted,
+                    'batches': self.batches, 'cache_hits': self.cache_hits,
+                    'games': await self._db(self.db.count)}
+        raise ValueError(f"bilinmeyen işlem: {op}")
+
+    async def _cached(self, op, argument, query):
+        key = (op, argument)
+        entry = self.cache.get(key)
+        now = time.monotonic()
+        if entry is not None and (entry[0] == self.version or now - entry[1] < self.cache_ttl):
+            self.cache_hits += 1
+            self.cache.move_to_end(key)
+            return entry[2]
+        response = {'ok': True, 'result': await self._db(query, argument)}
+        self.cache[key] = (self.version, now, response)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return response
+
+    async def _write_batches(self):
+        while True:
+            pending = [await self.queue.get()]
+            # Aynı anda gelen gönderimler tek işlemde yazılsın
+            await asyncio.sleep(self.batch_delay)
+            count = len(pending[0][0])
+            while not self.queue.empty() and count < self.batch_size:
+                pending.append(self.queue.get_nowait())
+                count += len(pending[-1][0])
+
+            rows = [row for batch, _ in pending for row in batch]
+            try:
+                inserted = await self._db(self.db.insert, rows)
+            except Exception as e:
+                # Sadece bu paketin gönderimleri hata alır, yazıcı çalışmaya devam eder
+                for _, done in pending:
+                    if not done.done():
+                        done.set_exception(ValueError(f"veritabanı hatası: {e}"))
+                continue
+            self.inserted += inserted
+            self.batches += 1
+            self.version += 1
+            for _, done in pending:
+                if not done.done():
+                    done.set_result(None)
+
+class SubmitRejected(Exception):
+    """Sunucu gönderimi ok: false ile reddetti - yeniden denemek sonucu değiştirmez"""
+
+class ScoreUploader:
+    """Biten oyunları skor sunucusuna arka plan iş parçacığında gönderir.
+
+    submit() sadece kuyruğa ekler, oyun döngüsünü hiç bekletmez. Sonuçlar batch_size'lık
+    paketlerle, en geç flush_interval saniyede bir gönderilir; bağlantı hatasında paket
+    kuyruğun başına geri konur ve artan aralıklarla (en fazla max_backoff s) yeniden denenir.
+    Sunucunun reddettiği paket (geçersiz sonuç, veritabanı hatası) atılır ve rejected'a sayılır.
+    Kuyruk max_pending'i aşarsa en eski sonuçlar atılır (dropped). Sunucu aynı (kabin, zaman)
+    çiftini bir kez yazdığı için yeniden gönderimler tekrar kayıt oluşturmaz.
+    """
+    def __init__(self, host, port, cabinet, batch_size=50, flush_interval=1.0, max_pending=10000,
+                 timeout=5.0, max_backoff=30.0):
+        self.address = (host, port)
+        self.cabinet = cabinet
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+
+        self.pending = collections.deque()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        # Yeniden deneme beklemesi bu olayda yapılır - submit()'in wakeup'ı bekleme süresini kısaltmasın
+        self.closing = threading.Event()
+        self.connection = None
+
+        self.sent = 0
+        self.dropped = 0
+        self.retries = 0
+        self.rejected = 0
+        # Gönderilmekte olan paketteki sonuç sayısı (kuyruktan alınmış ama onaylanmamış)
+        self.in_flight = 0
+
+        self.thread = threading.Thread(target=self._run, name='score-uploader', daemon=True)
+        self.thread.start()
+
+    def submit(self, result):
+        """result: score_store.GameResult ya da aynı sırada alanlar"""
+        with self.lock:
+            self._push([list(result)])
+            full = len(self.pending) >= self.batch_size
+        if full:
+            self.wakeup.set()
+
+    def _push(self, results, front=False):
+        if front:
+            self.pending.extendleft(reversed(results))
+        else:
+            self.pending.extend(results)
+        while len(self.pending) > self.max_pending:
+            self.pending.popleft()
+            self.dropped += 1
+
+    def _run(self):
+        backoff = 0.5
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            while True:
+                with self.lock:
+                    batch = [self.pending.popleft() for _ in range(min(self.batch_size, len(self.pending)))]
+                    self.in_flight = len(batch)
+                if not batch:
+                    break
+                try:
+                    self._send(batch)
+                    self.sent += len(batch)
+                    self.in_flight = 0
+                    backoff = 0.5
+                except SubmitRejected as e:
+                    # Bağlantı sağlam, paket sunucuya ulaştı - kuyruğu tıkamasın
+                    print(f"❌ {len(batch)} skor sunucu tarafından reddedildi: {e}")
+                    self.rejected += len(batch)
+                    self.in_flight = 0
+                except OSError:
+                    self._disconnect()
+                    with self.lock:
+                        self._push(batch, front=True)
+                        self.in_flight = 0
+                    self.retries += 1
+                    if self.closing.is_set():
+                        return
+                    self.closing.wait(backoff)
+                    backoff = min(backoff * 2, self.max_backoff)
+            if self.closing.is_set():
+                self._disconnect()
+                return
+
+    def _send(self, batch):
+        if self.connection is None:
+            sock = socket.create_connection(self.address, timeout=self.timeout)
+            self.connection = sock.makefile('rwb')
+            sock.close()
+        request = {'op': 'submit', 'cabinet': self.cabinet, 'results': batch}
+        self.connection.write(json.dumps(request).encode() + b'\n')
+        self.connection.flush()
+        line = self.connection.readline()
+        if not line:
+            raise ConnectionError("sunucu bağlantıyı kapattı")
+        try:
+            response = json.loads(line)
+        except ValueError:
+            # Bozuk yanıt - bağlantı hatası gibi yeniden bağlanılıp denenir
+            raise ConnectionError("sunucudan geçersiz yanıt") from None
+        if not response.get('ok'):
+            raise SubmitRejected(response.get('error', 'gönderim reddedildi'))
+
+    def _disconnect(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except OSError:
+                pass
+            self.connection = None
+
+    def close(self, timeout=1.0):
+        """Kalanları göndermeyi bir kez dene ve iş parçacığını durdur; gönderilemeyen sonuç sayısını döndür"""
+        self.closing.set()
+        self.wakeup.set()
+        self.thread.join(timeout)
+        with self.lock:
+            unsent = len(self.pending) + self.in_flight
+        if unsent:
+            print(f"❌ {unsent} skor sunucuya gönderilemedi")
+        return unsent
+
+    def stats(self):
+        return {'pending': len(self.pending), 'sent': self.sent, 'dropped': self.dropped,
+                'retries': self.retries, 'rejected': self.rejected}
+
+def query(host, port, request, timeout=5.0):
+    """Sunucuya tek istek gönder ve yanıtı döndür"""
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        connection = sock.makefile('rwb')
+        connection.write(json.dumps(request).encode() + b'\n')
+        connection.flush()
+        return json.loads(connection.readline())
+
+def parse_address(address):
+    """'host:port' ya da 'port' -> (host, port)"""
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bubble Pop kabinleri için yerel skor sunucusu")
+    parser.add_argument('--address', default=f'127.0.0.1:{DEFAULT_PORT}', help="host:port")
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help="sunucuyu başlat")
+    serve.add_argument('--db', default='leaderboard.db', help="SQLite veritabanı dosyası")
+    top = commands.add_parser('top', help="en yüksek skorlar")
+    top.add_argument('-n', type=int, default=10)
+    percentile = commands.add_parser('percentile', help="skorun yüzdelik dilimi")
+    percentile.add_argument('score', type=float)
+    quantile = commands.add_parser('quantile', help="yüzdelik dilimin skoru")
+    quantile.add_argument('p', type=float)
+    commands.add_parser('stats', help="sunucu sayaçları")
+    args = parser.parse_args(argv)
+
+    host, port = parse_address(args.address)
+    if args.command == 'serve':
+        try:
+            asyncio.run(LeaderboardServer(args.db, host, port).serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return
+
+    request = {'op': args.command}
+    if args.command == 'top':
+        request['n'] = args.n
+    elif args.command == 'percentile':
+        request['score'] = args.score
+    elif args.command == 'quantile':
+        request['p'] = args.p
+    print(json.dumps(query(host, port, request), indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+﻿from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ParticlePool:
+    """Sabit kapasiteli parçacık havuzu.
+
+    Konum, hız, yarıçap, ömür ve renk paralel dizilerde tutulur; boş slotlar yeniden
+    kullanılır, havuz (ya da limit) doluysa en eski parçacık çalınır. Çalma pahalı olduğu için
+    üreticiler önce available() ile yer olup olmadığına bakar. NumPy varsa güncelleme vektörel
+    ve ara bellek ayırmadan yapılır, yoksa aynı diziler üzerinde düz döngü çalışır.
+    """
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        # Aynı anda canlı parçacık üst sınırı - kalite düşünce küçültülür
+        self.limit = capacity
+        self.active_count = 0
+        self.emitted = 0
+        self.stolen = 0
+
+        if np is not None:
+            def make(value=0.0):
+                return np.full(capacity, value)
+            self.active = np.zeros(capacity, dtype=bool)
+            self.birth = np.zeros(capacity, dtype=np.int64)
+            self._scratch = np.zeros(capacity)
+            self._dead = np.zeros(capacity, dtype=bool)
+        else:
+            def make(value=0.0):
+                return array('d', [value]) * capacity
+            self.active = [False] * capacity
+            self.birth = [0] * capacity
+
+        self.x = make()
+        self.y = make()
+        self.prev_x = make()
+        self.prev_y = make()
+        self.vx = make()
+        self.vy = make()
+        self.radius = make()
+        self.original_radius = make()
+        self.lifetime = make()
+        self.max_lifetime = make(1.0)
+        # Taban renk ve çizimde kullanılan güncel alfa
+        self.r = make()
+        self.g = make()
+        self.b = make()
+        self.base_alpha = make()
+        self.alpha = make()
+
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return self.active_count
+
+    def clear(self):
+        for i in range(self.capacity):
+            self.active[i] = False
+        self._free = list(range(self.capacity - 1, -1, -1))
+        self.active_count = 0
+
+    def available(self):
+        """Çalmadan kullanılabilecek slot sayısı"""
+        return min(len(self._free), self.limit - self.active_count)
+
+    def _take_slot(self):
+        if self._free and self.active_count < self.limit:
+            self.active_count += 1
+            return self._free.pop()
+        # Havuz dolu - en eski canlı parçacığın yerini al
+        self.stolen += 1
+        if np is not None:
+            if self._free:
+                return int(np.argmin(np.where(self.active, self.birth, np.iinfo(np.int64).max)))
+            return int(np.argmin(self.birth))
+        return min((i for i in range(self.capacity) if self.active[i]), key=self.birth.__getitem__)
+
+    def emit(self, x, y, vx, vy, radius, lifetime, color):
+        i = self._take_slot()
+        self.emitted += 1
+        self.active[i] = True
+        self.birth[i] = self.emitted
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_x[i] = x
+        self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.radius[i] = radius
+        self.original_radius[i] = radius
+        self.lifetime[i] = lifetime
+        self.max_lifetime[i] = lifetime
+        self.r[i], self.g[i], self.b[i], self.base_alpha[i] = color
+        self.alpha[i] = color[3]
+        return i
+
+    def active_indices(self):
+        if np is not None:
+            return np.flatnonzero(self.active)
+        return [i for i in range(self.capacity) if self.active[i]]
+
+    def save_positions(self):
+        """Enterpolasyon için güncel konumları önceki konum olarak sakla"""
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+
+    def update(self, dt):
+        if self.active_count == 0:
+            return
+        if np is not None:
+            self._update_vectorized(dt)
+        else:
+            self._update_loop(dt)
+
+    def _update_vectorized(self, dt):
+        scratch = self._scratch
+        damping = 0.98
+
+        # Ölü slotlar da hesaplanır ama hiç okunmaz; maskeleme maliyetinden ucuz
+        np.multiply(self.vx, dt, out=scratch)
+        self.x += scratch
+        np.multiply(self.vy, dt, out=scratch)
+        self.y += scratch
+        self.lifetime -= dt
+
+        self.vy -= 100 * dt
+        self.vx *= damping
+        self.vy *= damping
+
+        # fade = lifetime / max_lifetime
+        np.divide(self.lifetime, self.max_lifetime, out=scratch)
+        np.multiply(self.base_alpha, scratch, out=self.alpha)
+        scratch *= 0.5
+        scratch += 0.5
+        np.multiply(self.original_radius, scratch, out=self.radius)
+
+        dead = self._dead
+        np.less_equal(self.lifetime, 0, out=dead)
+        dead &= self.active
+        if dead.any():
+            expired = np.flatnonzero(dead)
+            self.active[expired] = False
+            self._free.extend(expired.tolist())
+            self.active_count -= len(expired)
+
+    def _update_loop(self, dt):
+        damping = 0.98
+        for i in range(self.capacity):
+            if not self.active[i]:
+                continue
+            self.x[i] += self.vx[i] * dt
+            self.y[i] += self.vy[i] * dt
+            self.lifetime[i] -= dt
+
+            self.vy[i] -= 100 * dt
+            self.vx[i] *= damping
+            self.vy[i] *= damping
+
+            fade = self.lifetime[i] / self.max_lifetime[i]
+            self.alpha[i] = self.base_alpha[i] * fade
+            self.radius[i] = self.original_radius[i] * (0.5 + 0.5 * fade)
+
+            if self.lifetime[i] <= 0:
+                self.active[i] = False
+                self._free.append(i)
+                self.active_count -= 1
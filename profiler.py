@@ -0,0 +1,168 @@
+﻿import json
+from collections import deque
+from time import perf_counter
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_PHASE = _NullPhase()
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.start, perf_counter())
+        return False
+
+class NullProfiler:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan profiler"""
+    enabled = False
+
+    def phase(self, name):
+        return NULL_PHASE
+
+    def begin_frame(self):
+        pass
+
+    def end_frame(self, **counters):
+        pass
+
+NULL_PROFILER = NullProfiler()
+
+class FrameProfiler:
+    """Kare aşamalarının süresini ölçer.
+
+    Her aşama `with profiler.phase('bubbles'):` ile sarılır. Bir kare içindeki süreler
+    aşama başına toplanır ve son `history` karelik kayan pencerede tutulur. tracing açıksa
+    her aşama ayrıca Chrome trace-event olarak saklanır ve export_chrome_trace ile yazılır.
+    """
+    def __init__(self, history=240, enabled=True, tracing=False, max_events=500000):
+        self.enabled = enabled
+        self.tracing = tracing
+        self.history = history
+
+        self.frame_times = deque(maxlen=history)
+        self.phase_times = {}
+        self.current = {}
+        self.counters = {}
+        self.frames = 0
+
+        self.events = deque(maxlen=max_events)
+        self.origin = perf_counter()
+        self.frame_start = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return NULL_PHASE
+        return _Phase(self, name)
+
+    def record(self, name, start, end):
+        self.current[name] = self.current.get(name, 0.0) + (end - start)
+        if self.tracing:
+            self.events.append(('X', name, start, end))
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = perf_counter()
+
+    def end_frame(self, **counters):
+        """Kareyi kapat; counters (balon, parçacık sayısı vb.) son değer olarak saklanır"""
+        if not self.enabled or self.frame_start is None:
+            return
+        end = perf_counter()
+        self.frames += 1
+        self.frame_times.append(end - self.frame_start)
+
+        current = self.current
+        for name in current:
+            if name not in self.phase_times:
+                self.phase_times[name] = deque([0.0] * (len(self.frame_times) - 1), maxlen=self.history)
+        for name, times in self.phase_times.items():
+            times.append(current.get(name, 0.0))
+        current.clear()
+
+        self.counters = counters
+        if self.tracing:
+            self.events.append(('X', 'frame', self.frame_start, end))
+            if counters:
+                self.events.append(('C', 'entities', end, counters))
+        self.frame_start = None
+
+    def stats(self, name=None):
+        """Kayan penceredeki ortalama ve en büyük süre (ms); name None ise tüm kare"""
+        times = self.frame_times if name is None else self.phase_times.get(name, ())
+        if not times:
+            return 0.0, 0.0
+        return sum(times) / len(times) * 1000, max(times) * 1000
+
+    def reset(self):
+        self.frame_times.clear()
+        self.phase_times.clear()
+        self.current.clear()
+        self.events.clear()
+
+    def chrome_trace_events(self):
+        origin = self.origin
+        trace = []
+        for kind, name, start, data in self.events:
+            timestamp = (start - origin) * 1e6
+            if kind == 'X':
+                trace.append({'name': name, 'cat': 'frame', 'ph': 'X', 'ts': timestamp,
+                              'dur': (data - start) * 1e6, 'pid': 1, 'tid': 1})
+            else:
+                trace.append({'name': name, 'ph': 'C', 'ts': timestamp, 'pid': 1, 'args': data})
+        # Dış aşamalar iç aşamalardan önce bitiyor; görüntüleyiciler başlangıca göre sıralı bekler
+        trace.sort(key=lambda event: (event['ts'], -event.get('dur', 0)))
+        return trace
+
+    def export_chrome_trace(self, path):
+        """chrome://tracing ya da Perfetto ile açılabilen JSON dosyası yaz"""
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.chrome_trace_events(), 'displayTimeUnit': 'ms'}, f)
+        return len(self.events)
+
+class StartupProfile:
+    """Soğuk başlangıç aşamaları: her mark() bir önceki işaretten bu yana geçen süreyi kaydeder.
+
+    Paralel işler (örn. arka planda yüklenen varlıklar) record() ile başlangıç ve bitiş
+    zamanlarıyla ayrıca eklenir. Tüm zamanlar origin'e (profilin oluşturulduğu an) göredir.
+    """
+    def __init__(self):
+        self.origin = perf_counter()
+        self.last = self.origin
+        self.phases = []
+        self.background = []
+
+    def mark(self, name):
+        now = perf_counter()
+        self.phases.append((name, self.last, now))
+        self.last = now
+        return now
+
+    def record(self, name, start, end):
+        self.background.append((name, start, end))
+
+    def report(self):
+        origin = self.origin
+        lines = ['Başlangıç profili        ms     bitiş (ms)']
+        for name, start, end in self.phases:
+            lines.append(f'  {name:<20} {(end - start) * 1000:7.1f} {(end - origin) * 1000:9.1f}')
+        for name, start, end in self.background:
+            lines.append(f'  ~ {name:<18} {(end - start) * 1000:7.1f} {(end - origin) * 1000:9.1f}')
+        lines.append(f'  {"toplam":<20} {(self.last - origin) * 1000:7.1f}')
+        return '\n'.join(lines)
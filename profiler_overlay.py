@@ -0,0 +1,80 @@
+﻿from kivy.uix.widget import Widget
+from kivy.uix.label import Label
+from kivy.graphics import Color, Rectangle, Line
+from kivy.clock import Clock
+
+
+# Grafikte çizilen aşamalar ve renkleri - 'frame' tüm karenin süresi
+GRAPH_PHASES = (
+    ('frame', (1, 1, 1, 0.9)),
+    ('simulation', (0.3, 0.8, 1, 0.9)),
+    ('draw_game', (1, 0.6, 0.2, 0.9)),
+    ('update_labels', (0.9, 0.3, 0.9, 0.9)),
+)
+GRAPH_SCALE_MS = 50.0
+GRAPH_HEIGHT = 90
+
+class ProfilerOverlay(Widget):
+    """FrameProfiler'ın kayan kare süresi grafiği ve aşama/nesne sayıları (F3 ile açılır)"""
+    def __init__(self, profiler, target_fps=30, **kwargs):
+        super().__init__(size_hint=(None, None), size=(320, 300), **kwargs)
+        self.profiler = profiler
+        self.budget_ms = 1000.0 / target_fps
+        self.frame = 0
+
+        with self.canvas:
+            Color(0, 0, 0, 0.7)
+            self.background = Rectangle()
+            Color(1, 0.2, 0.2, 0.6)
+            self.budget_line = Line(width=1)
+            self.graph_lines = []
+            for name, color in GRAPH_PHASES:
+                Color(*color)
+                self.graph_lines.append((name, Line(width=1.2)))
+
+        self.label = Label(font_size='11sp', halign='left', valign='top', markup=False,
+                           size_hint=(None, None))
+        self.add_widget(self.label)
+        self.bind(pos=self.layout, size=self.layout)
+        self.layout()
+
+    def layout(self, *args):
+        x, y = self.pos
+        width, height = self.size
+        self.background.pos = self.pos
+        self.background.size = self.size
+        budget_y = y + min(1.0, self.budget_ms / GRAPH_SCALE_MS) * GRAPH_HEIGHT
+        self.budget_line.points = [x, budget_y, x + width, budget_y]
+        self.label.pos = (x + 8, y + GRAPH_HEIGHT + 4)
+        self.label.size = (width - 16, height - GRAPH_HEIGHT - 8)
+        self.label.text_size = self.label.size
+
+    def refresh(self, counters):
+        """Her kare çağrılır: grafik her kare, metin 10 karede bir güncellenir"""
+        self.frame += 1
+        profiler = self.profiler
+        x, y = self.pos
+        width = self.width
+        step = width / max(1, profiler.history - 1)
+        scale = GRAPH_HEIGHT / GRAPH_SCALE_MS
+
+        for name, line in self.graph_lines:
+            times = profiler.frame_times if name == 'frame' else profiler.phase_times.get(name, ())
+            points = []
+            for i, seconds in enumerate(times):
+                points.append(x + i * step)
+                points.append(y + min(GRAPH_HEIGHT, seconds * 1000 * scale))
+            line.points = points
+
+        if self.frame % 10 != 1:
+            return
+
+        frame_mean, frame_max = profiler.stats()
+        lines = [f'FPS {Clock.get_fps():.1f}   frame {frame_mean:.2f} / {frame_max:.2f} ms',
+                 'phase          avg / max ms']
+        for name in profiler.phase_times:
+            mean, peak = profiler.stats(name)
+            lines.append(f'{name:<14} {mean:.2f} / {peak:.2f}')
+        lines.append('')
+        lines.append('   '.join(f'{name} {value}' for name, value in counters.items()))
+        self.label.text = '\n'.join(lines)
@@ -0,0 +1,84 @@
+﻿from collections import deque, namedtuple
+
+
+# detail_every: her kaçıncı balona iç daire + parlama çizileceği (0 = hiçbirine)
+QualityTier = namedtuple('QualityTier', (
+    'name', 'detail_every', 'glows', 'particle_halos', 'power_up_rings', 'particle_fraction'
+))
+
+QUALITY_TIERS = (
+    QualityTier('ultra', 1, True, True, True, 1.0),
+    QualityTier('high', 3, True, True, True, 1.0),
+    QualityTier('medium', 0, True, False, True, 0.5),
+    QualityTier('low', 0, False, False, False, 0.25),
+)
+QUALITY_TIER_NAMES = tuple(tier.name for tier in QUALITY_TIERS)
+DEFAULT_TIER = QUALITY_TIER_NAMES.index('high')
+
+def tier_index(name):
+    return QUALITY_TIER_NAMES.index(name)
+
+class QualityController:
+    """Son karelerin süresini hedef bütçeyle karşılaştırıp çizim kalitesini ayarlar.
+
+    Karelerin aralığı bütçeyi aşıyorsa ya da kare işi bütçenin büyük kısmını yiyorsa bir
+    kademe düşülür; iş bütçenin yarısının altında uzun süre kalırsa bir kademe çıkılır.
+    Düşme ve çıkma eşikleri farklıdır ve her değişiklikten sonra bekleme süresi vardır,
+    böylece kalite iki kademe arasında gidip gelmez.
+    """
+    def __init__(self, target_fps=30, tier=DEFAULT_TIER, window=30, cooldown=45,
+                 upgrade_windows=4, adaptive=True):
+        self.budget = 1.0 / target_fps
+        self.index = tier
+        self.adaptive = adaptive
+        self.cooldown = cooldown
+        self.upgrade_windows = upgrade_windows
+
+        self.intervals = deque(maxlen=window)
+        self.work_times = deque(maxlen=window)
+        self.frames_since_change = 0
+        self.good_windows = 0
+        self.changes = 0
+
+    @property
+    def tier(self):
+        return QUALITY_TIERS[self.index]
+
+    def set_tier(self, index):
+        index = max(0, min(len(QUALITY_TIERS) - 1, index))
+        if index == self.index:
+            return False
+        self.index = index
+        self.changes += 1
+        self.frames_since_change = 0
+        self.good_windows = 0
+        self.intervals.clear()
+        self.work_times.clear()
+        return True
+
+    def record(self, interval, work_time):
+        """Bir karenin aralığını ve iş süresini kaydet; kademe değiştiyse True döner"""
+        if not self.adaptive:
+            return False
+        self.frames_since_change += 1
+        self.intervals.append(interval)
+        self.work_times.append(work_time)
+        if len(self.intervals) < self.intervals.maxlen or self.frames_since_change < self.cooldown:
+            return False
+
+        budget = self.budget
+        mean_interval = sum(self.intervals) / len(self.intervals)
+        mean_work = sum(self.work_times) / len(self.work_times)
+
+        if mean_interval > budget * 1.15 or mean_work > budget * 0.85:
+            return self.set_tier(self.index + 1)
+
+        if mean_interval <= budget * 1.05 and mean_work < budget * 0.5:
+            # Pencere dolunca sayılır; art arda birkaç iyi pencere gerekir
+            if self.frames_since_change % self.intervals.maxlen == 0:
+                self.good_windows += 1
+                if self.good_windows >= self.upgrade_windows:
+                    return self.set_tier(self.index - 1)
+        else:
+            self.good_windows = 0
+        return False
@@ -0,0 +1,597 @@
+﻿from kivy.graphics import Color, Ellipse, Rectangle, Line, InstructionGroup, Mesh, RenderContext
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from quality import QUALITY_TIERS, DEFAULT_TIER
+from type_registry import BUBBLE_KINDS
+
+
+SPECIAL_GLOW_COLORS = {kind.key: kind.glow_color for kind in BUBBLE_KINDS if kind.glow_color is not None}
+
+BUBBLE_SEGMENTS = 48
+PARTICLE_SEGMENTS = 16
+BATCH_BUBBLE_SEGMENTS = 32
+
+# Köşe başına renkli Mesh için shader - varsayılan Kivy shader'ı sadece tek renk destekliyor
+BATCH_VERTEX_FORMAT = [(b'vPosition', 2, 'float'), (b'vColor', 4, 'float')]
+
+BATCH_VERTEX_SHADER = """
+#ifdef GL_ES
+    precision highp float;
+#endif
+
+attribute vec2 vPosition;
+attribute vec4 vColor;
+
+uniform mat4 modelview_mat;
+uniform mat4 projection_mat;
+
+varying vec4 frag_color;
+
+void main(void) {
+    frag_color = vColor;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition, 0.0, 1.0);
+}
+"""
+
+BATCH_FRAGMENT_SHADER = """
+#ifdef GL_ES
+    precision highp float;
+#endif
+
+varying vec4 frag_color;
+
+void main(void) {
+    gl_FragColor = frag_color;
+}
+"""
+
+class BubbleSprite:
+    def __init__(self, bubble_type):
+        self.group = InstructionGroup()
+        self.detail = InstructionGroup()
+        self.visible = False
+        self.detailed = False
+        self.seen = 0
+
+        glow_rgb = SPECIAL_GLOW_COLORS.get(bubble_type)
+        if glow_rgb is not None:
+            self.glow_group = InstructionGroup()
+            self.glow_color = Color(*glow_rgb, 0)
+            self.glow = Ellipse(segments=BUBBLE_SEGMENTS)
+            self.glow_group.add(self.glow_color)
+            self.glow_group.add(self.glow)
+            self.group.add(self.glow_group)
+        else:
+            self.glow = None
+        self.glow_shown = True
+
+        self.body_color = Color(1, 1, 1, 0)
+        self.body = Ellipse(segments=BUBBLE_SEGMENTS)
+        self.group.add(self.body_color)
+        self.group.add(self.body)
+
+        self.inner_color = Color(1, 1, 1, 0)
+        self.inner = Ellipse(segments=BUBBLE_SEGMENTS)
+        self.highlight_color = Color(1, 1, 1, 0)
+        self.highlight = Ellipse(segments=BUBBLE_SEGMENTS)
+        self.detail.add(self.inner_color)
+        self.detail.add(self.inner)
+        self.detail.add(self.highlight_color)
+        self.detail.add(self.highlight)
+
+    def update(self, bubble, x, y, detailed, alpha_multiplier, glow=True):
+        radius = bubble.radius
+        red, green, blue, color_alpha = bubble.color
+        alpha = bubble.alpha * color_alpha * alpha_multiplier
+
+        if self.glow is not None and glow != self.glow_shown:
+            if glow:
+                self.group.insert(0, self.glow_group)
+            else:
+                self.group.remove(self.glow_group)
+            self.glow_shown = glow
+
+        if self.glow is not None and glow:
+            glow_radius = radius * 2.2
+            self.glow_color.a = 0.4 * (0.7 + 0.3 * math.sin(bubble.life_time * 5.0))
+            self.glow.pos = (x - glow_radius, y - glow_radius)
+            self.glow.size = (glow_radius * 2, glow_radius * 2)
+
+        self.body_color.rgba = (red, green, blue, alpha)
+        self.body.pos = (x - radius, y - radius)
+        self.body.size = (radius * 2, radius * 2)
+
+        if detailed != self.detailed:
+            if detailed:
+                self.group.add(self.detail)
+            else:
+                self.group.remove(self.detail)
+            self.detailed = detailed
+
+        if detailed:
+            self.inner_color.rgba = (red, green, blue, alpha * 0.6)
+            self.inner.pos = (x - radius * 0.8, y - radius * 0.8)
+            self.inner.size = (radius * 1.6, radius * 1.6)
+
+            self.highlight_color.a = bubble.alpha * 0.7 * alpha_multiplier
+            highlight_size = radius * 0.5
+            highlight_x = x - radius * 0.3
+            highlight_y = y + radius * 0.2
+            self.highlight.pos = (highlight_x - highlight_size/2, highlight_y - highlight_size/2)
+            self.highlight.size = (highlight_size, highlight_size)
+
+class PowerUpSprite:
+    def __init__(self, color):
+        self.group = InstructionGroup()
+        self.visible = False
+        self.seen = 0
+
+        self.glow_color = Color(*color[:3], 0)
+        self.glow = Ellipse(segments=BUBBLE_SEGMENTS)
+        self.body_color = Color(*color)
+        self.body = Ellipse(segments=BUBBLE_SEGMENTS)
+        self.ring_group = InstructionGroup()
+        self.ring_color = Color(*color[:3], 0.8)
+        self.ring = Line(width=4)
+        for instruction in (self.glow_color, self.glow, self.body_color, self.body):
+            self.group.add(instruction)
+        self.ring_group.add(self.ring_color)
+        self.ring_group.add(self.ring)
+        self.group.add(self.ring_group)
+        self.ring_shown = True
+
+    def update(self, power_up, x, y, ring=True):
+        radius = power_up.radius
+        if ring != self.ring_shown:
+            if ring:
+                self.group.add(self.ring_group)
+            else:
+                self.group.remove(self.ring_group)
+            self.ring_shown = ring
+
+        glow_size = radius * 2.5
+        self.glow_color.a = 0.3 + 0.2 * math.sin(power_up.life_time * 4.0)
+        self.glow.pos = (x - glow_size, y - glow_size)
+        self.glow.size = (glow_size * 2, glow_size * 2)
+
+        self.body.pos = (x - radius, y - radius)
+        self.body.size = (radius * 2, radius * 2)
+
+        if ring:
+            ring_size = radius * (1.5 + 0.3 * math.sin(power_up.life_time * 6.0))
+            self.ring.circle = (x, y, ring_size)
+
+class ParticleSprite:
+    def __init__(self):
+        self.group = InstructionGroup()
+        self.visible = False
+
+        self.halo_group = InstructionGroup()
+        self.glow_color = Color(1, 1, 1, 0)
+        self.glow = Ellipse(segments=PARTICLE_SEGMENTS)
+        self.core_color = Color(1, 1, 1, 0)
+        self.core = Ellipse(segments=PARTICLE_SEGMENTS)
+        self.halo_group.add(self.glow_color)
+        self.halo_group.add(self.glow)
+        self.group.add(self.halo_group)
+        self.group.add(self.core_color)
+        self.group.add(self.core)
+        self.halo_shown = True
+
+    def update(self, x, y, radius, red, green, blue, alpha, halo=True):
+        if halo != self.halo_shown:
+            if halo:
+                self.group.insert(0, self.halo_group)
+            else:
+                self.group.remove(self.halo_group)
+            self.halo_shown = halo
+
+        if halo:
+            glow_radius = radius * 1.5
+            self.glow_color.rgba = (red, green, blue, alpha * 0.3)
+            self.glow.pos = (x - glow_radius, y - glow_radius)
+            self.glow.size = (glow_radius * 2, glow_radius * 2)
+
+        self.core_color.rgba = (red, green, blue, alpha)
+        self.core.pos = (x - radius, y - radius)
+        self.core.size = (radius * 2, radius * 2)
+
+class CircleBatch:
+    """Çok sayıda dolu daireyi bir (ya da birkaç) Mesh içinde tek seferde çizer.
+
+    Her daire merkez + kenar köşelerinden oluşan bir üçgen yelpazesidir. Köşe ve indeks
+    tamponları kareler arasında yeniden kullanılır; 16 bit indeks sınırı aşılınca yeni bir
+    Mesh parçası eklenir, böylece draw call sayısı varlık sayısından bağımsız kalır.
+    """
+    def __init__(self, segments):
+        self.segments = segments
+        self.verts_per_circle = segments + 1
+        self.max_circles = 65535 // self.verts_per_circle
+
+        self.group = RenderContext(use_parent_projection=True, use_parent_modelview=True)
+        # Önce fs: varsayılan vs ile de link edilebilir, sonra vs değişince ikisi eşleşir
+        self.group.shader.fs = BATCH_FRAGMENT_SHADER
+        self.group.shader.vs = BATCH_VERTEX_SHADER
+        self.meshes = []
+
+        angles = np.linspace(0, 2 * math.pi, segments, endpoint=False)
+        self.unit_cos = np.cos(angles).astype(np.float32)
+        self.unit_sin = np.sin(angles).astype(np.float32)
+
+        self.vertices = np.zeros((0, self.verts_per_circle, 6), dtype=np.float32)
+
+        # Tek bir Mesh parçası için sabit indeks şablonu
+        center = np.arange(self.max_circles, dtype=np.uint16)[:, None] * self.verts_per_circle
+        rim = np.arange(segments, dtype=np.uint16)
+        triangles = np.empty((self.max_circles, segments, 3), dtype=np.uint16)
+        triangles[:, :, 0] = center
+        triangles[:, :, 1] = center + 1 + rim
+        triangles[:, :, 2] = center + 1 + (rim + 1) % segments
+        self.indices = triangles.reshape(-1)
+        self.circle_count = 0
+
+    @property
+    def draw_calls(self):
+        return sum(1 for mesh in self.meshes if len(mesh.indices))
+
+    def _reserve(self, count):
+        if count > len(self.vertices):
+            capacity = max(count, len(self.vertices) * 2, 64)
+            self.vertices = np.zeros((capacity, self.verts_per_circle, 6), dtype=np.float32)
+
+        chunks = -(-count // self.max_circles)
+        while len(self.meshes) < chunks:
+            mesh = Mesh(fmt=BATCH_VERTEX_FORMAT, mode='triangles')
+            self.meshes.append(mesh)
+            self.group.add(mesh)
+
+    def draw(self, x, y, radius, rgba):
+        """x, y, radius (n,) ve rgba (n, 4) dizilerinden n daire çiz"""
+        count = len(x)
+        self._reserve(count)
+
+        vertices = self.vertices[:count]
+        vertices[:, 0, 0] = x
+        vertices[:, 0, 1] = y
+        np.multiply(radius[:, None], self.unit_cos, out=vertices[:, 1:, 0])
+        vertices[:, 1:, 0] += np.asarray(x, dtype=np.float32)[:, None]
+        np.multiply(radius[:, None], self.unit_sin, out=vertices[:, 1:, 1])
+        vertices[:, 1:, 1] += np.asarray(y, dtype=np.float32)[:, None]
+        vertices[:, :, 2:] = rgba[:, None, :]
+
+        indices_per_circle = self.segments * 3
+        for chunk, mesh in enumerate(self.meshes):
+            start = chunk * self.max_circles
+            end = min(count, start + self.max_circles)
+            if end <= start:
+                if len(mesh.indices):
+                    mesh.indices = []
+                    mesh.vertices = []
+                continue
+            mesh.vertices = memoryview(self.vertices[start:end].reshape(-1))
+            if len(mesh.indices) != (end - start) * indices_per_circle:
+                mesh.indices = memoryview(self.indices[:(end - start) * indices_per_circle])
+        self.circle_count = count
+
+def count_instructions(instruction):
+    """Bir talimat grubundaki toplam talimat sayısı (iç içe gruplar dahil)"""
+    children = getattr(instruction, 'children', None)
+    if not children:
+        return 1
+    return 1 + sum(count_instructions(child) for child in children)
+
+def lerp(previous, current, blend):
+    """Önceki ve güncel sabit adım arasında doğrusal enterpolasyon (sayı ya da dizi)"""
+    return previous + (current - previous) * blend
+
+def bubble_arrays(bubbles, blend=1.0):
+    """Balon deposundan çizim için x, y, radius, life_time, alpha, color ve type id dizileri"""
+    if hasattr(bubbles, 'type_id'):
+        n = len(bubbles)
+        x = lerp(bubbles.prev_x[:n], bubbles.x[:n], blend)
+        y = lerp(bubbles.prev_y[:n], bubbles.y[:n], blend)
+        return (x, y, bubbles.radius[:n], bubbles.life_time[:n],
+                bubbles.alpha[:n], bubbles.color[:n], bubbles.type_id[:n])
+
+    n = len(bubbles)
+    x = np.fromiter((lerp(bubble.prev_x, bubble.x, blend) for bubble in bubbles), dtype=float, count=n)
+    y = np.fromiter((lerp(bubble.prev_y, bubble.y, blend) for bubble in bubbles), dtype=float, count=n)
+    radius = np.fromiter((bubble.radius for bubble in bubbles), dtype=float, count=n)
+    life_time = np.fromiter((bubble.life_time for bubble in bubbles), dtype=float, count=n)
+    alpha = np.fromiter((bubble.alpha for bubble in bubbles), dtype=float, count=n)
+    color = np.array([bubble.color for bubble in bubbles], dtype=float).reshape(n, 4)
+    type_id = np.fromiter((bubble.kind_id for bubble in bubbles), dtype=np.int8, count=n)
+    return x, y, radius, life_time, alpha, color, type_id
+
+class GameRenderer:
+    """Retained-mode oyun alanı çizici.
+
+    Canvas her karede temizlenmez: her canlı balon, power-up ve parçacık için kalıcı bir
+    InstructionGroup tutulur ve sadece pos/size/rgba güncellenir. Oluşan/patlayan nesnelerin
+    grupları eklenip çıkarılır, oyun alanı dışında kalanlar canvas'tan alınır.
+
+    draw()'a verilen blend, simülasyonun son iki sabit adımı arasındaki oranıdır; balon,
+    power-up ve parçacık konumları buna göre enterpole edilir.
+
+    quality (quality.QualityTier) hangi ayrıntıların çizileceğini belirler: özel balon
+    parıltısı, iç daire ve parlama, parçacık haleleri, power-up halkaları.
+
+    batch_particles / batch_bubbles açıksa (numpy gerekir) o katman tek tek grup yerine
+    CircleBatch ile birkaç Mesh'e yazılır.
+    """
+    def __init__(self, canvas, batch_particles=False, batch_bubbles=False):
+        self.canvas = canvas
+        self.frame = 0
+        self.batch_particles = batch_particles and np is not None
+        self.batch_bubbles = batch_bubbles and np is not None
+        self.quality = QUALITY_TIERS[DEFAULT_TIER]
+
+        # Katmanlar - çizim sırası eski draw_game ile aynı
+        self.background = InstructionGroup()
+        self.background_color = Color(0.05, 0.05, 0.15, 0.3)
+        self.background_rect = Rectangle()
+        self.border_color = Color(0.3, 0.6, 1, 0.8)
+        self.border = Line(width=4)
+        self.outer_border_color = Color(0.6, 0.8, 1, 0.4)
+        self.outer_border = Line(width=2)
+        for instruction in (self.background_color, self.background_rect, self.border_color,
+                            self.border, self.outer_border_color, self.outer_border):
+            self.background.add(instruction)
+
+        self.pause_overlay = InstructionGroup()
+        self.pause_shade = Rectangle(pos=(0, 0))
+        self.pause_panel = Rectangle(size=(220, 70))
+        self.pause_border = Line(width=3)
+        for instruction in (Color(0, 0, 0.2, 0.6), self.pause_shade, Color(0.2, 0.2, 0.5, 0.9),
+                            self.pause_panel, Color(0.5, 0.5, 1, 0.8), self.pause_border):
+            self.pause_overlay.add(instruction)
+        self.paused = False
+
+        self.power_up_layer = InstructionGroup()
+        self.bubble_layer = InstructionGroup()
+        self.particle_layer = InstructionGroup()
+
+        if self.batch_bubbles:
+            self.bubble_batch = CircleBatch(BATCH_BUBBLE_SEGMENTS)
+            self.bubble_layer.add(self.bubble_batch.group)
+            glow_table = [kind.glow_color or (0, 0, 0) for kind in BUBBLE_KINDS]
+            self.glow_table = np.array(glow_table, dtype=float)
+            self.special_table = np.array([kind.glow_color is not None for kind in BUBBLE_KINDS])
+        if self.batch_particles:
+            self.particle_batch = CircleBatch(PARTICLE_SEGMENTS)
+            self.particle_layer.add(self.particle_batch.group)
+
+        for layer in (self.background, self.power_up_layer, self.bubble_layer, self.particle_layer):
+            self.canvas.add(layer)
+
+        # Sprite'lar uid ile eşlenir - varlık nesneleri havuzdan yeniden kullanılıyor
+        self.bubble_sprites = {}
+        self.power_up_sprites = {}
+        self.particle_sprites = []
+        self.shown_particles = set()
+
+        self.play_area = (0, 0, 0, 0)
+
+    def resize(self, width, height, play_area):
+        self.play_area = play_area
+        play_x, play_y, play_width, play_height = play_area
+
+        self.background_rect.pos = (play_x, play_y)
+        self.background_rect.size = (play_width, play_height)
+        self.border.rectangle = (play_x-2, play_y-2, play_width+4, play_height+4)
+        self.outer_border.rectangle = (play_x-6, play_y-6, play_width+12, play_height+12)
+
+        pause_x = width/2 - 100
+        pause_y = height/2 - 25
+        self.pause_shade.size = (width, height)
+        self.pause_panel.pos = (pause_x-10, pause_y-10)
+        self.pause_border.rectangle = (pause_x-10, pause_y-10, 220, 70)
+
+    def reset(self):
+        """Yeni oyun için balon ve power-up sprite'larını bırak - uid'ler yeniden 1'den başlar"""
+        for sprites, layer in ((self.bubble_sprites, self.bubble_layer),
+                               (self.power_up_sprites, self.power_up_layer)):
+            for sprite in sprites.values():
+                if sprite.visible:
+                    layer.remove(sprite.group)
+            sprites.clear()
+
+    def instruction_count(self):
+        return count_instructions(self.canvas)
+
+    def in_play_area(self, x, y, radius):
+        play_x, play_y, play_width, play_height = self.play_area
+        return (x + radius >= play_x and x - radius <= play_x + play_width and
+                y + radius >= play_y and y - radius <= play_y + play_height)
+
+    def _set_visible(self, sprite, layer, visible):
+        if visible != sprite.visible:
+            if visible:
+                layer.add(sprite.group)
+            else:
+                layer.remove(sprite.group)
+            sprite.visible = visible
+
+    def _prune(self, sprites, layer):
+        frame = self.frame
+        for key in [key for key, sprite in sprites.items() if sprite.seen != frame]:
+            sprite = sprites.pop(key)
+            if sprite.visible:
+                layer.remove(sprite.group)
+
+    def draw(self, sim, blend=1.0):
+        self.frame += 1
+        frame = self.frame
+        quality = self.quality
+
+        if sim.game_paused:
+            self.background_color.rgba = (0.05, 0.05, 0.15, 0.8)
+        elif sim.active_powers['slow']['active']:
+            self.background_color.rgba = (0.05, 0.05, 0.25, 0.5)
+        else:
+            self.background_color.rgba = (0.05, 0.05, 0.15, 0.3)
+
+        if sim.game_paused != self.paused:
+            if sim.game_paused:
+                self.background.add(self.pause_overlay)
+            else:
+                self.background.remove(self.pause_overlay)
+            self.paused = sim.game_paused
+
+        for power_up in sim.power_ups:
+            sprite = self.power_up_sprites.get(power_up.uid)
+            if sprite is None:
+                sprite = self.power_up_sprites[power_up.uid] = PowerUpSprite(power_up.kind.color)
+            sprite.seen = frame
+            x = lerp(power_up.prev_x, power_up.x, blend)
+            y = lerp(power_up.prev_y, power_up.y, blend)
+            visible = self.in_play_area(x, y, power_up.radius * 2.5)
+            self._set_visible(sprite, self.power_up_layer, visible)
+            if visible:
+                sprite.update(power_up, x, y, quality.power_up_rings)
+        self._prune(self.power_up_sprites, self.power_up_layer)
+
+        if self.batch_bubbles:
+            self.draw_bubbles_batched(sim.bubbles, alpha_multiplier=0.5 if sim.game_paused else 1.0, blend=blend)
+        else:
+            self.draw_bubbles(sim.bubbles, sim.game_paused, blend)
+
+        if self.batch_particles:
+            self.draw_particles_batched(sim.particles, blend)
+        else:
+            self.draw_particles(sim.particles, blend)
+
+    def draw_bubbles(self, bubbles, paused, blend=1.0):
+        frame = self.frame
+        few_bubbles = len(bubbles) < 10
+        alpha_multiplier = 0.5 if paused else 1.0
+        detail_every = self.quality.detail_every
+        glow = self.quality.glows
+        for i, bubble in enumerate(bubbles):
+            sprite = self.bubble_sprites.get(bubble.uid)
+            if sprite is None:
+                sprite = self.bubble_sprites[bubble.uid] = BubbleSprite(bubble.bubble_type)
+            sprite.seen = frame
+            x = lerp(bubble.prev_x, bubble.x, blend)
+            y = lerp(bubble.prev_y, bubble.y, blend)
+            visible = self.in_play_area(x, y, bubble.radius)
+            self._set_visible(sprite, self.bubble_layer, visible)
+            if visible:
+                detailed = detail_every > 0 and ((i % detail_every == 0) or few_bubbles)
+                sprite.update(bubble, x, y, detailed, alpha_multiplier, glow)
+        self._prune(self.bubble_sprites, self.bubble_layer)
+
+    def visible_mask(self, x, y, radius):
+        play_x, play_y, play_width, play_height = self.play_area
+        return ((x + radius >= play_x) & (x - radius <= play_x + play_width) &
+                (y + radius >= play_y) & (y - radius <= play_y + play_height))
+
+    def draw_bubbles_batched(self, bubbles, alpha_multiplier, blend=1.0):
+        x, y, radius, life_time, alpha, color, type_id = bubble_arrays(bubbles, blend)
+        n = len(x)
+
+        # Balon başına 4 daire: özel parıltı, gövde, iç daire, parlama - eski çizim sırası
+        circle_x = np.empty((n, 4))
+        circle_y = np.empty((n, 4))
+        circle_radius = np.zeros((n, 4))
+        rgba = np.empty((n, 4, 4))
+
+        circle_x[:] = x[:, None]
+        circle_y[:] = y[:, None]
+        circle_x[:, 3] -= radius * 0.3
+        circle_y[:, 3] += radius * 0.2
+
+        quality = self.quality
+        visible = self.visible_mask(x, y, radius)
+        special = visible & self.special_table[type_id]
+        if not quality.glows:
+            special[:] = False
+        if quality.detail_every:
+            detailed = visible & ((np.arange(n) % quality.detail_every == 0) | (n < 10))
+        else:
+            detailed = np.zeros(n, dtype=bool)
+
+        circle_radius[:, 0] = np.where(special, radius * 2.2, 0)
+        circle_radius[:, 1] = np.where(visible, radius, 0)
+        circle_radius[:, 2] = np.where(detailed, radius * 0.8, 0)
+        circle_radius[:, 3] = np.where(detailed, radius * 0.25, 0)
+
+        body_alpha = alpha * color[:, 3] * alpha_multiplier
+        rgba[:, 0, :3] = self.glow_table[type_id]
+        rgba[:, 0, 3] = 0.4 * (0.7 + 0.3 * np.sin(life_time * 5.0))
+        rgba[:, 1, :3] = color[:, :3]
+        rgba[:, 1, 3] = body_alpha
+        rgba[:, 2, :3] = color[:, :3]
+        rgba[:, 2, 3] = body_alpha * 0.6
+        rgba[:, 3, :3] = 1
+        rgba[:, 3, 3] = alpha * 0.7 * alpha_multiplier
+
+        keep = circle_radius.reshape(-1) > 0
+        self.bubble_batch.draw(
+            circle_x.reshape(-1)[keep],
+            circle_y.reshape(-1)[keep],
+            circle_radius.reshape(-1)[keep],
+            rgba.reshape(-1, 4)[keep]
+        )
+
+    def draw_particles_batched(self, particles, blend=1.0):
+        active = particles.active_indices()
+        x = lerp(particles.prev_x[active], particles.x[active], blend)
+        y = lerp(particles.prev_y[active], particles.y[active], blend)
+        radius = particles.radius[active]
+        visible = self.visible_mask(x, y, radius)
+        active = active[visible]
+        n = len(active)
+
+        if not self.quality.particle_halos:
+            rgba = np.empty((n, 4))
+            for channel, values in enumerate((particles.r, particles.g, particles.b, particles.alpha)):
+                rgba[:, channel] = values[active]
+            self.particle_batch.draw(x[visible], y[visible], radius[visible], rgba)
+            return
+
+        # Parçacık başına parıltı + çekirdek, aynı Mesh içinde sırayla
+        circle_x = np.repeat(x[visible], 2)
+        circle_y = np.repeat(y[visible], 2)
+        circle_radius = np.repeat(radius[visible], 2)
+        circle_radius[0::2] *= 1.5
+
+        rgba = np.empty((n * 2, 4))
+        for channel, values in enumerate((particles.r, particles.g, particles.b)):
+            rgba[:, channel] = np.repeat(values[active], 2)
+        alpha = particles.alpha[active]
+        rgba[0::2, 3] = alpha * 0.3
+        rgba[1::2, 3] = alpha
+
+        self.particle_batch.draw(circle_x, circle_y, circle_radius, rgba)
+
+    def draw_particles(self, particles, blend=1.0):
+        sprites = self.particle_sprites
+        while len(sprites) < particles.capacity:
+            sprites.append(ParticleSprite())
+
+        layer = self.particle_layer
+        shown = self.shown_particles
+        halo = self.quality.particle_halos
+        for i in [i for i in shown if not particles.active[i]]:
+            layer.remove(sprites[i].group)
+            sprites[i].visible = False
+            shown.discard(i)
+
+        for i in particles.active_indices():
+            sprite = sprites[i]
+            x = lerp(particles.prev_x[i], particles.x[i], blend)
+            y = lerp(particles.prev_y[i], particles.y[i], blend)
+            radius = particles.radius[i]
+            visible = self.in_play_area(x, y, radius)
+            self._set_visible(sprite, layer, visible)
+            if visible:
+                shown.add(i)
+                sprite.update(x, y, radius, particles.r[i], particles.g[i], particles.b[i], particles.alpha[i], halo)
+            else:
+                shown.discard(i)
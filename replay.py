@@ -0,0 +1,154 @@
+﻿import argparse
+import json
+import struct
+import sys
+import time
+
+from game_simulation import GameSimulation
+
+
+# Dosya başlığı: sihirli sayı, sürüm, adım hızı (Hz), seed, kaydın bittiği tick
+HEADER = struct.Struct('<4sHHII')
+MAGIC = b'BPRP'
+VERSION = 1
+
+# Kayıt: tick, tür, x, y - 13 bayt
+RECORD = struct.Struct('<IBff')
+TOUCH = 0
+RESIZE = 1
+
+
+def quantize(x, y):
+    """Koordinatları dosyada saklandıkları float32 hassasiyetine yuvarla"""
+    return struct.unpack('<ff', struct.pack('<ff', x, y))
+
+class ReplayRecorder:
+    """Oyunun seed'ini ve her tick'te işlenen dokunuşları ikili dosyaya yazar.
+
+    Dokunuşlar simülasyona verilmeden önce float32'ye yuvarlanır; böylece canlı oyun ile
+    kaydın tekrar oynatılması bit bit aynı koordinatları görür.
+    """
+    def __init__(self, path, seed, rate):
+        if not 0 <= seed < 1 << 32:
+            raise ValueError("replay kaydı için seed 32 bit işaretsiz tamsayı olmalı")
+        self.path = path
+        self.seed = seed
+        self.rate = rate
+        self.records = 0
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, rate, seed, 0))
+
+    def record_touches(self, tick, touches):
+        """Dokunuşları kaydet ve yuvarlanmış hallerini döndür"""
+        quantized = []
+        for x, y in touches:
+            x, y = quantize(x, y)
+            self.file.write(RECORD.pack(tick, TOUCH, x, y))
+            quantized.append((x, y))
+        self.records += len(quantized)
+        return quantized
+
+    def record_resize(self, tick, width, height):
+        width, height = quantize(width, height)
+        self.file.write(RECORD.pack(tick, RESIZE, width, height))
+        self.records += 1
+        return width, height
+
+    def close(self, end_tick):
+        if self.file is None:
+            return
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.rate, self.seed, end_tick))
+        self.file.close()
+        self.file = None
+
+class ReplayPlayer:
+    """Kayıt dosyasını okur ve olayları kaydedildikleri tick'lerde simülasyona geri verir"""
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path}: replay dosyası değil")
+        magic, version, self.rate, self.seed, end_tick = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: desteklenmeyen replay dosyası")
+
+        count = (len(data) - HEADER.size) // RECORD.size
+        self.events = [RECORD.unpack_from(data, HEADER.size + i * RECORD.size) for i in range(count)]
+        # Oyun bitmeden kapanan kayıtlarda bitiş tick'i yazılmamış olur
+        if end_tick == 0 and self.events:
+            end_tick = self.events[-1][0] + 1
+        self.end_tick = end_tick
+        self.position = 0
+
+    def create_simulation(self, bubble_store=None):
+        return GameSimulation(bubble_store=bubble_store, seed=self.seed)
+
+    def apply(self, simulation):
+        """Bu tick'in boyut olaylarını uygula, dokunuşlarını döndür"""
+        tick = simulation.tick
+        events = self.events
+        touches = []
+        while self.position < len(events) and events[self.position][0] <= tick:
+            _, kind, x, y = events[self.position]
+            if kind == RESIZE:
+                simulation.resize(x, y)
+            else:
+                touches.append((x, y))
+            self.position += 1
+        return touches
+
+    def finished(self, simulation):
+        return simulation.tick >= self.end_tick or not simulation.game_running
+
+def play(path, bubble_store=None):
+    """Kaydı pencere olmadan oynat; son durumu ve adım sürelerini döndür"""
+    player = ReplayPlayer(path)
+    simulation = player.create_simulation(bubble_store)
+    step_dt = 1.0 / player.rate
+
+    step_times = []
+    clock = time.perf_counter
+    while not player.finished(simulation):
+        touches = player.apply(simulation)
+        start = clock()
+        simulation.step(step_dt, touches)
+        step_times.append(clock() - start)
+
+    worst = max(range(len(step_times)), key=step_times.__getitem__) if step_times else 0
+    return {
+        'seed': player.seed,
+        'rate': player.rate,
+        'ticks': simulation.tick,
+        'events': len(player.events),
+        'score': simulation.score,
+        'health': simulation.health,
+        'game_time': simulation.game_time,
+        'bubbles_popped': simulation.bubbles_popped,
+        'bubbles_missed': simulation.bubbles_missed,
+        'mean_step_ms': sum(step_times) / len(step_times) * 1000 if step_times else 0.0,
+        'worst_step_ms': step_times[worst] * 1000 if step_times else 0.0,
+        'worst_step_tick': worst,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bubble Pop replay kaydını pencere olmadan oynat")
+    parser.add_argument('path', help="--record ile kaydedilmiş .bpr dosyası")
+    parser.add_argument('--array-store', action='store_true', help="balonları NumPy dizi deposunda tut")
+    args = parser.parse_args(argv)
+
+    bubble_store = None
+    if args.array_store:
+        from bubble_store import ArrayBubbleStore
+        bubble_store = ArrayBubbleStore()
+
+    try:
+        result = play(args.path, bubble_store)
+    except (OSError, ValueError) as e:
+        print(f"❌ Replay oynatılamadı: {e}")
+        return 1
+    print(json.dumps(result, indent=2))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,258 @@
+﻿import argparse
+import heapq
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import namedtuple
+
+
+# Dosya başlığı: sihirli sayı, sürüm, oluşturulma zamanı (dizinin doğru günlüğe ait olduğunu doğrular)
+HEADER = struct.Struct('<4sHd')
+MAGIC = b'BPSC'
+VERSION = 1
+
+# Kayıt: zaman, skor, süre (s), patlayan, kaçan, isabet (%), önceki alanların CRC32'si - 36 bayt
+RECORD = struct.Struct('<dqiiifI')
+RECORD_BODY = struct.Struct('<dqiiif')
+
+LOG_NAME = 'scores.log'
+INDEX_NAME = 'scores.json'
+
+GameResult = namedtuple('GameResult', 'timestamp score game_time bubbles_popped bubbles_missed accuracy')
+
+
+def pack_result(result):
+    body = RECORD_BODY.pack(*result)
+    return body + struct.pack('<I', zlib.crc32(body))
+
+def read_header(f):
+    data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        return None
+    magic, version, created = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{getattr(f, 'name', 'günlük')}: desteklenmeyen skor günlüğü")
+    return created
+
+def iter_records(f, start=0, chunk_records=4096):
+    """f'teki start'ıncı kayıttan itibaren (sıra, GameResult ya da bozuksa None) üret.
+
+    Dosya parça parça okunur, bellek kullanımı günlüğün boyutundan bağımsızdır. Sondaki
+    yarım kayıt (yazılırken kesilmiş) döndürülmez.
+    """
+    f.seek(HEADER.size + start * RECORD.size)
+    index = start
+    while True:
+        data = f.read(RECORD.size * chunk_records)
+        for offset in range(0, len(data) - RECORD.size + 1, RECORD.size):
+            *fields, crc = RECORD.unpack_from(data, offset)
+            body = data[offset:offset + RECORD_BODY.size]
+            yield index, GameResult(*fields) if zlib.crc32(body) == crc else None
+            index += 1
+        if len(data) < RECORD.size * chunk_records:
+            return
+
+def iter_results(path):
+    """Günlükteki sağlam kayıtları sırayla üret (analiz araçları için)"""
+    with open(path, 'rb') as f:
+        if read_header(f) is None:
+            return
+        for _, result in iter_records(f):
+            if result is not None:
+                yield result
+
+class ScoreStore:
+    """Kalıcı, çökmeye dayanıklı skor deposu.
+
+    Her biten oyun scores.log'a sabit boyutlu, CRC'li bir kayıt olarak eklenir ve hemen
+    işletim sistemine yazılır (uygulama çökse de kaybolmaz); fsync her sync_every oyunda
+    bir yapılır. Özet değerler ve ilk top_n skor scores.json dizininde tutulur ve index_every
+    oyunda bir atomik olarak yeniden yazılır. Açılışta sadece dizin ve dizinden sonra eklenmiş
+    kayıtlar okunur; dizin yoksa, günlükle uyuşmuyorsa ya da top_n'den az lider tutuyorsa
+    günlük baştan taranır. Dizindeki lider sayısı hiçbir zaman azaltılmaz.
+    read_only=True ise günlük ve dizin sadece okunur (record() kullanılamaz).
+    """
+    def __init__(self, directory, top_n=10, sync_every=8, index_every=64, read_only=False):
+        self.directory = directory
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.index_path = os.path.join(directory, INDEX_NAME)
+        self.top_n = top_n
+        # Heap'te ve dizinde tutulan lider sayısı - daha büyük top_n ile yazılmış dizin küçültülmez
+        self.keep = top_n
+        self.read_only = read_only
+        self.sync_every = sync_every
+        self.index_every = index_every
+
+        self.games = 0
+        self.high_score = 0
+        self.last_score = 0
+        self.best_time = 0
+        self.best_accuracy = 0
+        # En düşük skor kökte olan min-heap: (skor, -sıra, sonuç); eşitlikte eski oyun önde
+        self.leaders = []
+        self.corrupt = 0
+        self.pending_sync = 0
+        self.indexed = 0
+
+        if not read_only:
+            os.makedirs(directory, exist_ok=True)
+        self.file = self._open_log()
+
+    def _open_log(self):
+        f = open(self.log_path, 'rb' if self.read_only else 'a+b')
+        f.seek(0)
+        created = read_header(f)
+        if created is None and self.read_only:
+            raise ValueError(f"{self.log_path}: boş skor günlüğü")
+        if created is None:
+            # Yeni (ya da başlığı bile yazılamamış) günlük
+            f.truncate(0)
+            created = time.time()
+            f.write(HEADER.pack(MAGIC, VERSION, created))
+            f.flush()
+            os.fsync(f.fileno())
+        self.created = created
+
+        # Sondaki yarım kaydı at - sonraki eklemeler kayıt sınırından başlasın
+        size = os.fstat(f.fileno()).st_size
+        records = (size - HEADER.size) // RECORD.size
+        if HEADER.size + records * RECORD.size != size and not self.read_only:
+            f.truncate(HEADER.size + records * RECORD.size)
+
+        start = self._load_index(records)
+        for index, result in iter_records(f, start):
+            self._apply(index, result)
+        if self.games > self.indexed and not self.read_only:
+            self._write_index()
+        f.seek(0, os.SEEK_END)
+        return f
+
+    def _load_index(self, records):
+        """Dizini yükle; okunması gereken ilk kaydın sırasını döndür"""
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+            if (index['created'] != self.created or index['games'] + index['corrupt'] > records
+                    or index['top_n'] < self.top_n):
+                return 0
+            self.keep = index['top_n']
+            self.games = self.indexed = index['games']
+            self.high_score = index['high_score']
+            self.last_score = index['last_score']
+            self.best_time = index['best_time']
+            self.best_accuracy = index['best_accuracy']
+            self.corrupt = index['corrupt']
+            self.leaders = [(result[1], -order, GameResult(*result)) for order, result in index['leaders']]
+            heapq.heapify(self.leaders)
+            while len(self.leaders) > self.keep:
+                heapq.heappop(self.leaders)
+            return self.games + self.corrupt
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+    def _write_index(self):
+        index = {
+            'created': self.created,
+            'top_n': self.keep,
+            'games': self.games,
+            'corrupt': self.corrupt,
+            'high_score': self.high_score,
+            'last_score': self.last_score,
+            'best_time': self.best_time,
+            'best_accuracy': self.best_accuracy,
+            'leaders': [(-negative_order, list(result)) for _, negative_order, result in self.leaders],
+        }
+        with open(self.index_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(self.index_path + '.tmp', self.index_path)
+        self.indexed = self.games
+
+    def _apply(self, order, result):
+        if result is None:
+            self.corrupt += 1
+            return
+        self.games += 1
+        self.last_score = result.score
+        self.high_score = max(self.high_score, result.score)
+        self.best_time = max(self.best_time, result.game_time)
+        self.best_accuracy = max(self.best_accuracy, result.accuracy)
+
+        # O(log top_n) ekleme
+        entry = (result.score, -order, result)
+        if len(self.leaders) < self.keep:
+            heapq.heappush(self.leaders, entry)
+        elif entry > self.leaders[0]:
+            heapq.heapreplace(self.leaders, entry)
+
+    def record(self, score, game_time, bubbles_popped, bubbles_missed, accuracy, timestamp=None):
+        """Biten oyunu günlüğe ekle ve özetleri güncelle; GameResult döndürür"""
+        if self.read_only:
+            raise ValueError("skor deposu salt okunur açıldı")
+        result = GameResult(time.time() if timestamp is None else timestamp, int(score), int(game_time),
+                            int(bubbles_popped), int(bubbles_missed), float(accuracy))
+        self.file.write(pack_result(result))
+        self.file.flush()
+        self._apply(self.games + self.corrupt, result)
+
+        self.pending_sync += 1
+        if self.pending_sync >= self.sync_every:
+            self.sync()
+        if self.games - self.indexed >= self.index_every:
+            self._write_index()
+        return result
+
+    def sync(self):
+        if self.pending_sync:
+            os.fsync(self.file.fileno())
+            self.pending_sync = 0
+
+    def top(self, n=None):
+        """En yüksek skorlu oyunlar (en fazla top_n), büyükten küçüğe"""
+        ranked = [result for _, _, result in sorted(self.leaders, reverse=True)]
+        return ranked[:self.top_n if n is None else min(n, self.top_n)]
+
+    def close(self):
+        if self.file is None:
+            return
+        if not self.read_only:
+            self.sync()
+            if self.games != self.indexed:
+                self._write_index()
+        self.file.close()
+        self.file = None
+
+    def stats(self):
+        return {
+            'games': self.games,
+            'high_score': self.high_score,
+            'last_score': self.last_score,
+            'best_time': self.best_time,
+            'best_accuracy': self.best_accuracy,
+            'corrupt_records': self.corrupt,
+        }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bubble Pop skor deposunun özetini ve liderlik tablosunu yazdır")
+    parser.add_argument('directory', help="scores.log ve scores.json dosyalarının bulunduğu klasör")
+    parser.add_argument('--top', type=int, default=10, help="gösterilecek en yüksek skor sayısı")
+    args = parser.parse_args(argv)
+
+    # Salt okunur - oyunun dizinini bu komutun --top değeriyle yeniden yazmasın
+    try:
+        store = ScoreStore(args.directory, top_n=args.top, read_only=True)
+    except (OSError, ValueError) as e:
+        print(f"❌ Skor deposu açılamadı: {e}")
+        return 1
+    try:
+        summary = store.stats()
+        summary['leaders'] = [result._asdict() for result in store.top()]
+        print(json.dumps(summary, indent=2))
+    finally:
+        store.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+﻿import math
+
+
+class UniformGrid:
+    """Balon merkezleri için düzgün ızgara (spatial hash).
+
+    Her hücre bir sözlükte tutulur; ekleme, taşıma ve silme O(1), nokta ve yarıçap
+    sorguları sadece ilgili hücrelere bakar. Balonlar hareket ettikçe sync() ile sadece
+    hücre değiştirenler taşınır.
+    """
+    def __init__(self, cell_size=80):
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self.item_cells = {}
+
+    def __len__(self):
+        return len(self.item_cells)
+
+    def __contains__(self, item):
+        return item in self.item_cells
+
+    def cell_of(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def clear(self):
+        self.cells.clear()
+        self.item_cells.clear()
+
+    def _place(self, item, key):
+        old_key = self.item_cells.get(item)
+        if old_key == key:
+            return
+        if old_key is not None:
+            cell = self.cells[old_key]
+            del cell[item]
+            if not cell:
+                del self.cells[old_key]
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = {}
+        cell[item] = None
+        self.item_cells[item] = key
+
+    def insert(self, item, x, y):
+        self._place(item, self.cell_of(x, y))
+
+    move = insert
+
+    def remove(self, item):
+        key = self.item_cells.pop(item, None)
+        if key is None:
+            return
+        cell = self.cells[key]
+        del cell[item]
+        if not cell:
+            del self.cells[key]
+
+    def sync(self, items):
+        """Hareket eden öğeleri yeni hücrelerine taşı"""
+        if hasattr(items, 'cell_changes'):
+            for item, key in items.cell_changes(self.cell_size):
+                self._place(item, key)
+            return
+        cell_size = self.cell_size
+        item_cells = self.item_cells
+        floor = math.floor
+        for item in items:
+            key = (floor(item.x / cell_size), floor(item.y / cell_size))
+            if item_cells.get(item) != key:
+                self._place(item, key)
+
+    def query(self, x, y, reach):
+        """Merkezi (x, y) noktasına en fazla reach uzaklıktaki hücrelerdeki aday öğeler"""
+        cell_size = self.cell_size
+        min_cx = math.floor((x - reach) / cell_size)
+        max_cx = math.floor((x + reach) / cell_size)
+        min_cy = math.floor((y - reach) / cell_size)
+        max_cy = math.floor((y + reach) / cell_size)
+
+        cells = self.cells
+        candidates = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    candidates.extend(cell)
+        return candidates
+
+    def query_radius(self, x, y, radius):
+        """Merkezi (x, y)'ye radius mesafesi içinde olan öğeler"""
+        return [item for item in self.query(x, y, radius)
+                if math.sqrt((item.x - x)**2 + (item.y - y)**2) <= radius]
@@ -0,0 +1,174 @@
+﻿import os
+import struct
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+
+# Dosya başlığı: sihirli sayı, sürüm, olay kaydı boyutu, dosyanın açıldığı zaman
+HEADER = struct.Struct('<4sHHd')
+MAGIC = b'BPTL'
+VERSION = 1
+
+# Olay: oyun zamanı, tür, alt tür, sayı, x, y, boyut, değer - 28 bayt
+RECORD = struct.Struct('<fBBxxIffff')
+# Paket başlığı: yazıldığı zaman, olay sayısı, o ana kadar atılan olay, sıkıştırılmış uzunluk, CRC32
+BATCH = struct.Struct('<dIIII')
+
+# Olay türleri ve alanları:
+#   GAME_START                                  -
+#   POP           alt tür=balon türü, sayı=kombo, boyut=yarıçap, değer=puan
+#   TOUCH         alt tür=Multi Pop açık mı, sayı=patlayan balon, değer=kazanılan puan
+#   MISS          değer=can kaybı
+#   BOUNDARY_HIT  alt tür=balon türü, boyut=yarıçap, değer=can kaybı
+#   POWER_UP      alt tür=power-up türü, değer=süre
+#   GAME_OVER     sayı=patlayan balon, boyut=kaçan balon, değer=skor
+GAME_START, POP, TOUCH, MISS, BOUNDARY_HIT, POWER_UP, GAME_OVER = range(7)
+EVENT_NAMES = ('game_start', 'pop', 'touch', 'miss', 'boundary_hit', 'power_up', 'game_over')
+
+Event = namedtuple('Event', 'wall_time game_time kind type_id count x y size value')
+
+
+class NullTelemetry:
+    """Telemetri kapalıyken kullanılan, hiçbir şey yapmayan kaydedici"""
+    enabled = False
+
+    def record(self, kind, game_time, type_id=0, count=0, x=0.0, y=0.0, size=0.0, value=0.0):
+        pass
+
+NULL_TELEMETRY = NullTelemetry()
+
+class TelemetryWriter:
+    """Oyun olaylarını önceden ayrılmış bir halka tampona yazar, diske arka planda aktarır.
+
+    record() sadece tampondaki bir sonraki slota struct.pack_into ile yazar; dosya işlemi,
+    kilit ya da bellek ayırma yapmaz. Tampon doluysa olay atılır ve dropped artar, oyun
+    hiç beklemez. Yazıcı iş parçacığı flush_interval'da bir (ya da tampon yarı dolunca)
+    biriken olayları zlib ile sıkıştırıp CRC'li tek paket olarak dosyaya ekler.
+    Tek üretici (oyun döngüsü) ve tek tüketici (yazıcı) varsayılır.
+    """
+    enabled = True
+
+    def __init__(self, path, capacity=8192, flush_interval=1.0, compress_level=1):
+        self.path = path
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.compress_level = compress_level
+        self.buffer = bytearray(capacity * RECORD.size)
+        # head: yazılan olay sayısı (oyun döngüsü), tail: diske aktarılan olay sayısı (yazıcı)
+        self.head = 0
+        self.tail = 0
+        self.wake_at = capacity // 2
+
+        self.dropped = 0
+        self.batches = 0
+        self.bytes_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, time.time()))
+        self.file.flush()
+
+        self.closing = False
+        self.wakeup = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='telemetry', daemon=True)
+        self.thread.start()
+
+    def record(self, kind, game_time, type_id=0, count=0, x=0.0, y=0.0, size=0.0, value=0.0):
+        head = self.head
+        pending = head - self.tail
+        if pending >= self.capacity:
+            self.dropped += 1
+            return
+        RECORD.pack_into(self.buffer, (head % self.capacity) * RECORD.size,
+                         game_time, kind, type_id, count, x, y, size, value)
+        self.head = head + 1
+        if pending == self.wake_at:
+            self.wakeup.set()
+
+    def _run(self):
+        while not self.closing:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"❌ Telemetri yazılamadı: {e}")
+                return
+
+    def flush(self):
+        """Tampondaki olayları tek paket olarak yaz - sadece yazıcı iş parçacığından (ya da kapanırken)"""
+        head = self.head
+        tail = self.tail
+        count = head - tail
+        if not count:
+            return 0
+
+        size = RECORD.size
+        start = tail % self.capacity
+        first = min(count, self.capacity - start)
+        data = self.buffer[start * size:(start + first) * size]
+        if first < count:
+            data += self.buffer[:(count - first) * size]
+        # Kopyalandı - slotlar yeniden yazılabilir
+        self.tail = head
+
+        payload = zlib.compress(data, self.compress_level)
+        self.file.write(BATCH.pack(time.time(), count, self.dropped, len(payload), zlib.crc32(payload)))
+        self.file.write(payload)
+        self.file.flush()
+        self.batches += 1
+        self.bytes_written += BATCH.size + len(payload)
+        return count
+
+    def close(self):
+        if self.file is None:
+            return
+        self.closing = True
+        self.wakeup.set()
+        self.thread.join()
+        self.flush()
+        self.file.close()
+        self.file = None
+
+    def stats(self):
+        return {
+            'recorded': self.head,
+            'pending': self.head - self.tail,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'bytes_written': self.bytes_written,
+        }
+
+def iter_batches(path):
+    """Dosyadaki paketleri (yazılma zamanı, atılan olay sayısı, ham olay baytları) olarak üret.
+
+    Yarım kalmış son paket (yazılırken kesilmiş) ve CRC'si tutmayan paketler atlanır.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return
+        magic, version, record_size, _ = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"{path}: desteklenmeyen telemetri dosyası")
+        while True:
+            batch = f.read(BATCH.size)
+            if len(batch) < BATCH.size:
+                return
+            wall_time, count, dropped, length, crc = BATCH.unpack(batch)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            if zlib.crc32(payload) != crc:
+                continue
+            yield wall_time, dropped, zlib.decompress(payload)
+
+def iter_events(path):
+    """Dosyadaki olayları sırayla Event olarak üret"""
+    for wall_time, _, data in iter_batches(path):
+        for fields in RECORD.iter_unpack(data):
+            yield Event(wall_time, *fields)
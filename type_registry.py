@@ -0,0 +1,114 @@
+﻿import json
+import os
+from collections import namedtuple
+
+
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'game_types.json')
+
+# Türler bir kez yüklenir ve değişmez; varlıklar sadece küçük bir tamsayı id taşır
+BubbleKind = namedtuple('BubbleKind', (
+    'id', 'key', 'description', 'points_multiplier', 'special_effect', 'effect_value',
+    'spawn_chance', 'color', 'glow_color', 'pop_particles', 'particle_colors'
+))
+PowerUpKind = namedtuple('PowerUpKind', ('id', 'key', 'name', 'color', 'effect_duration'))
+# radius_scale sıfır değilse yarıçapın üst sınırı kaynak balonun yarıçapı * radius_scale olur;
+# radial değilse hız bileşenleri ayrı ayrı [-speed[1], speed[1]] aralığından seçilir
+ParticleRecipe = namedtuple('ParticleRecipe', (
+    'key', 'radius', 'radius_scale', 'lifetime', 'speed', 'radial', 'jitter', 'colors'
+))
+Scoring = namedtuple('Scoring', (
+    'base_points', 'size_bonus', 'reference_radius', 'double_points_multiplier',
+    'miss_penalty', 'escape_damage'
+))
+# Zorluk eğrisi (süreler saniye cinsinden):
+#   hız çarpanı      1 + (t / speed_ramp) * (1 + t / speed_curve)
+#   doğma aralığı    max(min_spawn_interval, spawn_interval - f * (1 + f * spawn_curve)), f = t / spawn_ramp
+#   yarıçap aralığı  max(*_floor, *_radius - t / radius_ramp * *_shrink)
+#   kalabalık        crowd_limit'ten fazla balon varken saniyede crowd_damage can kaybı
+Difficulty = namedtuple('Difficulty', (
+    'speed_ramp', 'speed_curve', 'spawn_interval', 'spawn_ramp', 'spawn_curve', 'min_spawn_interval',
+    'radius_ramp', 'min_radius', 'min_radius_shrink', 'min_radius_floor',
+    'max_radius', 'max_radius_shrink', 'max_radius_floor', 'crowd_limit', 'crowd_damage'
+))
+
+def _color(value):
+    return tuple(value) if value is not None else None
+
+def _colors(values):
+    return tuple(tuple(color) for color in values)
+
+class TypeRegistry:
+    """game_types.json'daki balon/power-up türleri, palet, parçacık tarifleri, puanlama ve zorluk.
+
+    Balon türü 0 her zaman 'normal'dır. Özel balon seçimi için doğma olasılıkları
+    birikimli eşiklere çevrilir; pick_special tek bir rastgele sayıyla türü bulur.
+    """
+    def __init__(self, data):
+        self.bubble_kinds = tuple(
+            BubbleKind(id=index, key=entry['key'], description=entry['description'],
+                       points_multiplier=entry['points_multiplier'],
+                       special_effect=entry['special_effect'], effect_value=entry['effect_value'],
+                       spawn_chance=entry['spawn_chance'], color=_color(entry['color']),
+                       glow_color=_color(entry['glow_color']), pop_particles=entry['pop_particles'],
+                       particle_colors=_colors(entry['particle_colors']))
+            for index, entry in enumerate(data['bubble_kinds'])
+        )
+        if not self.bubble_kinds or self.bubble_kinds[0].key != 'normal':
+            raise ValueError("ilk balon türü 'normal' olmalı")
+        self.bubble_kind_ids = {kind.key: kind.id for kind in self.bubble_kinds}
+
+        thresholds = []
+        total = 0.0
+        for kind in self.bubble_kinds[1:]:
+            if kind.spawn_chance > 0:
+                total += kind.spawn_chance
+                thresholds.append((total, kind))
+        if total > 1.0:
+            raise ValueError("özel balon olasılıklarının toplamı 1'i geçiyor")
+        self.special_thresholds = tuple(thresholds)
+
+        self.power_ups = tuple(
+            PowerUpKind(id=index, key=entry['key'], name=entry['name'],
+                        color=_color(entry['color']), effect_duration=entry['effect_duration'])
+            for index, entry in enumerate(data['power_ups'])
+        )
+        self.power_up_ids = {kind.key: kind.id for kind in self.power_ups}
+
+        self.palette = _colors(data['bubble_palette'])
+        self.particles = {
+            key: ParticleRecipe(key=key, radius=tuple(entry['radius']), radius_scale=entry['radius_scale'],
+                                lifetime=tuple(entry['lifetime']), speed=tuple(entry['speed']),
+                                radial=entry['radial'], jitter=entry['jitter'],
+                                colors=_colors(entry['colors']))
+            for key, entry in data['particle_recipes'].items()
+        }
+        self.scoring = Scoring(**data['scoring'])
+        self.difficulty = Difficulty(**data['difficulty'])
+
+    @classmethod
+    def load(cls, path=REGISTRY_PATH):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def bubble_kind(self, key):
+        return self.bubble_kinds[self.bubble_kind_ids[key]]
+
+    def power_up(self, key):
+        return self.power_ups[self.power_up_ids[key]]
+
+    def pick_special(self, chance):
+        """[0, 1) aralığındaki chance'a düşen özel balon türü; normal balon için None"""
+        for threshold, kind in self.special_thresholds:
+            if chance < threshold:
+                return kind
+        return None
+
+REGISTRY = TypeRegistry.load()
+
+BUBBLE_KINDS = REGISTRY.bubble_kinds
+BUBBLE_KIND_IDS = REGISTRY.bubble_kind_ids
+POWER_UP_KINDS = REGISTRY.power_ups
+POWER_UP_IDS = REGISTRY.power_up_ids
+PARTICLE_RECIPES = REGISTRY.particles
+SCORING = REGISTRY.scoring
+DIFFICULTY = REGISTRY.difficulty
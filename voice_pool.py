@@ -0,0 +1,83 @@
+﻿class VoicePool:
+    """Aynı sesin önceden yüklenmiş N kopyası üzerinde çok sesli çalma.
+
+    trigger() sadece bekleyen patlama sayısını artırır; flush() kare başına bir kez çağrılır
+    ve o karedeki tüm patlamaları (örn. Multi Pop) sayıya göre daha yüksek tek bir çalmaya
+    çevirir. Sesler sırayla kullanılır, boşta ses yoksa en eski çalan ses kesilip yeniden
+    kullanılır. Ses arka ucu iş parçacığı güvenli değildir, çalma hep çağıran (ana) iş
+    parçacığında yapılır; schedule verilirse (örn. Clock.schedule_once) karenin geri kalanından
+    sonraya ertelenir.
+    """
+    def __init__(self, sounds, volume=0.8, volume_step=0.1, max_volume=1.0, schedule=None):
+        self.voices = list(sounds)
+        self.volume = volume
+        self.volume_step = volume_step
+        self.max_volume = max_volume
+
+        # Her sesin son başlatılma sırası - çalınacak en eski sesi bulmak için
+        self.started = [0] * len(self.voices)
+        self.serial = 0
+        self.next_voice = 0
+        self.pending = 0
+
+        self.triggers = 0
+        self.coalesced = 0
+        self.stolen = 0
+
+        self.schedule = schedule
+
+    def __len__(self):
+        return len(self.voices)
+
+    def trigger(self, count=1):
+        self.pending += count
+
+    def flush(self):
+        """Bekleyen patlamaları tek çalmada birleştir; kullanılan sesin sırasını döndürür"""
+        count = self.pending
+        self.pending = 0
+        if not count or not self.voices:
+            return None
+
+        self.triggers += 1
+        self.coalesced += count - 1
+        index = self._pick_voice()
+        volume = min(self.max_volume, self.volume + self.volume_step * (count - 1))
+        if self.schedule is not None:
+            self.schedule(lambda dt: self._play(index, volume))
+        else:
+            self._play(index, volume)
+        return index
+
+    def _pick_voice(self):
+        voices = self.voices
+        count = len(voices)
+        for offset in range(count):
+            index = (self.next_voice + offset) % count
+            if voices[index].state != 'play':
+                break
+        else:
+            index = min(range(count), key=self.started.__getitem__)
+            self.stolen += 1
+        self.serial += 1
+        self.started[index] = self.serial
+        self.next_voice = (index + 1) % count
+        return index
+
+    def _play(self, index, volume):
+        voice = self.voices[index]
+        try:
+            if voice.state == 'play':
+                voice.stop()
+            voice.volume = volume
+            voice.play()
+        except Exception as e:
+            print(f"Ses çalma hatası: {e}")
+
+    def stats(self):
+        return {
+            'voices': len(self.voices),
+            'triggers': self.triggers,
+            'coalesced': self.coalesced,
+            'stolen': self.stolen,
+        }